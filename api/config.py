@@ -1,23 +1,107 @@
 import logging
 import os
-
-import dotenv
-import instructor
-import openai
+import tempfile
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
-IS_ENV_EXISTS = os.path.exists(".env")
-if IS_ENV_EXISTS:
-    logger.info("Loading environment variables from .env file")
-    dotenv.load_dotenv(".env")
+# `.env` is a local development convenience (python-dotenv is a dev dependency); serverless deployments get
+# their environment from the platform and skip the lookup unless `LOAD_DOTENV=true`.
+_SERVERLESS = bool(os.environ.get("VERCEL")) or os.environ.get("DEPLOYMENT_MODE") == "serverless"
+LOAD_DOTENV = os.environ.get("LOAD_DOTENV", str(not _SERVERLESS)).lower() in ("1", "true", "yes")
+if LOAD_DOTENV and os.path.exists(".env"):
+    try:
+        import dotenv
+    except ImportError:
+        logger.warning("Ignoring .env file: python-dotenv is not installed (install the `dev` extra)")
+    else:
+        logger.info("Loading environment variables from .env file")
+        dotenv.load_dotenv(".env")
 
 DATABASE_URL = os.environ["DATABASE_URL"]
+# "serverless" (Vercel) opens a connection per request through an external pooler; "server" keeps its own pool.
+DEPLOYMENT_MODE = os.environ.get("DEPLOYMENT_MODE", "serverless" if os.environ.get("VERCEL") else "server")
+DB_POOLER = os.environ.get("DB_POOLER", "")
+DB_STATEMENT_CACHE_SIZE = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", "0" if DB_POOLER == "pgbouncer" else "100"))
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT_SECONDS = float(os.environ.get("DB_POOL_TIMEOUT_SECONDS", "10"))
+DB_POOL_RECYCLE_SECONDS = int(os.environ.get("DB_POOL_RECYCLE_SECONDS", "1800"))
 OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
 OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL", "https://api.openai.com/v1")
-OPENAI_BASE_CLIENT = openai.AsyncOpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL)
-OPENAI_CLIENT = instructor.from_openai(OPENAI_BASE_CLIENT)
 MODEL_LISTS = [
     "openai/gpt-oss-120b",
     "openai/gpt-oss-20b",
 ]
+
+RESPONSE_CACHE_BACKEND = os.environ.get("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+RESPONSE_CACHE_TTL_SECONDS = float(os.environ.get("RESPONSE_CACHE_TTL_SECONDS", "3600"))
+RESPONSE_CACHE_SQLITE_PATH = os.environ.get("RESPONSE_CACHE_SQLITE_PATH", ".cache/llm-responses.sqlite3")
+
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", "16"))
+LLM_MAX_QUEUE = int(os.environ.get("LLM_MAX_QUEUE", "64"))
+LLM_MAX_QUEUE_SECONDS = float(os.environ.get("LLM_MAX_QUEUE_SECONDS", "10"))
+# Hedge delay of a model until enough latencies are recorded: about the p95 of a structured reading.
+LLM_HEDGE_DELAY_SECONDS = float(os.environ.get("LLM_HEDGE_DELAY_SECONDS", "8"))
+
+# Every model's admission slots can be busy at once (hedged attempts overlap), so size the pool for all of them.
+LLM_HTTP_MAX_CONNECTIONS = int(os.environ.get("LLM_HTTP_MAX_CONNECTIONS", str(LLM_MAX_CONCURRENCY * len(MODEL_LISTS))))
+LLM_HTTP_MAX_KEEPALIVE = int(os.environ.get("LLM_HTTP_MAX_KEEPALIVE", str(LLM_HTTP_MAX_CONNECTIONS)))
+LLM_HTTP_KEEPALIVE_SECONDS = float(os.environ.get("LLM_HTTP_KEEPALIVE_SECONDS", "30"))
+LLM_HTTP2 = os.environ.get("LLM_HTTP2", "auto")
+LLM_CONNECT_TIMEOUT_SECONDS = float(os.environ.get("LLM_CONNECT_TIMEOUT_SECONDS", "5"))
+LLM_READ_TIMEOUT_SECONDS = float(os.environ.get("LLM_READ_TIMEOUT_SECONDS", "90"))
+LLM_WRITE_TIMEOUT_SECONDS = float(os.environ.get("LLM_WRITE_TIMEOUT_SECONDS", "10"))
+LLM_POOL_TIMEOUT_SECONDS = float(os.environ.get("LLM_POOL_TIMEOUT_SECONDS", str(LLM_MAX_QUEUE_SECONDS)))
+LLM_SDK_MAX_RETRIES = int(os.environ.get("LLM_SDK_MAX_RETRIES", "0"))
+LLM_RETRY_BUDGET_RATIO = float(os.environ.get("LLM_RETRY_BUDGET_RATIO", "0.1"))
+LLM_RETRY_BUDGET_MIN_PER_SECOND = float(os.environ.get("LLM_RETRY_BUDGET_MIN_PER_SECOND", "1"))
+
+# Time to answer a request before the platform kills it (Vercel's max function duration); 0 disables the
+# deadline. Clients can shorten it with an `X-Request-Timeout` header.
+REQUEST_DEADLINE_SECONDS = float(
+    os.environ.get("REQUEST_DEADLINE_SECONDS", "60" if DEPLOYMENT_MODE == "serverless" else "0")
+)
+REQUEST_DEADLINE_RESERVE_SECONDS = float(os.environ.get("REQUEST_DEADLINE_RESERVE_SECONDS", "2"))
+
+METRICS_MULTIPROC_DIR = os.environ.get("METRICS_MULTIPROC_DIR")
+METRICS_FLUSH_SECONDS = float(os.environ.get("METRICS_FLUSH_SECONDS", "5"))
+
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")
+# Serverless functions only have a writable temp dir.
+PROFILE_DIR = os.environ.get(
+    "PROFILE_DIR",
+    os.path.join(tempfile.gettempdir(), "profiles") if DEPLOYMENT_MODE == "serverless" else ".cache/profiles",
+)
+PROFILE_INTERVAL_SECONDS = float(os.environ.get("PROFILE_INTERVAL_SECONDS", "0.005"))
+
+READING_CACHE_MAX_ENTRIES = int(os.environ.get("READING_CACHE_MAX_ENTRIES", "2048"))
+
+# Warmup delays nothing but the readiness probe; serverless instances skip it so a cold start stays cheap.
+WARMUP_ENABLED = os.environ.get("WARMUP_ENABLED", str(DEPLOYMENT_MODE == "server")).lower() in ("1", "true", "yes")
+WARMUP_DB_CONNECTIONS = int(os.environ.get("WARMUP_DB_CONNECTIONS", "2"))
+WARMUP_TIMEOUT_SECONDS = float(os.environ.get("WARMUP_TIMEOUT_SECONDS", "15"))
+# Steps that must succeed before the worker reports ready; the others are best-effort. The LLM connection is
+# left out by default so a provider outage does not take every worker out of rotation.
+WARMUP_REQUIRED_STEPS = [
+    step.strip() for step in os.environ.get("WARMUP_REQUIRED_STEPS", "card_catalog,database").split(",") if step.strip()
+]
+WARMUP_RETRY_SECONDS = float(os.environ.get("WARMUP_RETRY_SECONDS", "5"))
+
+
+def __getattr__(name: str) -> Any:
+    # `OPENAI_BASE_CLIENT` and `OPENAI_CLIENT` are built on first access: importing openai and instructor
+    # dominates cold starts, and requests that never call an LLM should not pay for it.
+    if name == "OPENAI_BASE_CLIENT":
+        from api.llm_client import build_openai_client
+
+        client = build_openai_client()
+    elif name == "OPENAI_CLIENT":
+        import instructor
+
+        client = instructor.from_openai(__getattr__("OPENAI_BASE_CLIENT"))
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = client
+    return client
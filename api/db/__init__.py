@@ -1,13 +1,23 @@
 """Database module for Tarotpedia API."""
 
-from api.db.crud import create_reading, get_reading
-from api.db.database import Base, async_engine, get_db, get_db_context
+from api.db.cache import READING_CACHE, ReadingCache, ReadingPayload
+from api.db.crud import (
+    create_reading,
+    decode_reading_cursor,
+    encode_reading_cursor,
+    get_reading,
+    get_reading_document,
+    list_readings,
+)
+from api.db.database import Base, dispose_engine, get_async_engine, get_db, get_db_context, pool_stats
 from api.db.models import CardInterpretation, NumerologyData, Reading, ReadingCard, ReadingSummary
 
 __all__ = [
     # Database setup
     "Base",
-    "async_engine",
+    "get_async_engine",
+    "dispose_engine",
+    "pool_stats",
     "get_db",
     "get_db_context",
     # Models
@@ -19,4 +29,12 @@ __all__ = [
     # CRUD operations
     "create_reading",
     "get_reading",
+    "get_reading_document",
+    "list_readings",
+    "encode_reading_cursor",
+    "decode_reading_cursor",
+    # Read cache
+    "READING_CACHE",
+    "ReadingCache",
+    "ReadingPayload",
 ]
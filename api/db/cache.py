@@ -0,0 +1,77 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import UUID
+
+from api.config import READING_CACHE_MAX_ENTRIES
+from api.models.reading import GetReadingResponse
+
+
+@dataclass(frozen=True, slots=True)
+class ReadingPayload:
+    """Rendered JSON body of a `GetReadingResponse` and its strong ETag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def render(cls, document: Dict[str, Any]) -> "ReadingPayload":
+        body = GetReadingResponse.model_validate(document).model_dump_json().encode("utf-8")
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+class ReadingCache:
+    """
+    Bounded read-through LRU cache of rendered reading responses.
+
+    Saved readings are never modified, so entries are only ever evicted for space, never invalidated.
+    Missing readings are not cached, so a reading becomes visible as soon as it is saved.
+    """
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[UUID, ReadingPayload] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get_or_load(
+        self, reading_id: UUID, load: Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+    ) -> Optional[ReadingPayload]:
+        """Return the cached payload, or render and cache the document returned by `load()`."""
+        with self._lock:
+            payload = self._entries.get(reading_id)
+            if payload is not None:
+                self._entries.move_to_end(reading_id)
+                self.hits += 1
+                return payload
+            self.misses += 1
+
+        document = await load()
+        if document is None:
+            return None
+
+        payload = ReadingPayload.render(document)
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[reading_id] = payload
+                self._entries.move_to_end(reading_id)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return payload
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": sum(len(payload.body) for payload in list(self._entries.values())),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+READING_CACHE = ReadingCache(READING_CACHE_MAX_ENTRIES)
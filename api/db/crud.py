@@ -1,17 +1,31 @@
-from datetime import date
-from typing import List, Optional
+import base64
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Insert, Row, Select, case, cast, func, insert, literal, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from api.db.models import CardInterpretation, NumerologyData, Reading, ReadingCard, ReadingSummary
+from api.metrics import DB_QUERY_SECONDS
 from api.models.tarot import TarotCard, TarotInterpretation
+from api.timing import server_timing
 
+# Cards and interpretations were written in spread order; documents return them that way.
+POSITION_ORDER = {"past": 0, "present": 1, "future": 2}
 
-async def create_reading(
-    db: AsyncSession,
+
+def _rows(model, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Anonymous bind parameters, so the same column names can appear in every chained INSERT.
+    columns = model.__table__.c
+    return [{key: literal(value, columns[key].type) for key, value in row.items()} for row in rows]
+
+
+def build_reading_insert(
+    reading_id: UUID,
     user_name: str,
     user_dob: date,
     question: str,
@@ -19,45 +33,144 @@ async def create_reading(
     interpretations: List[TarotInterpretation],
     summary: str,
     numerology_meaning: Optional[str] = None,
-) -> UUID:
-    reading = Reading(user_name=user_name, user_birth_date=user_dob, question_text=question)
-
-    db.add(reading)
-    await db.flush()
+) -> Insert:
+    """
+    One statement inserting a reading and all of its child rows.
 
+    Each child table gets a multi-row INSERT, chained as data-modifying CTEs so PostgreSQL runs them all
+    in a single round trip; foreign keys are checked at the end of the statement, after the parent exists.
+    Keys and timestamps are generated here rather than by the database so nothing has to be read back.
+    The reading's `document` snapshot is written by the same statement, so it can never disagree with the
+    child rows.
+    """
+    now = datetime.now(timezone.utc)
     position_map = {0: "past", 1: "present", 2: "future"}
+    card_rows = [
+        {
+            "reading_card_id": uuid.uuid4(),
+            "reading_id": reading_id,
+            "card_position_text": position_map.get(idx, f"card_{idx}"),
+            "card_name": card.name,
+            "is_upright": card.is_upright,
+            "card_image_url": card.image_url,
+            "full_card_name": card.full_card_name,
+            "created_at": now,
+        }
+        for idx, card in enumerate(cards)
+    ]
+    interpretation_rows = [
+        {
+            "interpretation_id": uuid.uuid4(),
+            "reading_id": reading_id,
+            "card_name": interp.card_name,
+            "card_position_text": interp.position,
+            "card_orientation_text": interp.orientation,
+            "meaning_text": interp.meaning,
+            "created_at": now,
+        }
+        for interp in interpretations
+    ]
+    document = {
+        "reading_id": str(reading_id),
+        "user_name": user_name,
+        "user_dob": user_dob.isoformat(),
+        "question": question,
+        "cards": [
+            {
+                "position": row["card_position_text"],
+                "card_name": row["card_name"],
+                "is_upright": row["is_upright"],
+                "image_url": row["card_image_url"],
+                "full_card_name": row["full_card_name"],
+            }
+            for row in sorted(card_rows, key=lambda row: position_key(row["card_position_text"]))
+        ],
+        "interpretations": [
+            {
+                "card_name": row["card_name"],
+                "position": row["card_position_text"],
+                "orientation": row["card_orientation_text"],
+                "meaning": row["meaning_text"],
+            }
+            for row in sorted(interpretation_rows, key=lambda row: position_key(row["card_position_text"]))
+        ],
+        "summary": summary,
+        "numerology_meaning": numerology_meaning or None,
+        "created_at": now.replace(tzinfo=None).isoformat(),
+    }
 
-    for idx, card in enumerate(cards):
-        position = position_map.get(idx, f"card_{idx}")
-        reading_card = ReadingCard(
-            reading_id=reading.reading_id,
-            card_position_text=position,
-            card_name=card.name,
-            is_upright=card.is_upright,
-            card_image_url=card.image_url,
-            full_card_name=card.full_card_name,
+    statements: List[Insert] = [
+        insert(Reading).values(
+            _rows(
+                Reading,
+                [
+                    {
+                        "reading_id": reading_id,
+                        "user_name": user_name,
+                        "user_birth_date": user_dob,
+                        "question_text": question,
+                        "document": document,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                ],
+            )
         )
-        db.add(reading_card)
-
-    for interp in interpretations:
-        card_interpretation = CardInterpretation(
-            reading_id=reading.reading_id,
-            card_name=interp.card_name,
-            card_position_text=interp.position,
-            card_orientation_text=interp.orientation,
-            meaning_text=interp.meaning,
+    ]
+    if card_rows:
+        statements.append(insert(ReadingCard).values(_rows(ReadingCard, card_rows)))
+    if interpretation_rows:
+        statements.append(insert(CardInterpretation).values(_rows(CardInterpretation, interpretation_rows)))
+    statements.append(
+        insert(ReadingSummary).values(
+            _rows(
+                ReadingSummary,
+                [{"summary_id": uuid.uuid4(), "reading_id": reading_id, "summary_text": summary, "created_at": now}],
+            )
+        )
+    )
+    if numerology_meaning:
+        statements.append(
+            insert(NumerologyData).values(
+                _rows(
+                    NumerologyData,
+                    [
+                        {
+                            "numerology_id": uuid.uuid4(),
+                            "reading_id": reading_id,
+                            "meaning_text": numerology_meaning,
+                            "created_at": now,
+                        }
+                    ],
+                )
+            )
         )
-        db.add(card_interpretation)
 
-    reading_summary = ReadingSummary(reading_id=reading.reading_id, summary_text=summary)
-    db.add(reading_summary)
+    *ctes, final = statements
+    return final.add_cte(*(statement.cte(f"insert_{index}") for index, statement in enumerate(ctes)))
 
-    if numerology_meaning:
-        numerology_data = NumerologyData(reading_id=reading.reading_id, meaning_text=numerology_meaning)
-        db.add(numerology_data)
 
-    await db.commit()
-    return reading.reading_id
+async def create_reading(
+    db: AsyncSession,
+    user_name: str,
+    user_dob: date,
+    question: str,
+    cards: List[TarotCard],
+    interpretations: List[TarotInterpretation],
+    summary: str,
+    numerology_meaning: Optional[str] = None,
+) -> UUID:
+    """Persist a reading with a single INSERT statement and commit it."""
+    reading_id = uuid.uuid4()
+    statement = build_reading_insert(
+        reading_id, user_name, user_dob, question, cards, interpretations, summary, numerology_meaning
+    )
+
+    with DB_QUERY_SECONDS.time("create_reading", "insert"), server_timing("db-insert"):
+        await db.execute(statement)
+    with DB_QUERY_SECONDS.time("create_reading", "commit"), server_timing("db-commit"):
+        await db.commit()
+    return reading_id
 
 
 async def get_reading(db: AsyncSession, reading_id: UUID) -> Optional[Reading]:
@@ -72,5 +185,150 @@ async def get_reading(db: AsyncSession, reading_id: UUID) -> Optional[Reading]:
         .where(Reading.reading_id == reading_id)
     )
 
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    with DB_QUERY_SECONDS.time("get_reading", "select"), server_timing("db-select"):
+        result = await db.execute(stmt)
+        return result.scalar_one_or_none()
+
+
+def position_key(position: str) -> Tuple[int, str]:
+    """Sort key putting cards and interpretations in spread order, as the document query does."""
+    return POSITION_ORDER.get(position, len(POSITION_ORDER)), position
+
+
+def _position_order(column):
+    return case(POSITION_ORDER, value=column, else_=len(POSITION_ORDER)), column
+
+
+def _json_object(**fields: Any):
+    # Keys are inlined: `json_build_object` takes VARIADIC "any", so bound keys would have no inferable type.
+    return func.json_build_object(
+        *(part for key, value in fields.items() for part in (literal_column(f"'{key}'"), value))
+    )
+
+
+def aggregate_reading_document():
+    """
+    JSON document of a reading assembled from the normalized tables, correlated to `readings`.
+
+    Child tables are folded in with correlated `json_agg` subqueries; the document has the shape of
+    `GetReadingResponse` and of the `Reading.document` snapshot.
+    """
+    cards = (
+        select(
+            func.json_agg(
+                aggregate_order_by(
+                    _json_object(
+                        position=ReadingCard.card_position_text,
+                        card_name=ReadingCard.card_name,
+                        is_upright=ReadingCard.is_upright,
+                        image_url=ReadingCard.card_image_url,
+                        full_card_name=ReadingCard.full_card_name,
+                    ),
+                    *_position_order(ReadingCard.card_position_text),
+                )
+            )
+        )
+        .where(ReadingCard.reading_id == Reading.reading_id)
+        .scalar_subquery()
+    )
+    interpretations = (
+        select(
+            func.json_agg(
+                aggregate_order_by(
+                    _json_object(
+                        card_name=CardInterpretation.card_name,
+                        position=CardInterpretation.card_position_text,
+                        orientation=CardInterpretation.card_orientation_text,
+                        meaning=CardInterpretation.meaning_text,
+                    ),
+                    *_position_order(CardInterpretation.card_position_text),
+                )
+            )
+        )
+        .where(CardInterpretation.reading_id == Reading.reading_id)
+        .scalar_subquery()
+    )
+    summary = select(ReadingSummary.summary_text).where(ReadingSummary.reading_id == Reading.reading_id)
+    numerology = select(NumerologyData.meaning_text).where(NumerologyData.reading_id == Reading.reading_id)
+    empty = literal_column("'[]'::json")
+
+    return _json_object(
+        reading_id=Reading.reading_id,
+        user_name=Reading.user_name,
+        user_dob=Reading.user_birth_date,
+        question=Reading.question_text,
+        cards=func.coalesce(cards, empty),
+        interpretations=func.coalesce(interpretations, empty),
+        summary=func.coalesce(summary.scalar_subquery(), literal_column("''")),
+        numerology_meaning=numerology.scalar_subquery(),
+        # Naive UTC ISO timestamps, as readings have always been returned.
+        created_at=func.timezone("UTC", Reading.created_at),
+    )
+
+
+def build_reading_document_select(reading_id: UUID) -> Select:
+    """
+    One SELECT returning a reading as a single JSON document.
+
+    The stored snapshot is returned when present; readings saved before snapshots existed are assembled
+    from the normalized tables instead (COALESCE only evaluates those subqueries when needed).
+    """
+    document = func.coalesce(Reading.document, cast(aggregate_reading_document(), JSONB))
+    return select(document).where(Reading.reading_id == reading_id)
+
+
+async def get_reading_document(db: AsyncSession, reading_id: UUID) -> Optional[Dict[str, Any]]:
+    """Fetch a reading as a `GetReadingResponse`-shaped dict in a single query, or None when it does not exist."""
+    with DB_QUERY_SECONDS.time("get_reading_document", "select"), server_timing("db-select"):
+        result = await db.execute(build_reading_document_select(reading_id))
+        return result.scalar_one_or_none()
+
+
+def encode_reading_cursor(created_at: datetime, reading_id: UUID) -> str:
+    """Opaque cursor pointing just past a reading in the history order."""
+    raw = f"{created_at.isoformat()}|{reading_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_reading_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Inverse of `encode_reading_cursor`; raises ValueError on malformed cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        created_at, reading_id = raw.split("|")
+        position = datetime.fromisoformat(created_at), UUID(reading_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if position[0].tzinfo is None:
+        raise ValueError("Invalid cursor")
+    return position
+
+
+async def list_readings(
+    db: AsyncSession,
+    user_name: str,
+    user_dob: date,
+    limit: int = 20,
+    before: Optional[Tuple[datetime, UUID]] = None,
+) -> Tuple[List[Row], Optional[Tuple[datetime, UUID]]]:
+    """
+    One page of a user's readings, newest first, and the position to continue from (None on the last page).
+
+    Keyset pagination: the page starts strictly after `before` in `(created_at, reading_id)` order, which
+    `ix_readings_user_created` serves as an index range scan, so any page costs the same as the first.
+    """
+    stmt = (
+        select(Reading.reading_id, Reading.question_text, Reading.created_at)
+        .where(Reading.user_name == user_name, Reading.user_birth_date == user_dob)
+        .order_by(Reading.created_at.desc(), Reading.reading_id.desc())
+        .limit(limit + 1)
+    )
+    if before is not None:
+        stmt = stmt.where(tuple_(Reading.created_at, Reading.reading_id) < tuple_(*before))
+
+    with DB_QUERY_SECONDS.time("list_readings", "select"), server_timing("db-select"):
+        rows = (await db.execute(stmt)).all()
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, (rows[-1].created_at, rows[-1].reading_id)
@@ -1,23 +1,128 @@
+import logging
+import uuid
 from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool, QueuePool
 
-from api.config import DATABASE_URL
+from api.config import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_POOLER,
+    DB_STATEMENT_CACHE_SIZE,
+    DEPLOYMENT_MODE,
+)
+from api.metrics import DB_POOL_EVENTS
+
+logger = logging.getLogger(__name__)
 
 ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
-engine = create_engine(DATABASE_URL, echo=False)
-async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False)
+Base = declarative_base()
 
-async_session_maker = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+_engine: Optional[AsyncEngine] = None
+_session_maker: Optional[async_sessionmaker[AsyncSession]] = None
+_pool_events: Dict[str, int] = {"connect": 0, "checkout": 0, "checkin": 0, "invalidate": 0}
 
-Base = declarative_base()
+
+def engine_options() -> Dict[str, Any]:
+    """
+    `create_async_engine` options for the current deployment mode.
+
+    Serverless instances are short-lived and many run at once, so they keep no pool of their own
+    (`NullPool`) and rely on an external pooler such as PgBouncer or Neon's pooled endpoint. Long-running
+    servers keep a persistent pool that is pre-pinged and recycled before the server drops idle connections.
+    """
+    connect_args: Dict[str, Any] = {"prepared_statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+    if DB_POOLER == "pgbouncer":
+        # A transaction-mode pooler hands each transaction a different server connection: statement names
+        # must never collide there, and asyncpg's own cache is bypassed since SQLAlchemy keeps its own.
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4()}__"
+        connect_args["statement_cache_size"] = 0
+
+    options: Dict[str, Any] = {"echo": False, "connect_args": connect_args}
+    if DEPLOYMENT_MODE == "serverless":
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=True,
+        )
+    return options
+
+
+def _count(name: str):
+    def listener(*args) -> None:
+        _pool_events[name] += 1
+        DB_POOL_EVENTS.inc(name)
+
+    return listener
+
+
+def get_async_engine() -> AsyncEngine:
+    """The process-wide async engine, created on first use."""
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options())
+        for name in _pool_events:
+            event.listen(_engine.sync_engine.pool, name, _count(name))
+        logger.info(f"Created database engine ({DEPLOYMENT_MODE}, {type(_engine.pool).__name__})")
+    return _engine
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    global _session_maker
+    if _session_maker is None:
+        _session_maker = async_sessionmaker(get_async_engine(), class_=AsyncSession, expire_on_commit=False)
+    return _session_maker
+
+
+async def dispose_engine() -> None:
+    """Close every pooled connection and forget the engine; the next use creates a new one."""
+    global _engine, _session_maker
+    if _engine is not None:
+        await _engine.dispose()
+    _engine = _session_maker = None
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Pool configuration, current occupancy and lifetime connect/checkout counters."""
+    stats: Dict[str, Any] = {
+        "deployment_mode": DEPLOYMENT_MODE,
+        "pooler": DB_POOLER or None,
+        "statement_cache_size": DB_STATEMENT_CACHE_SIZE,
+        "engine_created": _engine is not None,
+        "events": dict(_pool_events),
+    }
+    if _engine is None:
+        return stats
+
+    pool = _engine.pool
+    stats["pool"] = type(pool).__name__
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            max_overflow=DB_MAX_OVERFLOW,
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    else:
+        stats["checked_out"] = _pool_events["checkout"] - _pool_events["checkin"]
+    return stats
 
 
 async def get_db():
-    async with async_session_maker() as session:
+    async with get_session_maker()() as session:
         try:
             yield session
             await session.commit()
@@ -30,7 +135,7 @@ async def get_db():
 
 @asynccontextmanager
 async def get_db_context():
-    async with async_session_maker() as session:
+    async with get_session_maker()() as session:
         try:
             yield session
             await session.commit()
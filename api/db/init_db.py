@@ -1,11 +1,12 @@
 import asyncio
 
-from api.db import Base, async_engine
+from api.db import Base, dispose_engine, get_async_engine
 
 
 async def init_db():
-    async with async_engine.begin() as conn:
+    async with get_async_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await dispose_engine()
     print("Database tables created successfully!")
 
 
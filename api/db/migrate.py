@@ -0,0 +1,107 @@
+"""
+In-place upgrades of databases created by earlier versions of `init_db`.
+
+Every step checks the current schema first, so running it again is a no-op. Run with `make db-migrate`
+(or `python3 api/db/migrate.py`) before deploying a version that needs the new schema.
+
+Converting the `created_at`/`updated_at` text columns rewrites each table under an exclusive lock;
+on large tables run it in a maintenance window. Indexes are built with `CREATE INDEX CONCURRENTLY`
+outside a transaction, so writes to `readings` keep going while they build.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from api.db.database import dispose_engine, get_async_engine
+from api.db.models import Reading
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "readings": ("created_at", "updated_at"),
+    "reading_cards": ("created_at",),
+    "card_interpretations": ("created_at",),
+    "reading_summaries": ("created_at",),
+    "numerology_entries": ("created_at",),
+}
+
+
+async def add_document_column(conn: AsyncConnection) -> None:
+    """Add the `readings.document` snapshot column."""
+    await conn.execute(text("ALTER TABLE readings ADD COLUMN IF NOT EXISTS document JSONB"))
+
+
+async def convert_timestamp_columns(conn: AsyncConnection) -> None:
+    """Turn the ISO 8601 text timestamps (naive UTC) into `timestamptz` columns."""
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        result = await conn.execute(
+            text(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name = :table AND data_type = 'text'"
+            ),
+            {"table": table},
+        )
+        pending = [column for column in columns if column in set(result.scalars())]
+        if not pending:
+            continue
+
+        # One ALTER TABLE per table, so the table is rewritten once however many columns change.
+        clauses = ", ".join(
+            f"ALTER COLUMN {column} TYPE timestamptz USING ({column}::timestamp AT TIME ZONE 'UTC')"
+            for column in pending
+        )
+        await conn.execute(text(f"ALTER TABLE {table} {clauses}"))
+        logger.info(f"Converted {table}.{', '.join(pending)} to timestamptz")
+
+
+async def create_indexes(conn: AsyncConnection) -> None:
+    """
+    Create the indexes declared on the models that the database does not have yet.
+
+    Runs on an autocommit connection: `CREATE INDEX CONCURRENTLY` cannot run inside a transaction. A
+    concurrent build that was interrupted leaves an invalid index behind, which is dropped and rebuilt.
+    """
+    for index in Reading.__table__.indexes:
+        result = await conn.execute(
+            text(
+                "SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :name AND c.relnamespace = current_schema()::regnamespace"
+            ),
+            {"name": index.name},
+        )
+        valid = result.scalar()
+        if valid:
+            continue
+        if valid is not None:
+            logger.warning(f"Rebuilding invalid index {index.name}")
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}"))
+
+        columns = ", ".join(column.name for column in index.columns)
+        await conn.execute(text(f"CREATE INDEX CONCURRENTLY {index.name} ON {index.table.name} ({columns})"))
+        logger.info(f"Created index {index.name}")
+
+
+MIGRATIONS = (add_document_column, convert_timestamp_columns, create_indexes)
+# Steps that cannot run inside a transaction.
+AUTOCOMMIT_MIGRATIONS = {create_indexes}
+
+
+async def migrate() -> None:
+    for step in MIGRATIONS:
+        if step in AUTOCOMMIT_MIGRATIONS:
+            async with get_async_engine().connect() as conn:
+                await step(await conn.execution_options(isolation_level="AUTOCOMMIT"))
+        else:
+            async with get_async_engine().begin() as conn:
+                await step(conn)
+    await dispose_engine()
+    print("Database migrated successfully!")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(migrate())
@@ -1,27 +1,30 @@
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, Column, Date, ForeignKey, String, Text, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from api.db.database import Base
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class Reading(Base):
     __tablename__ = "readings"
+    # Backs the per-user history: equality on the user, then keyset order on (created_at, reading_id).
+    __table_args__ = (Index("ix_readings_user_created", "user_name", "user_birth_date", "created_at", "reading_id"),)
 
     reading_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_name = Column(String(255), nullable=False)
     user_birth_date = Column(Date, nullable=False)
     question_text = Column(Text, nullable=False)
-    created_at = Column(Text, nullable=False, default=lambda: datetime.utcnow().isoformat())
-    updated_at = Column(
-        Text,
-        nullable=False,
-        default=lambda: datetime.utcnow().isoformat(),
-        onupdate=lambda: datetime.utcnow().isoformat(),
-    )
+    # Denormalized `GetReadingResponse` snapshot for single-row reads; the child tables stay the source of truth.
+    document = Column(JSONB)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, onupdate=_utcnow)
 
     cards = relationship("ReadingCard", back_populates="reading", cascade="all, delete-orphan")
     interpretations = relationship("CardInterpretation", back_populates="reading", cascade="all, delete-orphan")
@@ -40,7 +43,7 @@ class ReadingCard(Base):
     is_upright = Column(Boolean, nullable=False)
     card_image_url = Column(String(500))
     full_card_name = Column(String(300), nullable=False)
-    created_at = Column(Text, nullable=False, default=lambda: datetime.utcnow().isoformat())
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
 
     reading = relationship("Reading", back_populates="cards")
 
@@ -55,7 +58,7 @@ class CardInterpretation(Base):
     card_position_text = Column(String(20), nullable=False)
     card_orientation_text = Column(String(20), nullable=False)
     meaning_text = Column(Text, nullable=False)
-    created_at = Column(Text, nullable=False, default=lambda: datetime.utcnow().isoformat())
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
 
     reading = relationship("Reading", back_populates="interpretations")
 
@@ -68,7 +71,7 @@ class ReadingSummary(Base):
         UUID(as_uuid=True), ForeignKey("readings.reading_id", ondelete="CASCADE"), nullable=False, unique=True
     )
     summary_text = Column(Text, nullable=False)
-    created_at = Column(Text, nullable=False, default=lambda: datetime.utcnow().isoformat())
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
 
     reading = relationship("Reading", back_populates="summary")
 
@@ -81,6 +84,6 @@ class NumerologyData(Base):
         UUID(as_uuid=True), ForeignKey("readings.reading_id", ondelete="CASCADE"), nullable=False, unique=True
     )
     meaning_text = Column(Text, nullable=False)
-    created_at = Column(Text, nullable=False, default=lambda: datetime.utcnow().isoformat())
+    created_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow)
 
     reading = relationship("Reading", back_populates="numerology")
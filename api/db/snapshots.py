@@ -0,0 +1,165 @@
+"""
+Maintenance of the denormalized `readings.document` snapshots.
+
+`create_reading` writes the snapshot together with the normalized rows; these routines cover readings
+saved before the column existed and verify that snapshots still match the normalized tables, which
+remain the source of truth. Run with `make db-snapshots` (backfill) and `make db-check-snapshots`
+(or `python3 api/db/snapshots.py {backfill,check} --help`).
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import cast, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.db.crud import aggregate_reading_document, position_key
+from api.db.database import dispose_engine, get_session_maker
+from api.db.migrate import add_document_column
+from api.db.models import Reading
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SnapshotReport:
+    checked: int = 0
+    missing: List[UUID] = field(default_factory=list)
+    mismatched: Dict[UUID, List[str]] = field(default_factory=dict)
+    repaired: int = 0
+
+    @property
+    def consistent(self) -> bool:
+        return not self.missing and not self.mismatched
+
+
+def normalize_document(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Put cards and interpretations in spread order so two documents of the same reading compare equal."""
+    return {
+        **document,
+        # PostgreSQL drops trailing zeros of fractional seconds, Python's isoformat keeps them.
+        "created_at": datetime.fromisoformat(document["created_at"]) if document.get("created_at") else None,
+        "cards": sorted(document.get("cards") or [], key=lambda card: position_key(card["position"])),
+        "interpretations": sorted(
+            document.get("interpretations") or [], key=lambda interp: position_key(interp["position"])
+        ),
+    }
+
+
+def diff_documents(snapshot: Dict[str, Any], expected: Dict[str, Any]) -> List[str]:
+    """Names of the top-level fields that differ between a snapshot and the normalized tables."""
+    snapshot, expected = normalize_document(snapshot), normalize_document(expected)
+    return sorted(key for key in snapshot.keys() | expected.keys() if snapshot.get(key) != expected.get(key))
+
+
+async def backfill_snapshots(db: AsyncSession, batch_size: int = 500, limit: Optional[int] = None) -> int:
+    """
+    Write snapshots for readings that have none, `batch_size` readings per transaction.
+
+    Every batch is one UPDATE that assembles the documents inside PostgreSQL. Returns the number of
+    readings backfilled.
+    """
+    backfilled = 0
+    while limit is None or backfilled < limit:
+        size = batch_size if limit is None else min(batch_size, limit - backfilled)
+        batch = select(Reading.reading_id).where(Reading.document.is_(None)).limit(size).scalar_subquery()
+        result = await db.execute(
+            update(Reading)
+            .where(Reading.reading_id.in_(batch))
+            .values(document=cast(aggregate_reading_document(), JSONB))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        if not result.rowcount:
+            break
+        backfilled += result.rowcount
+        logger.info(f"Backfilled {backfilled} reading snapshots")
+    return backfilled
+
+
+async def check_snapshots(db: AsyncSession, batch_size: int = 500, repair: bool = False) -> SnapshotReport:
+    """
+    Compare every snapshot against a document assembled from the normalized tables.
+
+    Readings are walked in `reading_id` order with keyset pagination. With `repair`, mismatched snapshots
+    are rewritten from the normalized tables.
+    """
+    report = SnapshotReport()
+    after: Optional[UUID] = None
+    while True:
+        stmt = (
+            select(Reading.reading_id, Reading.document, cast(aggregate_reading_document(), JSONB))
+            .order_by(Reading.reading_id)
+            .limit(batch_size)
+        )
+        if after is not None:
+            stmt = stmt.where(Reading.reading_id > after)
+        rows = (await db.execute(stmt)).all()
+        if not rows:
+            break
+
+        for reading_id, snapshot, expected in rows:
+            report.checked += 1
+            if snapshot is None:
+                report.missing.append(reading_id)
+                continue
+            fields = diff_documents(snapshot, expected)
+            if fields:
+                report.mismatched[reading_id] = fields
+                logger.warning(f"Snapshot of reading {reading_id} differs in {', '.join(fields)}")
+
+        after = rows[-1][0]
+
+    if repair and report.mismatched:
+        for reading_id in report.mismatched:
+            await db.execute(
+                update(Reading)
+                .where(Reading.reading_id == reading_id)
+                .values(document=cast(aggregate_reading_document(), JSONB))
+                .execution_options(synchronize_session=False)
+            )
+        await db.commit()
+        report.repaired = len(report.mismatched)
+    return report
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    backfill = subparsers.add_parser("backfill", help="write snapshots for readings that have none")
+    backfill.add_argument("--batch-size", type=int, default=500)
+    backfill.add_argument("--limit", type=int, default=None)
+    check = subparsers.add_parser("check", help="compare snapshots with the normalized tables")
+    check.add_argument("--batch-size", type=int, default=500)
+    check.add_argument("--repair", action="store_true", help="rewrite mismatched snapshots")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        async with get_session_maker()() as db:
+            if args.command == "backfill":
+                await add_document_column(await db.connection())
+                await db.commit()
+                backfilled = await backfill_snapshots(db, args.batch_size, args.limit)
+                print(f"Backfilled {backfilled} reading snapshots")
+                return 0
+
+            report = await check_snapshots(db, args.batch_size, args.repair)
+            print(
+                f"Checked {report.checked} readings: {len(report.missing)} without snapshot, "
+                f"{len(report.mismatched)} mismatched, {report.repaired} repaired"
+            )
+            return 0 if not report.missing and report.repaired == len(report.mismatched) else 1
+    finally:
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,122 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from typing import AsyncIterator, Optional, Set, Tuple
+
+
+class Deadline:
+    """
+    Point in time by which the current request must be answered.
+
+    `remaining()` is the time left for work, keeping `reserve_seconds` aside for what happens after the
+    LLM answers (saving, serializing and sending the response). `shared` is a separate deadline of the
+    same request for work shared with other requests, which runs under it instead of a client's shorter
+    one and which other requests joining that work may `extend()`.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        reserve_seconds: float = 0.0,
+        started_at: Optional[float] = None,
+        shared: Optional["Deadline"] = None,
+    ) -> None:
+        self.seconds = seconds
+        self.reserve_seconds = reserve_seconds
+        self.expires_at = (time.monotonic() if started_at is None else started_at) + seconds
+        self.shared = shared
+        self._scopes: Set[asyncio.Timeout] = set()
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self.reserve_seconds - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    @property
+    def finite(self) -> bool:
+        """False once extended by a caller without a deadline: the work then runs to completion."""
+        return self.expires_at < math.inf
+
+    def extend(self, other: Optional["Deadline"]) -> None:
+        """Push the expiry out to `other`'s when it is later, or lift it when `other` is None."""
+        expires_at = other.expires_at if other else math.inf
+        if expires_at <= self.expires_at:
+            return
+        self.seconds += expires_at - self.expires_at
+        self.expires_at = expires_at
+        for scope in self._scopes:
+            scope.reschedule(self._cutoff())
+
+    @asynccontextmanager
+    async def scope(self) -> AsyncIterator[asyncio.Timeout]:
+        """`asyncio.timeout` firing at this deadline, and following it when extended."""
+        async with asyncio.timeout_at(self._cutoff()) as scope:
+            self._scopes.add(scope)
+            try:
+                yield scope
+            finally:
+                self._scopes.discard(scope)
+
+    def _cutoff(self) -> Optional[float]:
+        # The event loop clock is `time.monotonic()`, the clock `expires_at` is on.
+        return self.expires_at - self.reserve_seconds if self.finite else None
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("deadline", default=None)
+
+
+def parse_timeout_header(value: Optional[str]) -> Optional[float]:
+    """Seconds from an `X-Request-Timeout` header, or None when missing or not a positive number."""
+    try:
+        seconds = float(value) if value else None
+    except ValueError:
+        return None
+    return seconds if seconds and 0 < seconds < float("inf") else None
+
+
+def start_deadline(
+    default_seconds: float, requested_seconds: Optional[float] = None, reserve_seconds: float = 0.0
+) -> Tuple[Optional[Deadline], Optional[Token]]:
+    """
+    Start the current request's deadline.
+
+    The client may only shorten the configured deadline; with no deadline configured (`0`) its requested
+    timeout is used as is. Nothing is started when neither is set.
+
+    Shared work runs under the configured deadline, or under the client's one when none is configured, so
+    an LLM call always has a bound once the request has one.
+    """
+    shared_seconds = default_seconds or requested_seconds
+    if not shared_seconds:
+        return None, None
+    started_at = time.monotonic()
+    shared = Deadline(shared_seconds, reserve_seconds, started_at)
+    seconds = min(requested_seconds, shared_seconds) if requested_seconds else shared_seconds
+    deadline = Deadline(seconds, reserve_seconds, started_at, shared)
+    return deadline, _current.set(deadline)
+
+
+def stop_deadline(token: Optional[Token]) -> None:
+    if token is not None:
+        _current.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The current request's deadline, if one was started."""
+    return _current.get()
+
+
+def shared_deadline() -> Optional[Deadline]:
+    """
+    Deadline for work shared with other requests (coalesced LLM calls).
+
+    The configured deadline applies to it, so one client's short `X-Request-Timeout` cannot fail the
+    identical requests coalesced onto its call. With none configured it is the client's own, extended by
+    every request coalescing onto the call to the longest deadline among them.
+    """
+    deadline = _current.get()
+    return deadline.shared if deadline else None
@@ -1,41 +1,195 @@
+import asyncio
+import hmac
+import json
 import logging
 import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Optional
 from uuid import UUID
 
-import uvicorn
-from fastapi import Depends, FastAPI, HTTPException
-from fastapi.responses import RedirectResponse
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from api import __title__, __version__
-from api.db import create_reading, get_db, get_reading
+from starlette.types import Receive, Scope, Send
+
+from api import __title__, __version__, config
+from api.config import (
+    ADMIN_TOKEN,
+    PROFILE_DIR,
+    PROFILE_INTERVAL_SECONDS,
+    REQUEST_DEADLINE_RESERVE_SECONDS,
+    REQUEST_DEADLINE_SECONDS,
+)
+from api.deadline import parse_timeout_header, start_deadline, stop_deadline
+from api.metrics import HTTP_REQUEST_SECONDS, METRICS
 from api.models import (
     CardInfoAPIResponse,
-    CardInterpretationResponse,
     CardsAPIRequest,
     CardsAPIResponse,
+    CardsBatchAPIRequest,
+    CardsBatchAPIResponse,
+    FullReadingAPIRequest,
+    FullReadingAPIResponse,
     GetReadingResponse,
     NumerologyAPIRequest,
     NumerologyAPIResponse,
-    ReadingCardResponse,
+    NumerologyBulkAPIRequest,
+    ReadingListItem,
+    ReadingListResponse,
     SaveReadingRequest,
     SaveReadingResponse,
     TarotAPIRequest,
     TarotAPIResponse,
 )
 from api.modules import NumerologyReader, TarotDeck, TarotReader
+from api.modules.predict.bulk import format_csv, read_csv_records
+from api.profiling import SamplingProfiler, load_profile
+from api.timing import TimedRoute, server_timing, start_timing, stop_timing
+from api.warmup import WARMUP
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 PROJECT_BASE_DIR = Path(__file__).resolve().parents[1]
 NUMEROLOGY_READER = NumerologyReader()
 TAROT_READER = TarotReader()
+# Readings are personal, so only the client may cache them; they never change once saved.
+READING_CACHE_CONTROL = "private, max-age=86400, immutable"
+
+
+def _db():
+    """The database layer, imported on first use so routes that never touch it don't load SQLAlchemy."""
+    import api.db
+
+    return api.db
+
+
+async def get_db() -> AsyncIterator["AsyncSession"]:
+    async with _db().get_db_context() as session:
+        yield session
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an `If-None-Match` header against an ETag (RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _sse(event: str, data: Any) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def _draw_seed(request: CardsAPIRequest) -> Optional[int]:
+    """Shuffle seed of a draw request: the personal numerology number, or `None` for a random draw."""
+    if request.follow_numerology:
+        return NUMEROLOGY_READER.calculate(request.name, request.dob)["personal_numerology"]
+    return None
+
 
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    Streaming response whose body may still be reading the request body.
+
+    `StreamingResponse` listens for client disconnects by consuming `receive()`, which would swallow the
+    upload; a disconnect here surfaces as a failed send instead.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def _is_admin(token: str) -> bool:
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token, ADMIN_TOKEN)
+
+
+def require_admin_token(x_admin_token: str = Header(default="")) -> None:
+    """Reject requests to ops endpoints without an `X-Admin-Token` matching `ADMIN_TOKEN`."""
+    if not _is_admin(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
 
-app = FastAPI(title=__title__, version=__version__, docs_url="/swagger", redoc_url=None)
+
+def _profiler_for(request: Request) -> Optional[SamplingProfiler]:
+    """A started profiler when the request opted in with `X-Profile` and a valid `X-Admin-Token`."""
+    if not request.headers.get("x-profile"):
+        return None
+    if not _is_admin(request.headers.get("x-admin-token", "")):
+        logger.warning(f"Ignoring profiling request without a valid admin token for {request.url.path}")
+        return None
+    profiler = SamplingProfiler(interval_seconds=PROFILE_INTERVAL_SECONDS)
+    profiler.start()
+    return profiler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm the worker up and start publishing metrics on startup; release connections on shutdown."""
+    WARMUP.start()
+    METRICS.start_flusher()
+    yield
+    await WARMUP.stop()
+    METRICS.remove_snapshot()
+    if "api.db.database" in sys.modules:
+        await _db().dispose_engine()
+    if "OPENAI_BASE_CLIENT" in vars(config):
+        await config.OPENAI_BASE_CLIENT.close()
+
+
+app = FastAPI(title=__title__, version=__version__, docs_url="/swagger", redoc_url=None, lifespan=lifespan)
+app.router.route_class = TimedRoute
 app.mount("/tarot-cards/images", StaticFiles(directory=PROJECT_BASE_DIR / "static" / "images"), name="tarot-cards")
 
+
+@app.middleware("http")
+async def instrument_request(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    started = time.perf_counter()
+    status = 500
+    timing, timing_token = start_timing()
+    _, deadline_token = start_deadline(
+        REQUEST_DEADLINE_SECONDS,
+        parse_timeout_header(request.headers.get("x-request-timeout")),
+        REQUEST_DEADLINE_RESERVE_SECONDS,
+    )
+    profiler = _profiler_for(request)
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        if profiler:
+            profiler.stop()
+            try:
+                profile_id = await asyncio.to_thread(profiler.save, Path(PROFILE_DIR))
+            except OSError as e:
+                logger.error(f"Failed to save profile to {PROFILE_DIR}: {e}")
+            else:
+                response.headers["X-Profile-Id"] = profile_id
+            profiler = None
+        response.headers["Server-Timing"] = timing.header(time.perf_counter() - started)
+        return response
+    finally:
+        if profiler:
+            profiler.stop()
+        stop_timing(timing_token)
+        stop_deadline(deadline_token)
+        # Label by route template rather than raw path so `/readings/{reading_id}` stays one series.
+        route = request.scope.get("route")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started,
+            request.method,
+            getattr(route, "path", "unmatched"),
+            status,
+        )
+
+
 if os.getenv("VERCEL") == "1":
 
     @app.get("/favicon.ico", include_in_schema=False)
@@ -62,7 +216,12 @@ async def predict_tarot_interpretations(request: TarotAPIRequest) -> TarotAPIRes
         TarotAPIResponse: The response object containing the name, question, and interpretations.
 
     !!! note
-        This function uses the `TarotReader` module to get the tarot interpretations.
+        This function uses the `TarotReader` module to get the tarot interpretations. Identical readings
+        (same name, normalized question and cards) are served from the response cache unless `bypass_cache` is set.
+        When every model's admission queue is full the request fails fast with `503` and a `Retry-After` header.
+        Requests run under a deadline (`REQUEST_DEADLINE_SECONDS`, shortened by an `X-Request-Timeout` header
+        in seconds): fallback models that cannot answer in the time left are skipped, and the request fails
+        with `504` and a `deadline_exceeded` error body instead of being cut off.
 
     !!! example "Example Request"
 
@@ -120,6 +279,7 @@ async def predict_tarot_interpretations(request: TarotAPIRequest) -> TarotAPIRes
             past_card=request.past_card,
             present_card=request.present_card,
             future_card=request.future_card,
+            use_cache=not request.bypass_cache,
         )
 
         return TarotAPIResponse(
@@ -133,6 +293,66 @@ async def predict_tarot_interpretations(request: TarotAPIRequest) -> TarotAPIRes
         raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
 
 
+@app.post("/predict/tarot-interpretations/stream", tags=["Predict API"])
+async def stream_tarot_interpretations(request: TarotAPIRequest) -> StreamingResponse:
+    """
+    | Method | Path                                    | Description                                       |
+    | ------ | --------------------------------------- | ------------------------------------------------- |
+    | `POST` | `/predict/tarot-interpretations/stream` | Stream tarot interpretations as Server-Sent Events |
+
+    Params:
+        request (TarotAPIRequest): Same request body as `/predict/tarot-interpretations`.
+
+    Returns:
+        StreamingResponse: A `text/event-stream` of the reading as the LLM writes it.
+
+    !!! note
+        Events, in order of appearance:
+
+        - `delta`: `{"section": "past", "text": "..."}` new text appended to a section.
+        - `section`: `{"section": "past", "text": "..."}` a section (`past`, `present`, `future`, `summary`) is complete.
+        - `reset`: `{"model": "..."}` the model failed mid-stream; discard streamed text, the next model starts over.
+        - `done`: the validated `TarotAPIResponse`, identical to the non-streaming endpoint.
+        - `error`: `{"status_code": 403, "detail": "..."}` when every model failed, or
+          `{"status_code": 503, "detail": "...", "retry_after": 10}` when every model is overloaded.
+    """
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for event, data in TAROT_READER.stream_interpretation(
+                name=request.name,
+                question=request.question,
+                past_card_name=request.past_card.full_card_name,
+                present_card_name=request.present_card.full_card_name,
+                future_card_name=request.future_card.full_card_name,
+                use_cache=not request.bypass_cache,
+            ):
+                if event != "response":
+                    yield _sse(event, data)
+                    continue
+
+                interpretations = TAROT_READER.build_interpretations(
+                    request.past_card, request.present_card, request.future_card, data
+                )
+                response = TarotAPIResponse(interpretations=interpretations, summary=data.summary)
+                yield _sse("done", response.model_dump(mode="json"))
+
+        except HTTPException as e:
+            error = {"status_code": e.status_code, "detail": e.detail}
+            if e.headers and "Retry-After" in e.headers:
+                error["retry_after"] = int(e.headers["Retry-After"])
+            yield _sse("error", error)
+        except Exception as e:
+            logger.error(f"Tarot interpretation stream failed: {e}")
+            yield _sse("error", {"status_code": 500, "detail": f"Internal Server Error: {str(e)}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.post("/predict/numerology-interpretations", response_model=NumerologyAPIResponse, tags=["Predict API"])
 async def predict_numerology_interpretations(request: NumerologyAPIRequest) -> NumerologyAPIResponse:
     """
@@ -147,7 +367,8 @@ async def predict_numerology_interpretations(request: NumerologyAPIRequest) -> N
         NumerologyAPIResponse: The response object containing the numerology meaning.
 
     !!! note
-        This function uses the `NumerologyReader` module to get the numerology meaning.
+        This function uses the `NumerologyReader` module to get the numerology meaning. Identical requests
+        are served from the response cache unless `bypass_cache` is set.
 
     !!! example "Example Request"
 
@@ -172,6 +393,7 @@ async def predict_numerology_interpretations(request: NumerologyAPIRequest) -> N
             name=request.name,
             dob=request.dob,
             question=request.question,
+            use_cache=not request.bypass_cache,
         )
 
         return NumerologyAPIResponse(numerology_meaning=numerology_meaning)
@@ -182,6 +404,340 @@ async def predict_numerology_interpretations(request: NumerologyAPIRequest) -> N
         raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
 
 
+@app.post("/predict/numerology-calculations/bulk", tags=["Predict API"])
+def predict_numerology_calculations_bulk(request: NumerologyBulkAPIRequest) -> StreamingResponse:
+    """
+    | Method | Path                                    | Description                                      |
+    | ------ | --------------------------------------- | ------------------------------------------------ |
+    | `POST` | `/predict/numerology-calculations/bulk` | Compute numerology numbers of many people at once |
+
+    Params:
+        request (NumerologyBulkAPIRequest): Up to 100,000 name/dob records and whether to include explanations.
+
+    Returns:
+        StreamingResponse: Newline-delimited JSON, one `NumerologyBulkResult` per record, in request order.
+
+    !!! note
+        No LLM is involved. Numbers are identical to `/predict/numerology-interpretations`' calculation step.
+        Records with an invalid `dob` get an `error` instead of numbers rather than failing the whole batch.
+        Leave `explain` off unless the step-by-step formulas are needed; they are several times slower.
+
+    !!! example "Example Request"
+
+        ```json
+        {
+            "records": [
+                {"name": "John Doe", "dob": "2000-01-01"},
+                {"name": "Jane Doe", "dob": "1995-06-15"}
+            ],
+            "explain": false
+        }
+        ```
+
+    !!! example "Example Response"
+
+        ```
+        {"name": "John Doe", "dob": "2000-01-01", "name_numerology": 71, "dob_numerology": 4, "personal_numerology": 3, "current_year_numerology": 10}
+        {"name": "Jane Doe", "dob": "1995-06-15", "name_numerology": 54, "dob_numerology": 36, "personal_numerology": 9, "current_year_numerology": 10}
+        ```
+    """
+    results = NUMEROLOGY_READER.calculate_bulk(
+        ((record.name, record.dob) for record in request.records), explain=request.explain
+    )
+    return StreamingResponse(
+        (json.dumps(result, ensure_ascii=False) + "\n" for result in results), media_type="application/x-ndjson"
+    )
+
+
+@app.post("/predict/numerology-calculations/bulk/csv", tags=["Predict API"])
+async def predict_numerology_calculations_bulk_csv(request: Request, explain: bool = False) -> DuplexStreamingResponse:
+    """
+    | Method | Path                                        | Description                                 |
+    | ------ | ------------------------------------------- | ------------------------------------------- |
+    | `POST` | `/predict/numerology-calculations/bulk/csv` | Compute numerology numbers of a CSV upload  |
+
+    Params:
+        request (Request): A UTF-8 `text/csv` body with a header row containing `name` and `dob` columns.
+        explain (bool): Add the step-by-step formulas as `explanation_*` columns.
+
+    Returns:
+        DuplexStreamingResponse: A `text/csv` of the results, in upload order.
+
+    !!! note
+        The upload is processed while it streams in and results stream back as soon as they are computed,
+        so arbitrarily large files never sit in memory. Columns other than `name` and `dob` are ignored.
+        Rows with an invalid `dob` have the `error` column set. A missing header fails the stream with an
+        `error` row.
+
+    !!! example "Example Request"
+
+        ```
+        name,dob
+        John Doe,2000-01-01
+        Jane Doe,1995-06-15
+        ```
+
+    !!! example "Example Response"
+
+        ```
+        name,dob,name_numerology,dob_numerology,personal_numerology,current_year_numerology,error
+        John Doe,2000-01-01,71,4,3,10,
+        Jane Doe,1995-06-15,54,36,9,10,
+        ```
+    """
+
+    async def rows() -> AsyncIterator[str]:
+        yield format_csv([], explain=explain)
+        try:
+            async for records in read_csv_records(request.stream()):
+                yield format_csv(NUMEROLOGY_READER.calculate_bulk(records, explain=explain), explain, header=False)
+        except ValueError as e:
+            yield format_csv([{"error": str(e)}], explain, header=False)
+
+    return DuplexStreamingResponse(rows(), media_type="text/csv")
+
+
+@app.post("/predict/full-reading", response_model=FullReadingAPIResponse, tags=["Predict API"])
+async def predict_full_reading(request: FullReadingAPIRequest) -> FullReadingAPIResponse:
+    """
+    | Method | Path                    | Description                                                    |
+    | ------ | ----------------------- | -------------------------------------------------------------- |
+    | `POST` | `/predict/full-reading` | Numerology, card draw and tarot interpretations in one request |
+
+    Params:
+        request (FullReadingAPIRequest): The request object containing the name, dob, question and options.
+
+    Returns:
+        FullReadingAPIResponse: The numerology meaning, the three drawn cards, their interpretations and summary.
+
+    !!! note
+        Replaces the `/predict/numerology-interpretations` -> `/tarot-cards/draw` -> `/predict/tarot-interpretations`
+        sequence. The numerology seed and the past/present/future cards are computed locally, then the numerology
+        and tarot LLM calls run concurrently. With `save` set, the reading is stored like `/readings/save` and its
+        `reading_id` is returned.
+
+    !!! example "Example Request"
+
+        ```json
+        {
+            "name": "John Doe",
+            "dob": "2000-01-01",
+            "question": "Will my current love last forever?",
+            "follow_numerology": true,
+            "save": true
+        }
+        ```
+
+    !!! example "Example Response"
+
+        ```json
+        {
+            "numerology_meaning": "...",
+            "cards": [
+                {"name": "Nine of Swords", "is_upright": false, "image_url": "/tarot-cards/images/45.jpg", ...},
+                {"name": "The Empress", "is_upright": false, "image_url": "/tarot-cards/images/4.jpg", ...},
+                {"name": "Four of Wands", "is_upright": true, "image_url": "/tarot-cards/images/54.jpg", ...}
+            ],
+            "interpretations": [...],
+            "summary": "...",
+            "reading_id": "0b6f1f7e-..."
+        }
+        ```
+    """
+    try:
+        with server_timing("numerology"):
+            seed = NUMEROLOGY_READER.calculate(request.name, request.dob)["personal_numerology"]
+        past_card, present_card, future_card = cards = TarotDeck(seed=seed if request.follow_numerology else None).draw(
+            count=3
+        )
+
+        numerology_meaning, (interpretations, summary) = await asyncio.gather(
+            NUMEROLOGY_READER.analyze(
+                name=request.name,
+                dob=request.dob,
+                question=request.question,
+                use_cache=not request.bypass_cache,
+            ),
+            TAROT_READER.generate_reading(
+                name=request.name,
+                question=request.question,
+                past_card=past_card,
+                present_card=present_card,
+                future_card=future_card,
+                use_cache=not request.bypass_cache,
+            ),
+        )
+
+        reading_id = None
+        if request.save:
+            # Only saving needs the database; read-only readings never create the engine or a session.
+            async with _db().get_db_context() as db:
+                reading_id = await _db().create_reading(
+                    db=db,
+                    user_name=request.name,
+                    user_dob=date.fromisoformat(request.dob),
+                    question=request.question,
+                    cards=cards,
+                    interpretations=interpretations,
+                    summary=summary,
+                    numerology_meaning=numerology_meaning,
+                )
+
+        return FullReadingAPIResponse(
+            numerology_meaning=numerology_meaning,
+            cards=cards,
+            interpretations=interpretations,
+            summary=summary,
+            reading_id=reading_id,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal Server Error: {str(e)}")
+
+
+@app.get("/metrics", response_class=PlainTextResponse, tags=["Ops API"], dependencies=[Depends(require_admin_token)])
+async def metrics() -> PlainTextResponse:
+    """
+    | Method | Path       | Description                                |
+    | ------ | ---------- | ------------------------------------------ |
+    | `GET`  | `/metrics` | Prometheus metrics of the API and LLM usage |
+
+    Returns:
+        PlainTextResponse: Metrics in the Prometheus text exposition format.
+
+    !!! note
+        Exposes request latency per route, LLM call latency per model and outcome, tokens in and out,
+        fallbacks, structured output validation failures and database timings. Set `METRICS_MULTIPROC_DIR`
+        to a directory shared by all workers to aggregate their metrics in every scrape. Like every ops
+        endpoint except the readiness probe, it requires an `X-Admin-Token` header matching `ADMIN_TOKEN`.
+    """
+    return PlainTextResponse(METRICS.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get(
+    "/ops/profiles/{profile_id}",
+    response_class=PlainTextResponse,
+    tags=["Ops API"],
+    dependencies=[Depends(require_admin_token)],
+)
+async def get_profile(profile_id: str) -> PlainTextResponse:
+    """
+    | Method | Path                         | Description                    |
+    | ------ | ---------------------------- | ------------------------------ |
+    | `GET`  | `/ops/profiles/{profile_id}` | Download a stored request profile |
+
+    Params:
+        profile_id (str): The `X-Profile-Id` returned by the profiled request.
+
+    Returns:
+        PlainTextResponse: Stack samples in the collapsed format, one `frame;frame;frame count` per line.
+
+    !!! note
+        Any request sent with `X-Profile: 1` and a valid `X-Admin-Token` header runs under a sampling profiler.
+        Its response carries the `X-Profile-Id` to download here; feed the file to `flamegraph.pl` or speedscope.
+    """
+    profile = load_profile(Path(PROFILE_DIR), profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(profile)
+
+
+@app.get("/healthz/ready", tags=["Ops API"])
+async def readiness() -> JSONResponse:
+    """
+    | Method | Path             | Description                          |
+    | ------ | ---------------- | ------------------------------------ |
+    | `GET`  | `/healthz/ready` | Readiness probe for load balancers   |
+
+    Returns:
+        `200` once every required warmup step has succeeded (or when warmup is disabled), `503` until then.
+
+    !!! note
+        Warmup loads the card catalog, opens `WARMUP_DB_CONNECTIONS` database connections with the hot
+        `get_reading` statement prepared, and opens a keep-alive connection to the LLM provider. Failed steps
+        listed in `WARMUP_REQUIRED_STEPS` (all but `llm_connection` by default) are retried every `WARMUP_RETRY_SECONDS`
+        and keep the worker out of rotation; other steps are best-effort.
+
+    !!! example "Example Response"
+
+        ```json
+        {
+            "ready": true,
+            "state": "ready",
+            "seconds": 0.4213,
+            "steps": {
+                "card_catalog": {"ok": true, "required": true, "attempts": 1, "seconds": 0.0121, "error": null},
+                "database": {"ok": true, "required": true, "attempts": 1, "seconds": 0.1873, "error": null},
+                "llm_connection": {"ok": true, "required": false, "attempts": 1, "seconds": 0.4209, "error": null}
+            }
+        }
+        ```
+    """
+    status = WARMUP.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503, headers={"Cache-Control": "no-store"})
+
+
+@app.get("/ops/response-cache", tags=["Ops API"], dependencies=[Depends(require_admin_token)])
+async def response_cache_stats() -> dict:
+    """Hit/miss counters and occupancy of the LLM response caches."""
+    return {
+        "tarot": await TarotReader.cache.stats() if TarotReader.cache else None,
+        "numerology": await NumerologyReader.cache.stats() if NumerologyReader.cache else None,
+    }
+
+
+@app.get("/ops/reading-cache", tags=["Ops API"], dependencies=[Depends(require_admin_token)])
+async def reading_cache_stats() -> dict:
+    """Hit/miss counters and occupancy of the rendered saved-reading cache."""
+    return _db().READING_CACHE.stats()
+
+
+@app.get("/ops/db-pool", tags=["Ops API"], dependencies=[Depends(require_admin_token)])
+async def db_pool_stats() -> dict:
+    """Deployment mode, pool strategy, connections in use and lifetime pool event counters."""
+    return _db().pool_stats()
+
+
+@app.get("/ops/llm-transport", tags=["Ops API"], dependencies=[Depends(require_admin_token)])
+async def llm_transport_stats() -> dict:
+    """Connection pool limits, timeouts and retry budget of the LLM HTTP client."""
+    from api.llm_client import transport_stats
+
+    return {"client_created": "OPENAI_BASE_CLIENT" in vars(config), **transport_stats()}
+
+
+@app.get("/ops/models", tags=["Ops API"], dependencies=[Depends(require_admin_token)])
+async def model_health() -> dict:
+    """Circuit breaker state, rolling error rate and latency of every LLM model."""
+    return {
+        "tarot": {"order": TarotReader.health.order(TarotReader.models), "models": TarotReader.health.snapshot()},
+        "numerology": {
+            "order": NumerologyReader.health.order(NumerologyReader.models),
+            "models": NumerologyReader.health.snapshot(),
+        },
+    }
+
+
+@app.get("/ops/admission", tags=["Ops API"], dependencies=[Depends(require_admin_token)])
+async def admission_stats() -> dict:
+    """Concurrency slots in use, queue depth, rejections and queue wait times of every LLM model."""
+    return {
+        "tarot": TarotReader.admission.stats(),
+        "numerology": NumerologyReader.admission.stats(),
+    }
+
+
+@app.get("/ops/single-flight", tags=["Ops API"], dependencies=[Depends(require_admin_token)])
+async def single_flight_stats() -> dict:
+    """How many LLM calls were saved by coalescing identical in-flight requests."""
+    return {
+        "tarot": TarotReader.single_flight.stats(),
+        "numerology": NumerologyReader.single_flight.stats(),
+    }
+
+
 @app.post("/tarot-cards/draw", response_model=CardsAPIResponse, tags=["Tarot Cards API"])
 async def draw_cards(request: CardsAPIRequest) -> CardsAPIResponse:
     """
@@ -231,18 +787,61 @@ async def draw_cards(request: CardsAPIRequest) -> CardsAPIResponse:
         }
         ```
     """
-    if request.follow_numerology:
-        universe_number = NUMEROLOGY_READER.calculate(request.name, request.dob)["personal_numerology"]
-    else:
-        universe_number = None
-
-    tarot_deck = TarotDeck(seed=universe_number)
+    with server_timing("numerology"):
+        seed = _draw_seed(request)
+    tarot_deck = TarotDeck(seed=seed)
     shuffled_cards = tarot_deck.draw(count=request.count)
     return CardsAPIResponse(cards=shuffled_cards)
 
 
+@app.post("/tarot-cards/draw/batch", response_model=CardsBatchAPIResponse, tags=["Tarot Cards API"])
+def draw_cards_batch(request: CardsBatchAPIRequest, accept: Optional[str] = Header(default=None)) -> Response:
+    """
+    | Method | Path                       | Description                                       |
+    | ------ | -------------------------- | ------------------------------------------------- |
+    | `POST` | `/tarot-cards/draw/batch`  | Get many hands of shuffled tarot cards at once    |
+
+    Params:
+        request (CardsBatchAPIRequest): Up to 10,000 draw requests, each like a `/tarot-cards/draw` request.
+
+    Returns:
+        CardsBatchAPIResponse: One hand per request, in request order.
+
+    !!! note
+        Send `Accept: application/x-ndjson` to stream the hands back as newline-delimited JSON,
+        one `CardsAPIResponse` object per line, instead of a single `CardsBatchAPIResponse` document.
+
+    !!! example "Example Request"
+
+        ```json
+        {
+            "requests": [
+                {"name": "John Doe", "dob": "2000-01-01", "count": 3, "follow_numerology": true},
+                {"name": "Jane Doe", "dob": "1995-06-15", "count": 3, "follow_numerology": false}
+            ]
+        }
+        ```
+
+    !!! example "Example Response"
+
+        ```json
+        {
+            "hands": [
+                {"cards": [{"name": "Eight of Pentacles", "is_upright": false, ...}, ...]},
+                {"cards": [{"name": "King of Cups", "is_upright": true, ...}, ...]}
+            ]
+        }
+        ```
+    """
+    hands = TarotDeck.draw_batch((_draw_seed(entry), entry.count) for entry in request.requests)
+
+    if accept and "application/x-ndjson" in accept:
+        return StreamingResponse((hand + b"\n" for hand in hands), media_type="application/x-ndjson")
+    return Response(content=b'{"hands":[' + b",".join(hands) + b"]}", media_type="application/json")
+
+
 @app.get("/tarot-cards/get-card-info", response_model=CardInfoAPIResponse, tags=["Tarot Cards API"])
-def get_card_info(card_number: int) -> CardInfoAPIResponse:
+def get_card_info(card_number: int, if_none_match: Optional[str] = Header(default=None)) -> Response:
     """
     | Method | Path                                  | Description                                 |
     | ------ | ------------------------------------- | ------------------------------------------- |
@@ -255,7 +854,8 @@ def get_card_info(card_number: int) -> CardInfoAPIResponse:
         CardInfoAPIResponse: The response object containing the card info.
 
     !!! note
-        This function uses the `TarotDeck` class to get the card info.
+        This function uses the `TarotDeck` class to get the card info. Responses are pre-rendered once per
+        process and carry a strong `ETag`; send it back in `If-None-Match` to get an empty `304 Not Modified`.
 
     !!! example "Example Response"
 
@@ -282,14 +882,18 @@ def get_card_info(card_number: int) -> CardInfoAPIResponse:
         raise HTTPException(status_code=400, detail="Card number must be between 1 and 78")
 
     tarot_deck = TarotDeck()
-    card_info = tarot_deck.get_card_info(card_number)
-    return CardInfoAPIResponse(**card_info)
+    payload = tarot_deck.get_card_info_payload(card_number)
+    headers = {"ETag": payload.etag, "Cache-Control": tarot_deck.card_info_cache_control}
+
+    if _etag_matches(if_none_match, payload.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
 
 
 @app.post("/readings/save", response_model=SaveReadingResponse, tags=["Readings API"])
-async def save_reading(request: SaveReadingRequest, db: AsyncSession = Depends(get_db)) -> SaveReadingResponse:
+async def save_reading(request: SaveReadingRequest, db: "AsyncSession" = Depends(get_db)) -> SaveReadingResponse:
     try:
-        reading_id = await create_reading(
+        reading_id = await _db().create_reading(
             db=db,
             user_name=request.user_name,
             user_dob=request.user_dob,
@@ -306,46 +910,96 @@ async def save_reading(request: SaveReadingRequest, db: AsyncSession = Depends(g
         raise HTTPException(status_code=500, detail=f"Failed to save reading: {str(e)}")
 
 
+@app.get("/readings", response_model=ReadingListResponse, tags=["Readings API"])
+async def list_user_readings(
+    user_name: str,
+    user_dob: date,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    db: "AsyncSession" = Depends(get_db),
+) -> ReadingListResponse:
+    """
+    | Method | Path        | Description                                 |
+    | ------ | ----------- | ------------------------------------------- |
+    | `GET`  | `/readings` | List a user's saved readings, newest first  |
+
+    Params:
+        user_name (str): The name the readings were saved with.
+        user_dob (date): The date of birth the readings were saved with.
+        limit (int): Page size (Range: 1-100, default 20).
+        cursor (str): `next_cursor` of the previous page; omit for the first page.
+
+    Returns:
+        ReadingListResponse: One page of readings and the cursor of the next page (`null` on the last page).
+
+    !!! note
+        Pages are cursor-based (keyset) rather than offset-based, so fetching a deep page costs the same as
+        the first one and readings saved while paging never shift the results.
+
+    !!! example "Example Response"
+
+        ```json
+        {
+            "readings": [
+                {
+                    "reading_id": "0b6f1f7e-...",
+                    "question": "What should I focus on this month?",
+                    "created_at": "2025-01-01T12:00:00Z"
+                }
+            ],
+            "next_cursor": "MjAyNS0wMS0wMVQxMjowMDowMCswMDowMHwwYjZmMWY3ZS0uLi4"
+        }
+        ```
+    """
+    try:
+        before = _db().decode_reading_cursor(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    rows, after = await _db().list_readings(db, user_name, user_dob, limit, before)
+    return ReadingListResponse(
+        readings=[
+            ReadingListItem(reading_id=row.reading_id, question=row.question_text, created_at=row.created_at)
+            for row in rows
+        ],
+        next_cursor=_db().encode_reading_cursor(*after) if after else None,
+    )
+
+
 @app.get("/readings/{reading_id}", response_model=GetReadingResponse, tags=["Readings API"])
-async def get_reading_by_id(reading_id: UUID, db: AsyncSession = Depends(get_db)) -> GetReadingResponse:
-    reading = await get_reading(db, reading_id)
+async def get_reading_by_id(
+    reading_id: UUID, if_none_match: Optional[str] = Header(default=None), db: "AsyncSession" = Depends(get_db)
+) -> Response:
+    """
+    | Method | Path                     | Description           |
+    | ------ | ------------------------ | --------------------- |
+    | `GET`  | `/readings/{reading_id}` | Get a saved reading   |
 
-    if not reading:
-        raise HTTPException(status_code=404, detail="Reading not found")
+    Params:
+        reading_id (UUID): The id returned when the reading was saved.
 
-    cards = [
-        ReadingCardResponse(
-            position=card.card_position_text,
-            card_name=card.card_name,
-            is_upright=card.is_upright,
-            image_url=card.card_image_url,
-            full_card_name=card.full_card_name,
-        )
-        for card in reading.cards
-    ]
-
-    interpretations = [
-        CardInterpretationResponse(
-            card_name=interp.card_name,
-            position=interp.card_position_text,
-            orientation=interp.card_orientation_text,
-            meaning=interp.meaning_text,
-        )
-        for interp in reading.interpretations
-    ]
-
-    return GetReadingResponse(
-        reading_id=reading.reading_id,
-        user_name=reading.user_name,
-        user_dob=reading.user_birth_date,
-        question=reading.question_text,
-        cards=cards,
-        interpretations=interpretations,
-        summary=reading.summary.summary_text if reading.summary else "",
-        numerology_meaning=reading.numerology.meaning_text if reading.numerology else None,
-        created_at=reading.created_at,
+    Returns:
+        GetReadingResponse: The saved reading.
+
+    !!! note
+        The reading is fetched as one JSON document in a single query and its rendered response is kept in a
+        bounded in-process cache, since saved readings never change. Responses carry a strong `ETag`; send it
+        back in `If-None-Match` to get an empty `304 Not Modified`.
+    """
+    db_layer = _db()
+    payload = await db_layer.READING_CACHE.get_or_load(
+        reading_id, lambda: db_layer.get_reading_document(db, reading_id)
     )
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Reading not found")
+
+    headers = {"ETag": payload.etag, "Cache-Control": READING_CACHE_CONTROL}
+    if _etag_matches(if_none_match, payload.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(app, host="0.0.0.0", reload=True)
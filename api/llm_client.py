@@ -0,0 +1,188 @@
+import importlib.util
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import httpx
+import openai
+
+from api.config import (
+    LLM_CONNECT_TIMEOUT_SECONDS,
+    LLM_HTTP2,
+    LLM_HTTP_KEEPALIVE_SECONDS,
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_HTTP_MAX_KEEPALIVE,
+    LLM_POOL_TIMEOUT_SECONDS,
+    LLM_READ_TIMEOUT_SECONDS,
+    LLM_RETRY_BUDGET_MIN_PER_SECOND,
+    LLM_RETRY_BUDGET_RATIO,
+    LLM_SDK_MAX_RETRIES,
+    LLM_WRITE_TIMEOUT_SECONDS,
+    OPENAI_API_KEY,
+    OPENAI_BASE_URL,
+)
+from api.metrics import LLM_HTTP_RETRIES
+
+logger = logging.getLogger(__name__)
+
+
+class RetryBudget:
+    """
+    Token bucket capping transport retries to a fraction of requests.
+
+    Every request deposits `ratio` tokens and every retry spends one, so in steady state at most `ratio`
+    of requests are retried; `min_per_second` keeps a few retries available at low traffic. When the
+    provider is down the budget drains and failures go straight to the model fallback instead of
+    multiplying the load.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_per_second: float = 1.0, window_seconds: float = 10.0) -> None:
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.capacity = max(1.0, min_per_second * window_seconds)
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._refill()
+            self.requests += 1
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one retry; False when the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                self.exhausted += 1
+                return False
+            self._tokens -= 1
+            self.retries += 1
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._refill()
+            return {
+                "ratio": self.ratio,
+                "min_per_second": self.min_per_second,
+                "tokens": round(self._tokens, 2),
+                "capacity": self.capacity,
+                "requests": self.requests,
+                "retries": self.retries,
+                "exhausted": self.exhausted,
+            }
+
+
+class RetryBudgetTransport(httpx.AsyncBaseTransport):
+    """
+    Retries requests that never reached the provider, within a `RetryBudget`.
+
+    Only connection failures are retried: the request was not sent, so repeating it cannot bill a
+    completion twice. Anything else is left to the model fallback chain.
+    """
+
+    retryable = (httpx.ConnectError, httpx.ConnectTimeout)
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, budget: RetryBudget) -> None:
+        self.transport = transport
+        self.budget = budget
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.budget.deposit()
+        try:
+            return await self.transport.handle_async_request(request)
+        except self.retryable as e:
+            if not self.budget.withdraw():
+                LLM_HTTP_RETRIES.inc("exhausted")
+                raise
+            LLM_HTTP_RETRIES.inc("retried")
+            logger.info(f"Retrying {request.method} {request.url.path} after {type(e).__name__}")
+            return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+@lru_cache(maxsize=None)
+def http2_enabled(setting: str = LLM_HTTP2) -> bool:
+    """Resolve the `LLM_HTTP2` setting (`auto`, `true` or `false`) against the installed `h2` package."""
+    available = importlib.util.find_spec("h2") is not None
+    setting = setting.lower()
+    if setting == "auto":
+        return available
+    if setting in ("1", "true", "yes"):
+        if not available:
+            logger.warning("LLM_HTTP2 is enabled but the `h2` package is not installed, using HTTP/1.1")
+        return available
+    return False
+
+
+LLM_RETRY_BUDGET = RetryBudget(LLM_RETRY_BUDGET_RATIO, LLM_RETRY_BUDGET_MIN_PER_SECOND)
+
+
+def build_http_client(budget: Optional[RetryBudget] = LLM_RETRY_BUDGET) -> httpx.AsyncClient:
+    """
+    HTTP client for LLM calls.
+
+    The pool is sized for every model's admission slots at once (hedged attempts overlap), idle
+    connections are kept long enough to survive gaps between requests, and each timeout phase is bounded
+    separately. HTTP/2, when available, multiplexes concurrent calls over fewer connections.
+    """
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        http2=http2_enabled(),
+        limits=httpx.Limits(
+            max_connections=LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=LLM_HTTP_KEEPALIVE_SECONDS,
+        ),
+    )
+    if budget is not None:
+        transport = RetryBudgetTransport(transport, budget)
+    return openai.DefaultAsyncHttpxClient(
+        transport=transport,
+        timeout=httpx.Timeout(
+            connect=LLM_CONNECT_TIMEOUT_SECONDS,
+            read=LLM_READ_TIMEOUT_SECONDS,
+            write=LLM_WRITE_TIMEOUT_SECONDS,
+            pool=LLM_POOL_TIMEOUT_SECONDS,
+        ),
+    )
+
+
+def build_openai_client(http_client: Optional[httpx.AsyncClient] = None) -> openai.AsyncOpenAI:
+    """OpenAI client on the tuned transport, without SDK retries stacked on top of the model fallback."""
+    return openai.AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        base_url=OPENAI_BASE_URL,
+        max_retries=LLM_SDK_MAX_RETRIES,
+        http_client=http_client or build_http_client(),
+    )
+
+
+def transport_stats() -> Dict[str, Any]:
+    return {
+        "http2": http2_enabled(),
+        "max_connections": LLM_HTTP_MAX_CONNECTIONS,
+        "max_keepalive_connections": LLM_HTTP_MAX_KEEPALIVE,
+        "keepalive_seconds": LLM_HTTP_KEEPALIVE_SECONDS,
+        "timeouts": {
+            "connect": LLM_CONNECT_TIMEOUT_SECONDS,
+            "read": LLM_READ_TIMEOUT_SECONDS,
+            "write": LLM_WRITE_TIMEOUT_SECONDS,
+            "pool": LLM_POOL_TIMEOUT_SECONDS,
+        },
+        "sdk_max_retries": LLM_SDK_MAX_RETRIES,
+        "retry_budget": LLM_RETRY_BUDGET.stats(),
+    }
@@ -0,0 +1,330 @@
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from api.config import METRICS_FLUSH_SECONDS, METRICS_MULTIPROC_DIR
+
+logger = logging.getLogger(__name__)
+
+Labels = Tuple[str, ...]
+
+
+class _Metric(ABC):
+    """
+    Base of in-process metrics.
+
+    Every thread writes to its own shard, so updates never take a lock and never race; shards are only
+    merged when the metrics are scraped.
+    """
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[Dict[Labels, Any]] = []
+        self._register_lock = threading.Lock()
+
+    def _shard(self) -> Dict[Labels, Any]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            with self._register_lock:
+                self._shards.append(shard)
+        return shard
+
+    def _labels(self, values: Sequence[Any]) -> Labels:
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {values}")
+        return tuple(str(value) for value in values)
+
+    @abstractmethod
+    def _merge(self, current: Any, value: Any) -> Any: ...
+
+    def collect(self) -> Dict[Labels, Any]:
+        """Merge every thread's shard into one sample per label set."""
+        with self._register_lock:
+            shards = list(self._shards)
+        samples: Dict[Labels, Any] = {}
+        for shard in shards:
+            for labels, value in dict(shard).items():
+                samples[labels] = self._merge(samples.get(labels), value)
+        return samples
+
+    def describe(self) -> Dict[str, Any]:
+        return {"kind": self.kind, "help": self.help, "labelnames": list(self.labelnames)}
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: Any, amount: float = 1) -> None:
+        shard = self._shard()
+        key = self._labels(labels)
+        shard[key] = shard.get(key, 0) + amount
+
+    def _merge(self, current: Optional[float], value: float) -> float:
+        return (current or 0) + value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: Any) -> None:
+        shard = self._shard()
+        key = self._labels(labels)
+        # Per-bucket counts (the last one is +Inf) followed by the sum of observed values.
+        sample = shard.get(key)
+        if sample is None:
+            sample = shard[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        sample[bisect_left(self.buckets, value)] += 1
+        sample[-1] += value
+
+    @contextmanager
+    def time(self, *labels: Any) -> Iterator[None]:
+        """Observe how long the block took."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def _merge(self, current: Optional[List[float]], value: List[float]) -> List[float]:
+        if current is None:
+            return list(value)
+        return [a + b for a, b in zip(current, value)]
+
+    def describe(self) -> Dict[str, Any]:
+        return {**super().describe(), "buckets": list(self.buckets)}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _snapshot_running(path: Path) -> bool:
+    """Whether the worker that wrote a `metrics-<pid>.json` snapshot is still running."""
+    try:
+        pid = int(path.stem.removeprefix("metrics-"))
+        os.kill(pid, 0)
+    except ValueError:
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered in the Prometheus text exposition format.
+
+    With `multiproc_dir` set, every worker periodically writes its own snapshot into that directory and
+    a scrape of any worker merges the snapshots of all of them. A worker removes its snapshot when it
+    exits, and snapshots of workers that died without doing so are removed when found, so totals only
+    cover running workers.
+    """
+
+    def __init__(self, multiproc_dir: Optional[str] = None, flush_seconds: float = 5.0) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self.multiproc_dir = Path(multiproc_dir) if multiproc_dir else None
+        self.flush_seconds = flush_seconds
+        self._flusher: Optional[threading.Thread] = None
+        self._stop_flusher = threading.Event()
+
+    def _register(self, metric: _Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = ()
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable state of every metric in this process."""
+        return {
+            name: {
+                **metric.describe(),
+                "samples": [[list(labels), value] for labels, value in metric.collect().items()],
+            }
+            for name, metric in self._metrics.items()
+        }
+
+    def _snapshot_path(self) -> Path:
+        return self.multiproc_dir / f"metrics-{os.getpid()}.json"
+
+    def write_snapshot(self) -> None:
+        """Publish this worker's metrics for the other workers to aggregate."""
+        if not self.multiproc_dir:
+            return
+        self.multiproc_dir.mkdir(parents=True, exist_ok=True)
+        path = self._snapshot_path()
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self.snapshot()))
+        os.replace(tmp_path, path)
+
+    def remove_snapshot(self) -> None:
+        """Stop publishing this worker's metrics and delete its snapshot."""
+        self._stop_flusher.set()
+        if self._flusher:
+            self._flusher.join(timeout=self.flush_seconds)
+        if self.multiproc_dir:
+            self._snapshot_path().unlink(missing_ok=True)
+
+    def remove_stale_snapshots(self) -> None:
+        """Delete the snapshots of workers that are no longer running."""
+        if not self.multiproc_dir or not self.multiproc_dir.is_dir():
+            return
+        for path in self.multiproc_dir.glob("metrics-*.json"):
+            if not _snapshot_running(path):
+                path.unlink(missing_ok=True)
+
+    def start_flusher(self) -> None:
+        """
+        Write snapshots in the background so idle workers still report their totals.
+
+        Called when the app starts rather than on import, so importing the metrics never starts a thread.
+        """
+        if not self.multiproc_dir or self._flusher:
+            return
+
+        def flush_forever() -> None:
+            while not self._stop_flusher.wait(self.flush_seconds):
+                try:
+                    self.write_snapshot()
+                except Exception as e:
+                    logger.warning(f"Failed to write metrics snapshot: {e}")
+
+        self.remove_stale_snapshots()
+        self._flusher = threading.Thread(target=flush_forever, name="metrics-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.remove_snapshot)
+
+    def _aggregate(self) -> Dict[str, Any]:
+        merged = self.snapshot()
+        if not self.multiproc_dir:
+            return merged
+
+        own_path = self._snapshot_path()
+        for path in self.multiproc_dir.glob("metrics-*.json"):
+            if path == own_path:
+                continue
+            if not _snapshot_running(path):
+                logger.info(f"Removing metrics snapshot of stopped worker {path}")
+                path.unlink(missing_ok=True)
+                continue
+            try:
+                other = json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable metrics snapshot {path}: {e}")
+                continue
+
+            for name, data in other.items():
+                metric = self._metrics.get(name)
+                if metric is None:
+                    continue
+                samples = {tuple(labels): value for labels, value in merged[name]["samples"]}
+                for labels, value in data["samples"]:
+                    samples[tuple(labels)] = metric._merge(samples.get(tuple(labels)), value)
+                merged[name]["samples"] = [[list(labels), value] for labels, value in samples.items()]
+        return merged
+
+    def render(self) -> str:
+        """Render all metrics, aggregated across workers when enabled."""
+        lines = []
+        for name, data in self._aggregate().items():
+            lines.append(f"# HELP {name} {data['help']}")
+            lines.append(f"# TYPE {name} {data['kind']}")
+            labelnames = data["labelnames"]
+            for labels, value in sorted(data["samples"]):
+                if data["kind"] == "counter":
+                    lines.append(f"{name}{_format_labels(labelnames, labels)} {_format_value(value)}")
+                    continue
+
+                cumulative = 0
+                for bound, count in zip([*data["buckets"], "+Inf"], value[:-1]):
+                    cumulative += count
+                    le = f'le="{bound}"'
+                    lines.append(f"{name}_bucket{_format_labels(labelnames, labels, le)} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labelnames, labels)} {_format_value(value[-1])}")
+                lines.append(f"{name}_count{_format_labels(labelnames, labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry(multiproc_dir=METRICS_MULTIPROC_DIR, flush_seconds=METRICS_FLUSH_SECONDS)
+
+HTTP_REQUEST_SECONDS = METRICS.histogram(
+    "http_request_duration_seconds",
+    "Time to produce the response headers, per route.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+LLM_CALL_SECONDS = METRICS.histogram(
+    "llm_call_duration_seconds",
+    "Latency of a single LLM call, per reader, model and outcome (ok, error, invalid, cancelled).",
+    ["reader", "model", "outcome"],
+    buckets=(0.5, 1, 2, 5, 10, 15, 20, 30, 45, 60, 90, 120),
+)
+LLM_TOKENS = METRICS.counter(
+    "llm_tokens_total",
+    "Tokens billed by the LLM provider, per reader, model and direction (in, out).",
+    ["reader", "model", "direction"],
+)
+LLM_FALLBACKS = METRICS.counter(
+    "llm_fallbacks_total",
+    "Times a model in the chain was given up on, per model and reason (failed, slow, deadline when it was skipped).",
+    ["model", "reason"],
+)
+LLM_VALIDATION_FAILURES = METRICS.counter(
+    "llm_validation_failures_total",
+    "LLM responses rejected by structured output validation, per reader and model.",
+    ["reader", "model"],
+)
+LLM_HTTP_RETRIES = METRICS.counter(
+    "llm_http_retries_total",
+    "Connection failures to the LLM provider, per outcome (retried, exhausted when the retry budget is spent).",
+    ["outcome"],
+)
+DB_QUERY_SECONDS = METRICS.histogram(
+    "db_query_duration_seconds",
+    "Time spent in database round-trips, per CRUD operation and step.",
+    ["operation", "step"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+DB_POOL_EVENTS = METRICS.counter(
+    "db_pool_events_total",
+    "Connection pool events (connect, checkout, checkin, invalidate).",
+    ["event"],
+)
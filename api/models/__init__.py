@@ -2,16 +2,25 @@ from .api import (
     CardInfoAPIResponse,
     CardsAPIRequest,
     CardsAPIResponse,
+    CardsBatchAPIRequest,
+    CardsBatchAPIResponse,
+    FullReadingAPIRequest,
+    FullReadingAPIResponse,
     NumerologyAPIRequest,
     NumerologyAPIResponse,
+    NumerologyBulkAPIRequest,
+    NumerologyBulkRecord,
+    NumerologyBulkResult,
     TarotAPIRequest,
     TarotAPIResponse,
 )
-from .llm import NumerologyLLMResponse, TarotLLMResponse
+from .llm import NumerologyInsightLLMResponse, NumerologyLLMResponse, TarotLLMResponse
 from .reading import (
     CardInterpretationResponse,
     GetReadingResponse,
     ReadingCardResponse,
+    ReadingListItem,
+    ReadingListResponse,
     SaveReadingRequest,
     SaveReadingResponse,
 )
@@ -20,18 +29,28 @@ from .tarot import TarotCard, TarotInterpretation
 __all__ = [
     "CardsAPIRequest",
     "CardsAPIResponse",
+    "CardsBatchAPIRequest",
+    "CardsBatchAPIResponse",
     "TarotAPIRequest",
     "TarotAPIResponse",
     "TarotCard",
     "TarotInterpretation",
     "TarotLLMResponse",
     "NumerologyLLMResponse",
+    "NumerologyInsightLLMResponse",
     "NumerologyAPIRequest",
     "NumerologyAPIResponse",
+    "NumerologyBulkRecord",
+    "NumerologyBulkAPIRequest",
+    "NumerologyBulkResult",
+    "FullReadingAPIRequest",
+    "FullReadingAPIResponse",
     "CardInfoAPIResponse",
     "SaveReadingRequest",
     "SaveReadingResponse",
     "GetReadingResponse",
+    "ReadingListItem",
+    "ReadingListResponse",
     "ReadingCardResponse",
     "CardInterpretationResponse",
 ]
@@ -1,6 +1,7 @@
 from typing import Dict, List, Optional
+from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from api.models.tarot import TarotCard, TarotInterpretation
 
@@ -13,6 +14,7 @@ class TarotAPIRequest(BaseModel):
     past_card: TarotCard
     present_card: TarotCard
     future_card: TarotCard
+    bypass_cache: bool = False
 
 
 class TarotAPIResponse(BaseModel):
@@ -24,6 +26,7 @@ class NumerologyAPIRequest(BaseModel):
     name: str
     dob: str
     question: str
+    bypass_cache: bool = False
 
     @field_validator("dob")
     def validate_dob_format(cls, value: str) -> str:
@@ -34,6 +37,48 @@ class NumerologyAPIResponse(BaseModel):
     numerology_meaning: str
 
 
+class NumerologyBulkRecord(BaseModel):
+    name: str
+    dob: str
+
+
+class NumerologyBulkAPIRequest(BaseModel):
+    records: List[NumerologyBulkRecord] = Field(max_length=100_000)
+    explain: bool = False
+
+
+class NumerologyBulkResult(BaseModel):
+    name: str
+    dob: str
+    name_numerology: Optional[int] = None
+    dob_numerology: Optional[int] = None
+    personal_numerology: Optional[int] = None
+    current_year_numerology: Optional[int] = None
+    explanation: Optional[Dict[str, str]] = None
+    error: Optional[str] = None
+
+
+class FullReadingAPIRequest(BaseModel):
+    name: str
+    dob: str
+    question: str
+    follow_numerology: bool = True
+    save: bool = False
+    bypass_cache: bool = False
+
+    @field_validator("dob")
+    def validate_dob_format(cls, value: str) -> str:
+        return validate_date_string_format(value)
+
+
+class FullReadingAPIResponse(BaseModel):
+    numerology_meaning: str
+    cards: List[TarotCard]
+    interpretations: List[TarotInterpretation]
+    summary: str
+    reading_id: Optional[UUID] = None
+
+
 class CardsAPIRequest(BaseModel):
     name: str
     dob: str
@@ -49,6 +94,14 @@ class CardsAPIResponse(BaseModel):
     cards: List[TarotCard]
 
 
+class CardsBatchAPIRequest(BaseModel):
+    requests: List[CardsAPIRequest] = Field(max_length=10_000)
+
+
+class CardsBatchAPIResponse(BaseModel):
+    hands: List[CardsAPIResponse]
+
+
 class CardInfoAPIResponse(BaseModel):
     name: str
     number: str
@@ -12,6 +12,14 @@ class NumerologyLLMResponse(BaseModel):
     )
 
 
+class NumerologyInsightLLMResponse(BaseModel):
+    """Structured response when the calculation breakdown is rendered locally."""
+
+    insight: str = Field(
+        description="Brief 2-3 sentence insight about what the numbers reveal, mentioning the cosmic signature for tarot"
+    )
+
+
 class TarotLLMResponse(BaseModel):
     past: str
     present: str
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from typing import List, Optional
 from uuid import UUID
 
@@ -47,3 +47,14 @@ class GetReadingResponse(BaseModel):
     summary: str
     numerology_meaning: Optional[str] = None
     created_at: str
+
+
+class ReadingListItem(BaseModel):
+    reading_id: UUID
+    question: str
+    created_at: datetime
+
+
+class ReadingListResponse(BaseModel):
+    readings: List[ReadingListItem]
+    next_cursor: Optional[str] = None
@@ -1,4 +1,21 @@
+from .admission import LLM_ADMISSION, AdmissionController, AdmissionPolicy
+from .cache import MemoryResponseCache, ResponseCache, SQLiteResponseCache
+from .fallback import HedgingPolicy
+from .health import MODEL_HEALTH, CircuitBreakerPolicy, ModelHealth
 from .numerology import NumerologyReader
 from .tarot import TarotReader
 
-__all__ = ["TarotReader", "NumerologyReader"]
+__all__ = [
+    "TarotReader",
+    "NumerologyReader",
+    "ResponseCache",
+    "MemoryResponseCache",
+    "SQLiteResponseCache",
+    "HedgingPolicy",
+    "ModelHealth",
+    "CircuitBreakerPolicy",
+    "MODEL_HEALTH",
+    "AdmissionController",
+    "AdmissionPolicy",
+    "LLM_ADMISSION",
+]
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+from api.config import LLM_MAX_CONCURRENCY, LLM_MAX_QUEUE, LLM_MAX_QUEUE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a model's wait queue is full or a caller waited longer than allowed."""
+
+    def __init__(self, model: str, reason: str, retry_after: int) -> None:
+        super().__init__(f"Model {model} is overloaded ({reason})")
+        self.model = model
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class AdmissionPolicy:
+    """Concurrency limit and bounded wait queue of a single model."""
+
+    max_concurrency: int = 16
+    max_queue: int = 64
+    max_queue_seconds: float = 10.0
+
+    @property
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.max_queue_seconds))
+
+
+class _Gate:
+    def __init__(self, policy: AdmissionPolicy) -> None:
+        self.policy = policy
+        self.semaphore = asyncio.Semaphore(policy.max_concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected_full = 0
+        self.rejected_timeout = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+
+class AdmissionController:
+    """
+    Per-model semaphores with a bounded, time-limited wait queue in front of LLM calls.
+
+    A call is admitted as soon as one of the model's `max_concurrency` slots is free. Otherwise it waits
+    in the queue for at most `max_queue_seconds`, and is rejected right away when `max_queue` callers are
+    already waiting, so overload surfaces as a fast 503 instead of piling up hung requests.
+    """
+
+    def __init__(
+        self, policy: AdmissionPolicy = AdmissionPolicy(), overrides: Optional[Dict[str, AdmissionPolicy]] = None
+    ) -> None:
+        self.policy = policy
+        self.overrides = overrides or {}
+        self._gates: Dict[str, _Gate] = {}
+
+    def _gate(self, model: str) -> _Gate:
+        gate = self._gates.get(model)
+        if gate is None:
+            gate = self._gates[model] = _Gate(self.overrides.get(model, self.policy))
+        return gate
+
+    @asynccontextmanager
+    async def slot(self, model: str) -> AsyncIterator[float]:
+        """Hold one of `model`'s concurrency slots, yielding how long the caller queued for it."""
+        gate = self._gate(model)
+        if gate.semaphore.locked() and gate.waiting >= gate.policy.max_queue:
+            gate.rejected_full += 1
+            raise AdmissionRejectedError(model, "queue full", gate.policy.retry_after)
+
+        gate.waiting += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(gate.semaphore.acquire(), timeout=gate.policy.max_queue_seconds)
+        except asyncio.TimeoutError:
+            gate.rejected_timeout += 1
+            raise AdmissionRejectedError(model, "queue timeout", gate.policy.retry_after)
+        finally:
+            gate.waiting -= 1
+
+        waited = time.perf_counter() - started
+        gate.admitted += 1
+        gate.active += 1
+        gate.wait_seconds_total += waited
+        gate.wait_seconds_max = max(gate.wait_seconds_max, waited)
+        try:
+            yield waited
+        finally:
+            gate.active -= 1
+            gate.semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, utilisation and wait times per model."""
+        return {
+            model: {
+                "max_concurrency": gate.policy.max_concurrency,
+                "max_queue": gate.policy.max_queue,
+                "active": gate.active,
+                "queue_depth": gate.waiting,
+                "admitted": gate.admitted,
+                "rejected_queue_full": gate.rejected_full,
+                "rejected_queue_timeout": gate.rejected_timeout,
+                "wait_seconds_avg": round(gate.wait_seconds_total / gate.admitted, 4) if gate.admitted else 0.0,
+                "wait_seconds_max": round(gate.wait_seconds_max, 4),
+            }
+            for model, gate in self._gates.items()
+        }
+
+
+LLM_ADMISSION = AdmissionController(
+    AdmissionPolicy(
+        max_concurrency=LLM_MAX_CONCURRENCY, max_queue=LLM_MAX_QUEUE, max_queue_seconds=LLM_MAX_QUEUE_SECONDS
+    )
+)
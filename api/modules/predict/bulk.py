@@ -0,0 +1,132 @@
+import codecs
+import csv
+import io
+from datetime import date
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from unidecode import unidecode
+
+from api.models.utils import validate_date_string_format
+
+# Byte -> numerology value lookup tables, applied to whole strings at once with `bytes.translate`.
+# Letters keep `NumerologyReader.calculate`'s `ord(c) - 64`; everything else counts as 0.
+_LETTER_VALUES = bytes((b - 64) & 0xFF if chr(b).isalpha() else 0 for b in range(256))
+_DIGIT_VALUES = bytes(b - 48 if 48 <= b <= 57 else 0 for b in range(256))
+
+DATE_FORMAT = "%Y-%m-%d"
+CSV_FIELDS = (
+    "name",
+    "dob",
+    "name_numerology",
+    "dob_numerology",
+    "personal_numerology",
+    "current_year_numerology",
+    "error",
+)
+CSV_EXPLANATION_FIELDS = ("explanation_name", "explanation_dob", "explanation_personal", "explanation_current_year")
+
+
+@lru_cache(maxsize=65536)
+def _transliterate(name: str) -> bytes:
+    return unidecode(name.upper()).encode("ascii", "ignore")
+
+
+def _name_bytes(name: str) -> bytes:
+    if name.isascii():
+        return name.upper().encode("ascii")
+    return _transliterate(name)
+
+
+def _digital_root(number: int) -> int:
+    return 0 if number == 0 else 1 + (number - 1) % 9
+
+
+def _valid_dob(dob: str) -> bool:
+    # Fast path for the canonical `YYYY-MM-DD`; anything else gets the exact check the API models use.
+    if len(dob) == 10 and dob[4] == "-" and dob[7] == "-":
+        try:
+            date.fromisoformat(dob)
+            return True
+        except ValueError:
+            return False
+    try:
+        validate_date_string_format(dob, DATE_FORMAT)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def calculate_chunk(names: Sequence[str], dobs: Sequence[str], current_year_sum: int) -> Iterator[Dict[str, Any]]:
+    """Numerology numbers of one chunk of records, identical to `NumerologyReader.calculate` without explanations."""
+    # Column-wise: every step runs over the whole chunk before the next, keeping work inside C loops.
+    name_sums = list(map(sum, (_name_bytes(name).translate(_LETTER_VALUES) for name in names)))
+    dob_sums = list(map(sum, (dob.encode("ascii", "ignore").translate(_DIGIT_VALUES) for dob in dobs)))
+    personal = list(map(_digital_root, map(int.__add__, name_sums, dob_sums)))
+    valid = list(map(_valid_dob, dobs))
+
+    for index, (name, dob) in enumerate(zip(names, dobs)):
+        if not valid[index]:
+            yield {"name": name, "dob": dob, "error": f"date must be in format {DATE_FORMAT}"}
+            continue
+        yield {
+            "name": name,
+            "dob": dob,
+            "name_numerology": name_sums[index],
+            "dob_numerology": dob_sums[index],
+            "personal_numerology": personal[index],
+            "current_year_numerology": current_year_sum,
+        }
+
+
+async def read_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[List[Tuple[str, str]]]:
+    """
+    Parse a streamed UTF-8 CSV with `name` and `dob` header columns into batches of records.
+
+    Batches are yielded as soon as a network chunk completes some lines, so processing starts before the
+    upload finishes. Quoted fields must not contain line breaks.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    columns: Optional[Tuple[int, int]] = None
+    pending = ""
+
+    def parse(lines: List[str]) -> List[Tuple[str, str]]:
+        nonlocal columns
+        rows = csv.reader(lines)
+        if columns is None:
+            header = [column.strip().lower() for column in next(rows, [])]
+            if "name" not in header or "dob" not in header:
+                raise ValueError("CSV header must contain `name` and `dob` columns")
+            columns = header.index("name"), header.index("dob")
+        name_index, dob_index = columns
+        width = max(columns)
+        return [(row[name_index], row[dob_index].strip()) for row in rows if len(row) > width]
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        complete, newline, pending = pending.rpartition("\n")
+        if newline:
+            records = parse(complete.splitlines())
+            if records:
+                yield records
+
+    pending += decoder.decode(b"", final=True)
+    records = parse(pending.splitlines()) if pending.strip() else []
+    if records:
+        yield records
+    if columns is None:
+        raise ValueError("CSV is empty")
+
+
+def format_csv(results: Iterable[Dict[str, Any]], explain: bool = False, header: bool = True) -> str:
+    """Render bulk results as CSV text."""
+    buffer = io.StringIO()
+    fields = CSV_FIELDS + CSV_EXPLANATION_FIELDS if explain else CSV_FIELDS
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(fields)
+    for result in results:
+        explanation = result.get("explanation", {})
+        row = {**result, **{f"explanation_{key}": value for key, value in explanation.items()}}
+        writer.writerow([row.get(field, "") for field in fields])
+    return buffer.getvalue()
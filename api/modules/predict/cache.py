@@ -0,0 +1,208 @@
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(value: str) -> str:
+    """Normalize free text so trivially different inputs share a cache entry."""
+    value = unicodedata.normalize("NFC", value).casefold()
+    value = re.sub(r"\s+", " ", value).strip()
+    return value.rstrip(" ?!.…")
+
+
+def request_key(namespace: str, **parts: Any) -> str:
+    """Hash the normalized inputs of an LLM request into a stable key."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return f"{namespace}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class ResponseCache(ABC):
+    """Base class of LLM response caches with LRU and TTL eviction."""
+
+    def __init__(self, namespace: str, max_entries: int = 1024, ttl_seconds: float = 3600) -> None:
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached value, treating backend errors as misses."""
+        try:
+            value = await self._get(key)
+        except Exception as e:
+            logger.warning(f"Response cache {self.namespace} lookup failed: {e}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a value, logging instead of raising on backend errors."""
+        try:
+            await self._set(key, value)
+        except Exception as e:
+            logger.warning(f"Response cache {self.namespace} store failed: {e}")
+
+    @abstractmethod
+    async def _get(self, key: str) -> Optional[str]: ...
+
+    @abstractmethod
+    async def _set(self, key: str, value: str) -> None: ...
+
+    @abstractmethod
+    async def size(self) -> int: ...
+
+    async def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "namespace": self.namespace,
+            "entries": await self.size(),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache with per-entry expiry."""
+
+    def __init__(self, namespace: str, max_entries: int = 1024, ttl_seconds: float = 3600) -> None:
+        super().__init__(namespace, max_entries, ttl_seconds)
+        self._entries: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def _set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def size(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Local persistent cache that survives restarts, backed by a SQLite file."""
+
+    def __init__(self, namespace: str, path: Path, max_entries: int = 10_000, ttl_seconds: float = 86400) -> None:
+        super().__init__(namespace, max_entries, ttl_seconds)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, namespace TEXT NOT NULL, value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS ix_responses_lru ON responses (namespace, accessed_at)")
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def _set_sync(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, namespace, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, self.namespace, value, now + self.ttl_seconds, now),
+            )
+            self._conn.execute(
+                "DELETE FROM responses WHERE namespace = ? AND (expires_at < ? OR key IN ("
+                " SELECT key FROM responses WHERE namespace = ? ORDER BY accessed_at DESC LIMIT -1 OFFSET ?))",
+                (self.namespace, now, self.namespace, self.max_entries),
+            )
+
+    async def _get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def _set(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._set_sync, key, value)
+
+    def _size_sync(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM responses WHERE namespace = ?", (self.namespace,)
+            ).fetchone()[0]
+
+    async def size(self) -> int:
+        return await asyncio.to_thread(self._size_sync)
+
+
+def build_response_cache(
+    namespace: str, backend: str, max_entries: int, ttl_seconds: float, sqlite_path: Path
+) -> Optional[ResponseCache]:
+    """Create the response cache selected by `backend` (`memory`, `sqlite` or `none`)."""
+    if backend == "memory":
+        return MemoryResponseCache(namespace, max_entries=max_entries, ttl_seconds=ttl_seconds)
+    if backend == "sqlite":
+        return SQLiteResponseCache(namespace, sqlite_path, max_entries=max_entries, ttl_seconds=ttl_seconds)
+    if backend != "none":
+        logger.warning(f"Unknown response cache backend {backend!r}, caching disabled")
+    return None
+
+
+class DefaultResponseCache:
+    """
+    Class attribute resolving to the response cache built by `build_response_cache()` when first read.
+
+    Keeps importing a reader from creating the cache directory and opening the SQLite file;
+    `configure(cache=...)` replaces it outright.
+    """
+
+    def __init__(self, namespace: str, **options: Any) -> None:
+        self.namespace = namespace
+        self.options = options
+        self._cache: Optional[ResponseCache] = None
+        self._built = False
+        self._lock = threading.Lock()
+
+    def __get__(self, instance: Any, owner: type) -> Optional[ResponseCache]:
+        if not self._built:
+            with self._lock:
+                if not self._built:
+                    self._cache = build_response_cache(self.namespace, **self.options)
+                    self._built = True
+        return self._cache
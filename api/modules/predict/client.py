@@ -0,0 +1,14 @@
+from typing import Any
+
+
+class DefaultClient:
+    """
+    Class attribute resolving to `api.config.OPENAI_CLIENT` when first read.
+
+    Keeps importing a reader from building the OpenAI client; `configure(client=...)` replaces it outright.
+    """
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        from api import config
+
+        return config.OPENAI_CLIENT
@@ -0,0 +1,76 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from api.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Flight:
+    __slots__ = ("task", "waiters", "deadline")
+
+    def __init__(self, task: asyncio.Task, deadline: Optional[Deadline]) -> None:
+        self.task = task
+        self.waiters = 0
+        self.deadline = deadline
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key onto a single in-flight task."""
+
+    def __init__(self, namespace: str) -> None:
+        self.namespace = namespace
+        self.leaders = 0
+        self.coalesced = 0
+        self.failures = 0
+        self._inflight: Dict[str, "_Flight"] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]], deadline: Optional[Deadline] = None) -> T:
+        """
+        Await `fn()` once for every concurrent caller with the same `key`.
+
+        The result or exception is shared by all waiters. A waiter being cancelled never cancels the
+        shared call for the others; the call itself is cancelled only when every waiter has gone away.
+        `deadline` is the one `fn()` runs under: a caller joining the call extends it to its own.
+        """
+        flight = self._inflight.get(key)
+        if flight is None or flight.task.cancelling() or flight.task.done():
+            flight = self._inflight[key] = _Flight(asyncio.ensure_future(fn()), deadline)
+            flight.task.add_done_callback(lambda task: self._finish(key, flight))
+            self.leaders += 1
+        else:
+            if flight.deadline:
+                flight.deadline.extend(deadline)
+            self.coalesced += 1
+            logger.info(f"Coalesced {self.namespace} request onto in-flight call")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Forget the flight now: a caller arriving before the task finishes cancelling starts a new one.
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                flight.task.cancel()
+
+    def _finish(self, key: str, flight: "_Flight") -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if not flight.task.cancelled() and flight.task.exception() is not None:
+            self.failures += 1
+
+    def stats(self) -> Dict[str, Any]:
+        calls = self.leaders + self.coalesced
+        return {
+            "namespace": self.namespace,
+            "in_flight": len(self._inflight),
+            "llm_calls": self.leaders,
+            "calls_saved": self.coalesced,
+            "saved_ratio": round(self.coalesced / calls, 4) if calls else 0.0,
+            "failures": self.failures,
+        }
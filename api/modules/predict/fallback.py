@@ -0,0 +1,296 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Set, TypeVar
+
+from api.config import LLM_HEDGE_DELAY_SECONDS
+from api.deadline import Deadline
+from api.metrics import LLM_FALLBACKS
+
+from .admission import AdmissionController, AdmissionRejectedError
+from .health import ModelHealth
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AllModelsFailedError(Exception):
+    """
+    Raised when no model in the fallback chain produced a valid response.
+
+    `retry_after` is set when every model was skipped because its admission queue was full, meaning the
+    service is overloaded rather than the models misbehaving.
+    """
+
+    def __init__(self, message: str, retry_after: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(AllModelsFailedError):
+    """
+    Raised when the request's deadline ran out before any model produced a valid response.
+
+    `skipped` lists the models that were never started because they could not have finished in time.
+    """
+
+    def __init__(self, message: str, deadline: Deadline, skipped: Sequence[str] = ()) -> None:
+        super().__init__(message)
+        self.deadline = deadline
+        self.skipped = list(skipped)
+
+    @property
+    def detail(self) -> Dict[str, Any]:
+        """Error body telling the client the request timed out rather than failed."""
+        return {
+            "error": "deadline_exceeded",
+            "message": str(self),
+            "deadline_seconds": self.deadline.seconds,
+            "skipped_models": self.skipped,
+        }
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    """
+    When to start the next model in the fallback chain while the current one is still running.
+
+    The next model is fired once the running model has been silent for longer than `percentile` of its
+    recently observed successful latencies (or `default_delay_seconds`, `LLM_HEDGE_DELAY_SECONDS`, until
+    `min_samples` are recorded), or immediately when it fails. With `enabled=False` models are tried strictly one after another.
+
+    Under a deadline, a model is only started when the time left covers its median latency (or
+    `min_attempt_seconds` until `min_samples` are recorded).
+    """
+
+    enabled: bool = True
+    percentile: float = 0.95
+    default_delay_seconds: float = LLM_HEDGE_DELAY_SECONDS
+    min_delay_seconds: float = 2.0
+    min_samples: int = 20
+    min_attempt_seconds: float = 5.0
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies per model."""
+
+    def __init__(self, window: int = 200) -> None:
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, model: str, seconds: float) -> None:
+        with self._lock:
+            self._samples[model].append(seconds)
+
+    def percentile(self, model: str, percentile: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples[model])
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * percentile))]
+
+    def count(self, model: str) -> int:
+        with self._lock:
+            return len(self._samples[model])
+
+
+def hedge_delay(model: str, policy: HedgingPolicy, tracker: LatencyTracker) -> float:
+    """Seconds to wait on `model` before firing the next model in the chain."""
+    if tracker.count(model) < policy.min_samples:
+        return policy.default_delay_seconds
+    observed = tracker.percentile(model, policy.percentile) or policy.default_delay_seconds
+    return max(policy.min_delay_seconds, observed)
+
+
+def expected_seconds(model: str, policy: HedgingPolicy, tracker: LatencyTracker) -> float:
+    """Typical duration of a successful call to `model`, used to decide whether it can beat a deadline."""
+    if tracker.count(model) < policy.min_samples:
+        return policy.min_attempt_seconds
+    return tracker.percentile(model, 0.5) or policy.min_attempt_seconds
+
+
+async def await_within(call: Awaitable[T], deadline: Optional[Deadline]) -> T:
+    """
+    Await a call shared with other requests, giving up when this caller's own deadline runs out.
+
+    The shared call runs under the shared deadline; a caller with a shorter deadline of its own only stops
+    waiting, and the call keeps running for the others.
+    """
+    if deadline is None:
+        return await call
+    try:
+        return await asyncio.wait_for(call, deadline.remaining())
+    except TimeoutError:
+        if deadline.expired:
+            raise DeadlineExceededError("Deadline exceeded while waiting for the response", deadline) from None
+        raise
+
+
+async def run_with_fallback(
+    models: Sequence[str],
+    attempt: Callable[[str], Awaitable[T]],
+    policy: HedgingPolicy,
+    tracker: LatencyTracker,
+    health: Optional[ModelHealth] = None,
+    admission: Optional[AdmissionController] = None,
+    deadline: Optional[Deadline] = None,
+) -> T:
+    """
+    Run `attempt(model)` over the fallback chain and return the first valid result.
+
+    An attempt is valid when it returns without raising. With hedging enabled, slow attempts are raced
+    against the next model and the losers are cancelled as soon as one attempt succeeds. When `health`
+    is given, the chain is reordered by model health, every outcome is recorded against it, and a model
+    is only started when `health.try_acquire` admits the call (open circuits are skipped). When
+    `admission` is given, each attempt first takes one of its model's concurrency slots; a model whose
+    queue is full counts as failed without touching its health.
+
+    When `deadline` is given, every attempt (queueing included) is cut off when it runs out, and models
+    that cannot finish in the time left are skipped rather than started; `DeadlineExceededError` is
+    raised as soon as no running or startable attempt is left.
+    """
+    if not models:
+        raise AllModelsFailedError("No models configured")
+
+    async def timed(model: str) -> T:
+        started = attempt_started[model] = time.perf_counter()
+        try:
+            result = await attempt(model)
+        except asyncio.CancelledError:
+            if health:
+                health.on_cancel(model)
+            raise
+        except Exception as e:
+            if health:
+                health.record_failure(model, time.perf_counter() - started, e)
+            raise
+
+        elapsed = time.perf_counter() - started
+        tracker.record(model, elapsed)
+        if health:
+            health.record_success(model, elapsed)
+        return result
+
+    async def admitted(model: str) -> T:
+        if not admission:
+            return await timed(model)
+        async with AsyncExitStack() as stack:
+            try:
+                await stack.enter_async_context(admission.slot(model))
+            except BaseException:
+                # Rejected or cancelled while queued: the call claimed from `health` never started.
+                if health:
+                    health.on_cancel(model)
+                raise
+            return await timed(model)
+
+    def record_timeout(model: str, reason: str) -> None:
+        """Count an attempt cut off for being too slow as a failure, so a hanging model trips its circuit."""
+        if health and model in attempt_started:
+            elapsed = time.perf_counter() - attempt_started[model]
+            health.record_failure(model, elapsed, TimeoutError(f"Model {model} {reason} after {elapsed:.1f}s"))
+
+    async def bounded(model: str) -> T:
+        begun.add(model)
+        if not deadline:
+            return await admitted(model)
+        try:
+            async with deadline.scope() as scope:
+                return await admitted(model)
+        except TimeoutError:
+            if scope.expired():
+                record_timeout(model, "ran out of time")
+                raise DeadlineExceededError(f"Model {model} ran out of time", deadline) from None
+            raise
+
+    remaining: List[str] = health.order(models) if health else list(models)
+    attempted = len(remaining)
+    running: Dict[asyncio.Task, str] = {}
+    rejections: List[AdmissionRejectedError] = []
+    skipped: List[str] = []
+    denied: List[str] = []
+    begun: Set[str] = set()
+    attempt_started: Dict[str, float] = {}
+    hedged: Set[str] = set()
+    settled = False
+    timed_out = False
+
+    def launch() -> Optional[str]:
+        """Start the next model that can still finish in time, if any."""
+        while remaining:
+            model = remaining.pop(0)
+            if deadline and deadline.remaining() < expected_seconds(model, policy, tracker):
+                logger.warning(f"Skipping model {model}: {deadline.remaining():.1f}s left before the deadline")
+                LLM_FALLBACKS.inc(model, "deadline")
+                skipped.append(model)
+                continue
+            if health and not health.try_acquire(model):
+                logger.info(f"Skipping model {model}: circuit is open")
+                denied.append(model)
+                continue
+            running[asyncio.create_task(bounded(model))] = model
+            return model
+        return None
+
+    last_launched: Optional[str] = launch()
+    try:
+        while running:
+            hedging = policy.enabled and bool(remaining)
+            timeout = hedge_delay(last_launched, policy, tracker) if hedging and last_launched else None
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            if not done:
+                hedge = launch()
+                if hedge:
+                    logger.info(f"Model {last_launched} is slow, hedging with {hedge}")
+                    LLM_FALLBACKS.inc(last_launched, "slow")
+                    hedged.add(last_launched)
+                    last_launched = hedge
+                continue
+
+            for task in done:
+                model = running.pop(task)
+                error = task.exception()
+                if error is None:
+                    settled = True
+                    return task.result()
+                if isinstance(error, AdmissionRejectedError):
+                    rejections.append(error)
+                    logger.warning(str(error))
+                elif isinstance(error, DeadlineExceededError):
+                    timed_out = True
+                    logger.warning(str(error))
+                    continue
+                else:
+                    logger.error(f"Model {model} failed: {error}")
+                if remaining:
+                    LLM_FALLBACKS.inc(model, "failed")
+
+            if remaining and (policy.enabled or not running):
+                logger.info("Switching to next model")
+                last_launched = launch() or last_launched
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        if health:
+            # A task cancelled before its first step never ran the handlers that release its claim.
+            for model in running.values():
+                if model not in begun:
+                    health.on_cancel(model)
+                elif settled and model in hedged:
+                    record_timeout(model, "lost the hedge race")
+
+    if len(rejections) == attempted:
+        raise AllModelsFailedError("All models are overloaded", retry_after=min(e.retry_after for e in rejections))
+    if deadline and (timed_out or skipped):
+        raise DeadlineExceededError("Deadline exceeded before any model succeeded", deadline, skipped)
+    if len(denied) == attempted:
+        raise AllModelsFailedError("All model circuits are open")
+    raise AllModelsFailedError("All models failed")
@@ -0,0 +1,177 @@
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """When a model's circuit opens and how long it stays open before a half-open probe."""
+
+    window: int = 50
+    window_seconds: float = 300.0
+    min_calls: int = 10
+    failure_rate_threshold: float = 0.5
+    consecutive_failures: int = 5
+    open_seconds: float = 30.0
+
+
+@dataclass
+class _ModelState:
+    outcomes: Deque[Tuple[float, bool, float]]
+    state: str = CLOSED
+    opened_at: float = 0.0
+    consecutive_failures: int = 0
+    probe_in_flight: bool = False
+    total_calls: int = 0
+    total_failures: int = 0
+    last_error: str = field(default="")
+
+    def prune(self, window_seconds: float) -> None:
+        horizon = time.monotonic() - window_seconds
+        while self.outcomes and self.outcomes[0][0] < horizon:
+            self.outcomes.popleft()
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return sum(1 for _, ok, _ in self.outcomes if not ok) / len(self.outcomes)
+
+    def latency_p50(self) -> float:
+        latencies = sorted(seconds for _, ok, seconds in self.outcomes if ok)
+        return latencies[len(latencies) // 2] if latencies else 0.0
+
+
+class ModelHealth:
+    """Rolling error rate and latency per model, with a circuit breaker and health-based ordering."""
+
+    def __init__(self, policy: CircuitBreakerPolicy = CircuitBreakerPolicy()) -> None:
+        self.policy = policy
+        self._models: Dict[str, _ModelState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, model: str) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            state = self._models[model] = _ModelState(outcomes=deque(maxlen=self.policy.window))
+        state.prune(self.policy.window_seconds)
+        return state
+
+    def _can_probe(self, state: _ModelState) -> bool:
+        return not state.probe_in_flight and time.monotonic() - state.opened_at >= self.policy.open_seconds
+
+    def order(self, models: Sequence[str]) -> List[str]:
+        """
+        Return the models worth calling now, healthiest first.
+
+        Closed circuits with at least `min_calls` recent outcomes are ranked by error rate, in coarse buckets
+        so the configured order wins among similarly healthy models. Outcomes older than `window_seconds`
+        are forgotten, so a demoted model returns to its configured position once it stops failing.
+        Open circuits are skipped until their cool-down ends, when one half-open probe may go through.
+        If every circuit is open, the configured order is returned as a last resort; `try_acquire` then
+        lets a single probe through at a time.
+        """
+        with self._lock:
+            ranked = []
+            for index, model in enumerate(models):
+                state = self._state(model)
+                if state.state == CLOSED:
+                    bucket = round(state.error_rate() * 4) / 4 if len(state.outcomes) >= self.policy.min_calls else 0.0
+                    ranked.append((bucket, index, model))
+                elif self._can_probe(state):
+                    ranked.append((0.0, index, model))
+        if not ranked:
+            return list(models)
+        return [model for _, _, model in sorted(ranked)]
+
+    def try_acquire(self, model: str) -> bool:
+        """
+        Claim a call to `model`, atomically with checking its circuit.
+
+        Closed circuits always admit the call. Any other circuit admits one half-open probe at a time, once
+        its cool-down has ended, or before that when every circuit is open and no probe is in flight at
+        all (a full outage gets one last-resort probe, not every request sent to every dead model). An
+        admitted call must end in `record_success`, `record_failure` or `on_cancel`.
+        """
+        with self._lock:
+            state = self._state(model)
+            if state.state == CLOSED:
+                return True
+            if state.probe_in_flight:
+                return False
+            if not self._can_probe(state):
+                outage = all(other.state != CLOSED for other in self._models.values())
+                if not outage or any(other.probe_in_flight for other in self._models.values()):
+                    return False
+            state.state = HALF_OPEN
+            state.probe_in_flight = True
+            return True
+
+    def on_cancel(self, model: str) -> None:
+        """Forget an admitted call that was cancelled or rejected before it produced an outcome."""
+        with self._lock:
+            self._state(model).probe_in_flight = False
+
+    def record_success(self, model: str, seconds: float) -> None:
+        with self._lock:
+            state = self._state(model)
+            state.outcomes.append((time.monotonic(), True, seconds))
+            state.total_calls += 1
+            state.consecutive_failures = 0
+            state.probe_in_flight = False
+            if state.state != CLOSED:
+                logger.info(f"Circuit for model {model} closed")
+                state.state = CLOSED
+                state.outcomes.clear()
+
+    def record_failure(self, model: str, seconds: float, error: BaseException) -> None:
+        with self._lock:
+            state = self._state(model)
+            state.outcomes.append((time.monotonic(), False, seconds))
+            state.total_calls += 1
+            state.total_failures += 1
+            state.consecutive_failures += 1
+            state.probe_in_flight = False
+            state.last_error = str(error)[:200]
+
+            tripped = state.consecutive_failures >= self.policy.consecutive_failures or (
+                len(state.outcomes) >= self.policy.min_calls
+                and state.error_rate() >= self.policy.failure_rate_threshold
+            )
+            if state.state == HALF_OPEN or (state.state == CLOSED and tripped):
+                logger.warning(f"Circuit for model {model} opened for {self.policy.open_seconds}s")
+                state.state = OPEN
+                state.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current breaker state of every model seen so far."""
+        with self._lock:
+            return {
+                model: {
+                    "state": state.state,
+                    "error_rate": round(state.error_rate(), 4),
+                    "latency_p50_seconds": round(state.latency_p50(), 3),
+                    "window_calls": len(state.outcomes),
+                    "consecutive_failures": state.consecutive_failures,
+                    "total_calls": state.total_calls,
+                    "total_failures": state.total_failures,
+                    "open_remaining_seconds": (
+                        round(max(0.0, self.policy.open_seconds - (time.monotonic() - state.opened_at)), 1)
+                        if state.state == OPEN
+                        else 0.0
+                    ),
+                    "last_error": state.last_error,
+                }
+                for model, state in self._models.items()
+            }
+
+
+MODEL_HEALTH = ModelHealth()
@@ -1,25 +1,70 @@
 import json
 import logging
+import re
+import unicodedata
 from datetime import datetime
-from typing import Any, Dict, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, Tuple
 
-import instructor
 from fastapi import HTTPException
 from unidecode import unidecode
 
-from api.config import MODEL_LISTS, OPENAI_CLIENT
-from api.models import NumerologyLLMResponse
-from api.prompts.numerology import SYSTEM_PROMPT
+from api.config import (
+    MODEL_LISTS,
+    RESPONSE_CACHE_BACKEND,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_SQLITE_PATH,
+    RESPONSE_CACHE_TTL_SECONDS,
+)
+from api.deadline import current_deadline, shared_deadline
+from api.models import NumerologyInsightLLMResponse, NumerologyLLMResponse
+from api.prompts.numerology import CALCULATIONS_TEMPLATES, INSIGHT_SYSTEM_PROMPT, NUMBER_MEANINGS, SYSTEM_PROMPT
+from api.timing import server_timing
+
+from .admission import LLM_ADMISSION, AdmissionController
+from .bulk import calculate_chunk
+from .cache import DefaultResponseCache, ResponseCache, normalize_text, request_key
+from .client import DefaultClient
+from .coalesce import SingleFlight
+from .fallback import (
+    AllModelsFailedError,
+    DeadlineExceededError,
+    HedgingPolicy,
+    LatencyTracker,
+    await_within,
+    run_with_fallback,
+)
+from .health import MODEL_HEALTH, ModelHealth
+from .telemetry import record_usage, track_llm_call
+
+if TYPE_CHECKING:
+    import instructor
 
 logger = logging.getLogger(__name__)
 
+# Vietnamese-only letters and the decomposed tone/vowel marks of Vietnamese diacritics.
+_VIETNAMESE_MARKS = re.compile(r"[đĐ\u0300\u0301\u0302\u0303\u0306\u0309\u031b\u0323]")
+
 
 class NumerologyReader:
     """numerology computation and interpretation service."""
 
     models: list[str] = MODEL_LISTS
-    client: instructor.AsyncInstructor = OPENAI_CLIENT
+    client: "instructor.AsyncInstructor" = DefaultClient()
     max_analysis_length: int = 1200
+    cache: Optional[ResponseCache] = DefaultResponseCache(
+        "numerology",
+        backend=RESPONSE_CACHE_BACKEND,
+        max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds=RESPONSE_CACHE_TTL_SECONDS,
+        sqlite_path=RESPONSE_CACHE_SQLITE_PATH,
+    )
+    hedging: HedgingPolicy = HedgingPolicy()
+    latency: LatencyTracker = LatencyTracker()
+    health: ModelHealth = MODEL_HEALTH
+    single_flight: SingleFlight = SingleFlight("numerology")
+    admission: AdmissionController = LLM_ADMISSION
+    local_calculations: bool = True
 
     @classmethod
     def configure(
@@ -27,6 +72,11 @@ class NumerologyReader:
         models: Optional[list[str]] = None,
         client: Optional[Any] = None,
         max_analysis_length: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        health: Optional[ModelHealth] = None,
+        admission: Optional[AdmissionController] = None,
+        local_calculations: Optional[bool] = None,
     ) -> None:
         """Change model or runtime configuration globally."""
         if models:
@@ -35,6 +85,16 @@ class NumerologyReader:
             cls.client = client
         if max_analysis_length:
             cls.max_analysis_length = max_analysis_length
+        if cache:
+            cls.cache = cache
+        if hedging:
+            cls.hedging = hedging
+        if health:
+            cls.health = health
+        if admission:
+            cls.admission = admission
+        if local_calculations is not None:
+            cls.local_calculations = local_calculations
 
     @staticmethod
     def calculate(name: str, dob: str) -> Dict[str, Any]:
@@ -74,50 +134,158 @@ class NumerologyReader:
             },
         }
 
+    @classmethod
+    def calculate_bulk(
+        cls, records: Iterable[Tuple[str, str]], explain: bool = False, chunk_size: int = 4096
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily compute the numerology numbers of many `(name, dob)` records, in input order.
+
+        Numbers are identical to `calculate`, but records are processed in chunks with lookup-table arithmetic
+        instead of one by one. With `explain=True` each record also gets the slower step-by-step `explanation`.
+        Records with an invalid date of birth yield an `error` instead of numbers.
+        """
+        current_year_sum = sum(int(digit) for digit in str(datetime.now().year))
+        records = iter(records)
+        while chunk := list(islice(records, chunk_size)):
+            names, dobs = zip(*chunk)
+            for result in calculate_chunk(names, dobs, current_year_sum):
+                if explain and "error" not in result:
+                    result["explanation"] = cls.calculate(result["name"], result["dob"])["_explanation"]
+                yield result
+
+    @staticmethod
+    def detect_language(text: str) -> str:
+        """`vi` when the text carries Vietnamese letters or tone marks, otherwise `en`."""
+        return "vi" if _VIETNAMESE_MARKS.search(unicodedata.normalize("NFD", text)) else "en"
+
+    @staticmethod
+    def _reduce(explanation: str, total: int) -> Tuple[int, str]:
+        """Extend `explanation` (ending in `= total`) with reduction steps down to a single digit, final number in bold."""
+        while total > 9:
+            digits = str(total)
+            total = sum(int(d) for d in digits)
+            explanation += f" --> {'+'.join(digits)} = {total}"
+        head, _, last = explanation.rpartition("= ")
+        return total, f"{head}= **{last}**"
+
+    @classmethod
+    def numbers(cls, numerology: Dict[str, Any]) -> Dict[str, Tuple[int, str]]:
+        """The four reading numbers of `calculate()` output, each with its step-by-step formula."""
+        explanation = numerology["_explanation"]
+        expression = cls._reduce(explanation["name"], numerology["name_numerology"])
+        life_path = cls._reduce(explanation["dob"], numerology["dob_numerology"])
+        personal_year = cls._reduce(explanation["current_year"], numerology["current_year_numerology"])
+        cosmic_signature = cls._reduce(
+            f"{expression[0]} + {life_path[0]} = {expression[0] + life_path[0]}", expression[0] + life_path[0]
+        )
+        return {
+            "expression": expression,
+            "life_path": life_path,
+            "personal_year": personal_year,
+            "cosmic_signature": cosmic_signature,
+        }
+
+    @classmethod
+    def render_calculations(cls, numerology: Dict[str, Any], language: str = "en") -> str:
+        """Render the `calculations` markdown section from `calculate()` output without the LLM."""
+        language = language if language in CALCULATIONS_TEMPLATES else "en"
+        meanings = NUMBER_MEANINGS[language]
+        fields: Dict[str, Any] = {}
+        for key, (number, formula) in cls.numbers(numerology).items():
+            fields[key] = formula
+            fields[f"{key}_meaning"] = meanings[number]
+        return CALCULATIONS_TEMPLATES[language].format(**fields)
+
     @classmethod
     def _build_prompt(cls) -> str:
         """Return reusable system prompt for numerology interpretation."""
-        return SYSTEM_PROMPT.format(
+        return (INSIGHT_SYSTEM_PROMPT if cls.local_calculations else SYSTEM_PROMPT).format(
             max_analysis_length=cls.max_analysis_length,
         )
 
     @classmethod
-    async def analyze(cls, name: str, dob: str, question: str) -> str:
-        """Perform numerology analysis and LLM interpretation with structured output."""
-        numerology = cls.calculate(name, dob)
+    async def analyze(cls, name: str, dob: str, question: str, use_cache: bool = True) -> str:
+        """
+        Perform numerology analysis and LLM interpretation with structured output.
+
+        With `local_calculations` (the default) the calculation breakdown is rendered from `calculate()` in the
+        question's language and the LLM only writes the insight. The cache key includes the normalized
+        name: the numbers derive from it and the prompt addresses the querent by it.
+        """
+        key = request_key(
+            "numerology",
+            name=normalize_text(name),
+            dob=dob,
+            question=normalize_text(question),
+            models=cls.models,
+            current_year=datetime.now().year,
+            max_analysis_length=cls.max_analysis_length,
+            local_calculations=cls.local_calculations,
+        )
+        if cls.cache and use_cache:
+            cached = await cls.cache.get(key)
+            if cached is not None:
+                return cached
+
+        with server_timing("numerology"):
+            numerology = cls.calculate(name, dob)
+            calculations = None
+            if cls.local_calculations:
+                calculations = cls.render_calculations(numerology, cls.detect_language(question))
+                numerology = {key: number for key, (number, _) in cls.numbers(numerology).items()}
         user_input = json.dumps(
             {
                 "name": name,
                 "dob": dob,
                 "question": question,
                 "current_year": datetime.now().year,
-                "numerology": numerology,
+                "numbers" if cls.local_calculations else "numerology": numerology,
             },
             indent=4,
+            ensure_ascii=False,
         )
 
         system_prompt = cls._build_prompt()
+        response_model = NumerologyInsightLLMResponse if cls.local_calculations else NumerologyLLMResponse
+        deadline = shared_deadline()
 
-        for model in cls.models:
-            try:
-                response = await cls.client.chat.completions.create(
+        async def attempt(model: str) -> str:
+            with track_llm_call("numerology", model):
+                response, completion = await cls.client.chat.completions.create_with_completion(
                     model=model,
                     messages=[
                         {"role": "system", "content": system_prompt},
                         {"role": "user", "content": user_input},
                     ],
-                    response_model=NumerologyLLMResponse,
+                    response_model=response_model,
+                    **({"timeout": deadline.remaining()} if deadline and deadline.finite else {}),
                 )
+                record_usage("numerology", model, completion)
+                validated_response = response_model.model_validate(response, strict=True)
+            return f"{calculations or validated_response.calculations}\n\n{validated_response.insight}"
 
-                validated_response = NumerologyLLMResponse.model_validate(response, strict=True)
-                formatted_output = f"{validated_response.calculations}\n\n{validated_response.insight}"
-
-                return formatted_output
+        async def generate() -> str:
+            try:
+                formatted_output = await run_with_fallback(
+                    cls.models, attempt, cls.hedging, cls.latency, cls.health, cls.admission, deadline
+                )
+            except DeadlineExceededError as e:
+                raise HTTPException(status_code=504, detail=e.detail)
+            except AllModelsFailedError as e:
+                if e.retry_after:
+                    raise HTTPException(
+                        status_code=503,
+                        detail="All models are overloaded, retry later",
+                        headers={"Retry-After": str(e.retry_after)},
+                    )
+                raise HTTPException(status_code=403, detail="All configured models failed")
 
-            except Exception as e:
-                logger.error(f"Model {model} failed: {e}")
-                if model != cls.models[-1]:
-                    logger.info("Switching to next model")
-                    continue
+            if cls.cache:
+                await cls.cache.set(key, formatted_output)
+            return formatted_output
 
-        raise HTTPException(status_code=403, detail="All configured models failed")
+        try:
+            return await await_within(cls.single_flight.do(key, generate, deadline), current_deadline())
+        except DeadlineExceededError as e:
+            raise HTTPException(status_code=504, detail=e.detail)
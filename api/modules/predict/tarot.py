@@ -1,37 +1,92 @@
+import asyncio
 import json
 import logging
+import time
+from contextlib import AsyncExitStack
 from datetime import datetime
-from typing import Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Tuple
 
-import instructor
 from fastapi import HTTPException
 
-from api.config import MODEL_LISTS, OPENAI_CLIENT
+from api.config import (
+    MODEL_LISTS,
+    RESPONSE_CACHE_BACKEND,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_SQLITE_PATH,
+    RESPONSE_CACHE_TTL_SECONDS,
+)
+from api.deadline import current_deadline, shared_deadline
+from api.metrics import LLM_FALLBACKS
 from api.models import TarotCard, TarotInterpretation, TarotLLMResponse
 from api.prompts.tarot import SYSTEM_PROMPT
 
+from .admission import LLM_ADMISSION, AdmissionController, AdmissionRejectedError
+from .cache import DefaultResponseCache, ResponseCache, normalize_text, request_key
+from .client import DefaultClient
+from .coalesce import SingleFlight
+from .fallback import (
+    AllModelsFailedError,
+    DeadlineExceededError,
+    HedgingPolicy,
+    LatencyTracker,
+    await_within,
+    run_with_fallback,
+)
+from .health import MODEL_HEALTH, ModelHealth
+from .telemetry import record_llm_call, record_usage, track_llm_call
+
+if TYPE_CHECKING:
+    import instructor
+
 logger = logging.getLogger(__name__)
 
+# Sections of `TarotLLMResponse`, in the order the prompt asks the model to write them.
+SECTIONS = ("past", "present", "future", "summary")
+
 
 class TarotReader:
     """
     Tarot card interpretation module.
     """
 
-    client: instructor.AsyncInstructor = OPENAI_CLIENT
+    client: "instructor.AsyncInstructor" = DefaultClient()
     models: list[str] = MODEL_LISTS
+    cache: Optional[ResponseCache] = DefaultResponseCache(
+        "tarot",
+        backend=RESPONSE_CACHE_BACKEND,
+        max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+        ttl_seconds=RESPONSE_CACHE_TTL_SECONDS,
+        sqlite_path=RESPONSE_CACHE_SQLITE_PATH,
+    )
+    hedging: HedgingPolicy = HedgingPolicy()
+    latency: LatencyTracker = LatencyTracker()
+    health: ModelHealth = MODEL_HEALTH
+    single_flight: SingleFlight = SingleFlight("tarot")
+    admission: AdmissionController = LLM_ADMISSION
 
     @classmethod
     def configure(
         cls,
         client: Optional[Any] = None,
         models: Optional[list[str]] = None,
+        cache: Optional[ResponseCache] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        health: Optional[ModelHealth] = None,
+        admission: Optional[AdmissionController] = None,
     ) -> None:
-        """Change OpenAI client or model list dynamically."""
+        """Change OpenAI client, model list, response cache, hedging policy, model health registry or admission control dynamically."""
         if client:
             cls.client = client
         if models:
             cls.models = models
+        if cache:
+            cls.cache = cache
+        if hedging:
+            cls.hedging = hedging
+        if health:
+            cls.health = health
+        if admission:
+            cls.admission = admission
 
     @classmethod
     def _build_system_prompt(cls) -> str:
@@ -39,16 +94,28 @@ class TarotReader:
         return SYSTEM_PROMPT
 
     @classmethod
-    async def interpret_cards(
-        cls,
-        name: str,
-        question: str,
-        past_card_name: str,
-        present_card_name: str,
-        future_card_name: str,
-    ) -> TarotLLMResponse:
-        """Request structured Tarot interpretation from LLM models."""
-        system_prompt = cls._build_system_prompt()
+    def _request_key(
+        cls, name: str, question: str, past_card_name: str, present_card_name: str, future_card_name: str
+    ) -> str:
+        """
+        Response cache and single-flight key of a reading.
+
+        The normalized name is part of it: the LLM is given the querent's name, answers in its language
+        and may address them by it, so two names never share an interpretation.
+        """
+        return request_key(
+            "tarot",
+            name=normalize_text(name),
+            question=normalize_text(question),
+            cards=[past_card_name, present_card_name, future_card_name],
+            models=cls.models,
+            current_year=datetime.now().year,
+        )
+
+    @classmethod
+    def _build_messages(
+        cls, name: str, question: str, past_card_name: str, present_card_name: str, future_card_name: str
+    ) -> List[Dict[str, str]]:
         user_input = json.dumps(
             {
                 "name": name,
@@ -59,45 +126,222 @@ class TarotReader:
                 "current_year": datetime.now().year,
             }
         )
+        return [
+            {"role": "system", "content": cls._build_system_prompt()},
+            {"role": "user", "content": user_input},
+        ]
 
-        for model in cls.models:
-            try:
-                response = await cls.client.chat.completions.create(
+    @classmethod
+    async def _create_partial(
+        cls, model: str, messages: List[Dict[str, str]], **kwargs: Any
+    ) -> AsyncIterator[TarotLLMResponse]:
+        """
+        Stream partial responses like instructor's `create_partial`, recording the tokens the stream used.
+
+        instructor does not hand out the streamed completion, so the request goes through the underlying
+        OpenAI client with `include_usage` and its chunks are parsed by instructor's partial model.
+        """
+        import instructor
+
+        partial_model, create_kwargs = instructor.handle_response_model(
+            instructor.Partial[TarotLLMResponse],
+            mode=cls.client.mode,
+            messages=messages,
+            stream=True,
+            stream_options={"include_usage": True},
+            **kwargs,
+        )
+        stream = await cls.client.client.chat.completions.create(model=model, **create_kwargs)
+        final = None
+
+        async def chunks() -> AsyncIterator[Any]:
+            nonlocal final
+            async for chunk in stream:
+                # With `include_usage` the last chunk carries the usage of the whole stream and no choices.
+                if chunk.usage:
+                    final = chunk
+                yield chunk
+
+        try:
+            async for partial in await partial_model.from_streaming_response_async(chunks(), mode=cls.client.mode):
+                yield partial
+        finally:
+            record_usage("tarot", model, final)
+
+    @classmethod
+    async def interpret_cards(
+        cls,
+        name: str,
+        question: str,
+        past_card_name: str,
+        present_card_name: str,
+        future_card_name: str,
+        use_cache: bool = True,
+    ) -> TarotLLMResponse:
+        """
+        Request structured Tarot interpretation from LLM models.
+
+        Served from the response cache when possible; concurrent identical requests share one LLM call.
+        Under a request deadline, models that cannot answer in the time left are skipped and a `504` is
+        raised as soon as none can.
+        """
+        key = cls._request_key(name, question, past_card_name, present_card_name, future_card_name)
+        if cls.cache and use_cache:
+            cached = await cls.cache.get(key)
+            if cached is not None:
+                return TarotLLMResponse.model_validate_json(cached)
+
+        messages = cls._build_messages(name, question, past_card_name, present_card_name, future_card_name)
+        deadline = shared_deadline()
+
+        async def attempt(model: str) -> TarotLLMResponse:
+            with track_llm_call("tarot", model):
+                response, completion = await cls.client.chat.completions.create_with_completion(
                     model=model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_input},
-                    ],
+                    messages=messages,
                     response_model=TarotLLMResponse,
+                    **({"timeout": deadline.remaining()} if deadline and deadline.finite else {}),
                 )
+                record_usage("tarot", model, completion)
                 return TarotLLMResponse.model_validate(response, strict=True)
-            except Exception as e:
-                logger.error(f"Model {model} failed: {e}")
-                if model != cls.models[-1]:
-                    logger.info("Switching to next model")
-                continue
 
-        raise HTTPException(status_code=403, detail="All models failed to produce valid output")
+        async def generate() -> TarotLLMResponse:
+            try:
+                validated_response = await run_with_fallback(
+                    cls.models, attempt, cls.hedging, cls.latency, cls.health, cls.admission, deadline
+                )
+            except DeadlineExceededError as e:
+                raise HTTPException(status_code=504, detail=e.detail)
+            except AllModelsFailedError as e:
+                if e.retry_after:
+                    raise HTTPException(
+                        status_code=503,
+                        detail="All models are overloaded, retry later",
+                        headers={"Retry-After": str(e.retry_after)},
+                    )
+                raise HTTPException(status_code=403, detail="All models failed to produce valid output")
+
+            if cls.cache:
+                await cls.cache.set(key, validated_response.model_dump_json())
+            return validated_response
+
+        try:
+            return await await_within(cls.single_flight.do(key, generate, deadline), current_deadline())
+        except DeadlineExceededError as e:
+            raise HTTPException(status_code=504, detail=e.detail)
 
     @classmethod
-    async def generate_reading(
+    async def stream_interpretation(
         cls,
         name: str,
         question: str,
-        past_card: TarotCard,
-        present_card: TarotCard,
-        future_card: TarotCard,
-    ) -> Tuple[List[TarotInterpretation], str]:
-        """Generate final tarot reading and structured interpretation."""
-        response = await cls.interpret_cards(
-            name=name,
-            question=question,
-            past_card_name=past_card.full_card_name,
-            present_card_name=present_card.full_card_name,
-            future_card_name=future_card.full_card_name,
-        )
+        past_card_name: str,
+        present_card_name: str,
+        future_card_name: str,
+        use_cache: bool = True,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Stream a structured Tarot interpretation as `(event, data)` pairs while the LLM writes it.
+
+        Events are `delta` (new text of a section), `section` (a section is complete), `reset` (the model
+        failed mid-stream, discard streamed text before the next model) and finally `response` carrying the
+        strictly validated `TarotLLMResponse`. Each model is given the request's time left as its timeout.
+
+        Streams are not coalesced: every stream makes its own LLM call, since its deltas go to one client.
+        The finished response still fills the cache that `interpret_cards` serves from.
+        """
+        key = cls._request_key(name, question, past_card_name, present_card_name, future_card_name)
+        if cls.cache and use_cache:
+            cached = await cls.cache.get(key)
+            if cached is not None:
+                response = TarotLLMResponse.model_validate_json(cached)
+                for section in SECTIONS:
+                    yield "section", {"section": section, "text": getattr(response, section)}
+                yield "response", response
+                return
+
+        messages = cls._build_messages(name, question, past_card_name, present_card_name, future_card_name)
+        deadline = current_deadline()
+
+        models = cls.health.order(cls.models)
+        rejections: List[AdmissionRejectedError] = []
+        for model in models:
+            if not cls.health.try_acquire(model):
+                logger.info(f"Skipping model {model}: circuit is open")
+                continue
+            async with AsyncExitStack() as stack:
+                try:
+                    await stack.enter_async_context(cls.admission.slot(model))
+                except AdmissionRejectedError as e:
+                    cls.health.on_cancel(model)
+                    logger.warning(str(e))
+                    rejections.append(e)
+                    continue
+                except BaseException:
+                    cls.health.on_cancel(model)
+                    raise
+
+                streamed = dict.fromkeys(SECTIONS, "")
+                completed: set[str] = set()
+                started = time.perf_counter()
+                try:
+                    partial = None
+                    async for partial in cls._create_partial(
+                        model, messages, **({"timeout": deadline.remaining()} if deadline and deadline.finite else {})
+                    ):
+                        for index, section in enumerate(SECTIONS):
+                            text = getattr(partial, section, None) or ""
+                            if len(text) > len(streamed[section]):
+                                yield "delta", {"section": section, "text": text[len(streamed[section]) :]}
+                                streamed[section] = text
+                            # A section is complete once the model has moved on to a later one.
+                            if section not in completed and any(streamed[later] for later in SECTIONS[index + 1 :]):
+                                completed.add(section)
+                                yield "section", {"section": section, "text": streamed[section]}
+
+                    validated_response = TarotLLMResponse.model_validate(
+                        partial.model_dump() if partial is not None else {}, strict=True
+                    )
+                except (asyncio.CancelledError, GeneratorExit) as e:
+                    cls.health.on_cancel(model)
+                    record_llm_call("tarot", model, time.perf_counter() - started, e)
+                    raise
+                except Exception as e:
+                    logger.error(f"Model {model} failed: {e}")
+                    cls.health.record_failure(model, time.perf_counter() - started, e)
+                    record_llm_call("tarot", model, time.perf_counter() - started, e)
+                    if any(streamed.values()):
+                        yield "reset", {"model": model}
+                    if model != models[-1]:
+                        logger.info("Switching to next model")
+                        LLM_FALLBACKS.inc(model, "failed")
+                    continue
+
+                cls.health.record_success(model, time.perf_counter() - started)
+                record_llm_call("tarot", model, time.perf_counter() - started)
+                for section in SECTIONS:
+                    if section not in completed:
+                        yield "section", {"section": section, "text": getattr(validated_response, section)}
 
-        interpretations = [
+                if cls.cache:
+                    await cls.cache.set(key, validated_response.model_dump_json())
+                yield "response", validated_response
+                return
+
+        if rejections and len(rejections) == len(models):
+            raise HTTPException(
+                status_code=503,
+                detail="All models are overloaded, retry later",
+                headers={"Retry-After": str(min(e.retry_after for e in rejections))},
+            )
+        raise HTTPException(status_code=403, detail="All models failed to produce valid output")
+
+    @staticmethod
+    def build_interpretations(
+        past_card: TarotCard, present_card: TarotCard, future_card: TarotCard, response: TarotLLMResponse
+    ) -> List[TarotInterpretation]:
+        """Attach the interpreted meanings to the drawn cards."""
+        return [
             TarotInterpretation(
                 card_name=past_card.name,
                 position="past",
@@ -118,4 +362,25 @@ class TarotReader:
             ),
         ]
 
+    @classmethod
+    async def generate_reading(
+        cls,
+        name: str,
+        question: str,
+        past_card: TarotCard,
+        present_card: TarotCard,
+        future_card: TarotCard,
+        use_cache: bool = True,
+    ) -> Tuple[List[TarotInterpretation], str]:
+        """Generate final tarot reading and structured interpretation."""
+        response = await cls.interpret_cards(
+            name=name,
+            question=question,
+            past_card_name=past_card.full_card_name,
+            present_card_name=present_card.full_card_name,
+            future_card_name=future_card.full_card_name,
+            use_cache=use_cache,
+        )
+
+        interpretations = cls.build_interpretations(past_card, present_card, future_card, response)
         return interpretations, response.summary
@@ -0,0 +1,52 @@
+import asyncio
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from pydantic import ValidationError
+
+from api.metrics import LLM_CALL_SECONDS, LLM_TOKENS, LLM_VALIDATION_FAILURES
+from api.timing import record_timing
+
+
+def _is_instructor_retry(error: BaseException) -> bool:
+    # instructor is only imported once an LLM call has been made; don't import it just to classify errors.
+    exceptions = sys.modules.get("instructor.core.exceptions") or sys.modules.get("instructor.exceptions")
+    return exceptions is not None and isinstance(error, exceptions.InstructorRetryException)
+
+
+def record_llm_call(reader: str, model: str, seconds: float, error: Optional[BaseException] = None) -> None:
+    """Record the latency and outcome of one LLM call."""
+    if error is None:
+        outcome = "ok"
+    elif isinstance(error, (asyncio.CancelledError, GeneratorExit)):
+        outcome = "cancelled"
+    elif isinstance(error, ValidationError) or _is_instructor_retry(error):
+        outcome = "invalid"
+        LLM_VALIDATION_FAILURES.inc(reader, model)
+    else:
+        outcome = "error"
+    LLM_CALL_SECONDS.observe(seconds, reader, model, outcome)
+    record_timing("llm", seconds, f"{reader} {model} {outcome}")
+
+
+def record_usage(reader: str, model: str, completion: Any) -> None:
+    """Count the prompt and completion tokens reported in an OpenAI completion's `usage`."""
+    usage = getattr(completion, "usage", None)
+    if usage is None:
+        return
+    LLM_TOKENS.inc(reader, model, "in", amount=usage.prompt_tokens or 0)
+    LLM_TOKENS.inc(reader, model, "out", amount=usage.completion_tokens or 0)
+
+
+@contextmanager
+def track_llm_call(reader: str, model: str) -> Iterator[None]:
+    """Record latency, outcome and validation failures of the LLM call made inside the block."""
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        record_llm_call(reader, model, time.perf_counter() - started, e)
+        raise
+    record_llm_call(reader, model, time.perf_counter() - started)
@@ -1,3 +1,4 @@
+from .catalog import CardCatalog, CardPayload, CardRecord
 from .deck import TarotDeck
 
-__all__ = ["TarotDeck"]
+__all__ = ["TarotDeck", "CardCatalog", "CardPayload", "CardRecord"]
@@ -0,0 +1,169 @@
+"""
+Compiled single-file card bundle.
+
+The bundle packs every `static/json/<number>.json` file into one file that can be
+memory-mapped, so a cold start reads one file instead of globbing and parsing 78.
+
+Layout (little-endian):
+
+| Section | Format                                                                      |
+| ------- | --------------------------------------------------------------------------- |
+| header  | magic `TPCB`, format version `u16`, card count `u16`, source sha256 (32B)   |
+| source  | length `u16` and UTF-8 path of the card directory, relative to the bundle's |
+| index   | per card: number `u16`, name offset/length `u32`, info offset/length `u32`  |
+| data    | UTF-8 card names and compact JSON card info, referenced by the index        |
+
+The recorded card directory lets the app ignore a bundle compiled from another
+directory than the one it is configured to read.
+
+Build it with `make cards-bundle` (or `python3 api/modules/tarot_cards/bundle.py`).
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+BUNDLE_MAGIC = b"TPCB"
+BUNDLE_VERSION = 2
+DEFAULT_STATIC_DIR = Path(__file__).resolve().parents[3] / "static"
+
+_HEADER = struct.Struct("<4sHH32s")
+_SOURCE_LENGTH = struct.Struct("<H")
+_ENTRY = struct.Struct("<HIIII")
+
+
+class BundleEntry(NamedTuple):
+    number: int
+    name: str
+    info_offset: int
+    info_length: int
+
+
+def _card_files(card_dir: Path) -> List[Path]:
+    return sorted(card_dir.glob("*.json"), key=lambda p: int(p.stem))
+
+
+def source_digest(card_dir: Path) -> bytes:
+    """Hash the card JSON sources so a stale bundle can be detected at build time."""
+    digest = hashlib.sha256()
+    for file in _card_files(card_dir):
+        digest.update(file.name.encode("utf-8"))
+        digest.update(file.read_bytes())
+    return digest.digest()
+
+
+def source_label(card_dir: Path, bundle_path: Path) -> str:
+    """Name `card_dir` the way a bundle at `bundle_path` records it: relative to the bundle's directory."""
+    card_dir, base_dir = card_dir.resolve(), bundle_path.resolve().parent
+    return (card_dir.relative_to(base_dir) if card_dir.is_relative_to(base_dir) else card_dir).as_posix()
+
+
+def build_bundle(card_dir: Path, output: Path) -> int:
+    """Compile every card JSON file in `card_dir` into a single bundle at `output`."""
+    entries = []
+    for file in _card_files(card_dir):
+        with open(file, "r", encoding="utf-8") as f:
+            card_info: dict = json.load(f)
+
+        card_info.pop("img", None)
+        name = card_info["name"].encode("utf-8")
+        info = json.dumps(card_info, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        entries.append((int(file.stem), name, info))
+
+    source = source_label(card_dir, output).encode("utf-8")
+    source_header = _SOURCE_LENGTH.pack(len(source)) + source
+    data_start = _HEADER.size + len(source_header) + _ENTRY.size * len(entries)
+    index, data = bytearray(), bytearray()
+    for number, name, info in entries:
+        name_offset = data_start + len(data)
+        data += name
+        info_offset = data_start + len(data)
+        data += info
+        index += _ENTRY.pack(number, name_offset, len(name), info_offset, len(info))
+
+    header = _HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, len(entries), source_digest(card_dir))
+    tmp_output = output.with_suffix(output.suffix + ".tmp")
+    tmp_output.write_bytes(header + source_header + index + data)
+    tmp_output.replace(output)
+    return len(entries)
+
+
+class CardBundle:
+    """Read-only, memory-mapped view over a compiled card bundle."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, digest = _HEADER.unpack_from(self._mmap, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"Not a card bundle: {path}")
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported card bundle version {version} (expected {BUNDLE_VERSION}): {path}")
+
+        self.source_digest: bytes = digest
+        (source_length,) = _SOURCE_LENGTH.unpack_from(self._mmap, _HEADER.size)
+        source_start = _HEADER.size + _SOURCE_LENGTH.size
+        self.source_dir = self._mmap[source_start : source_start + source_length].decode("utf-8")
+        index_start = source_start + source_length
+        self.entries: List[BundleEntry] = []
+        for i in range(count):
+            number, name_offset, name_length, info_offset, info_length = _ENTRY.unpack_from(
+                self._mmap, index_start + i * _ENTRY.size
+            )
+            name = self._mmap[name_offset : name_offset + name_length].decode("utf-8")
+            self.entries.append(BundleEntry(number, name, info_offset, info_length))
+
+    def __iter__(self) -> Iterator[BundleEntry]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def built_from(self, card_dir: Path) -> bool:
+        """Whether the bundle was compiled from `card_dir`."""
+        return self.source_dir == source_label(card_dir, self.path)
+
+    def read_info(self, entry: BundleEntry) -> Dict[str, Any]:
+        """Parse the card info of a single entry."""
+        return json.loads(self._mmap[entry.info_offset : entry.info_offset + entry.info_length])
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["CardBundle"]:
+        """Open the bundle at `path`, or return `None` when it does not exist."""
+        if not path.is_file():
+            return None
+        return cls(path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compile tarot card JSON files into a single bundle.")
+    parser.add_argument("--card-dir", type=Path, default=DEFAULT_STATIC_DIR / "json")
+    parser.add_argument("--output", type=Path, default=DEFAULT_STATIC_DIR / "cards.bundle")
+    parser.add_argument("--check", action="store_true", help="Exit non-zero if the bundle is missing or stale.")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        bundle = CardBundle.open(args.output)
+        if (
+            bundle is None
+            or not bundle.built_from(args.card_dir)
+            or bundle.source_digest != source_digest(args.card_dir)
+        ):
+            print(f"Card bundle {args.output} is out of date, run `make cards-bundle`", file=sys.stderr)
+            return 1
+        return 0
+
+    count = build_bundle(args.card_dir, args.output)
+    print(f"Compiled {count} cards into {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
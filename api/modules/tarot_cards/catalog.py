@@ -0,0 +1,243 @@
+import hashlib
+import json
+import logging
+import random
+import threading
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple
+
+from api.models import CardInfoAPIResponse, TarotCard
+
+from .bundle import BundleEntry, CardBundle
+
+logger = logging.getLogger(__name__)
+
+# `NumerologyReader.calculate()["personal_numerology"]` is always reduced to a single digit.
+PRECOMPUTED_SEEDS = range(1, 10)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert JSON containers into read-only equivalents."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively convert frozen containers back into plain JSON containers."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+class _BundledInfo(Mapping[str, Any]):
+    """Card info that is parsed from the bundle on first access only."""
+
+    __slots__ = ("_bundle", "_entry", "_info")
+
+    def __init__(self, bundle: CardBundle, entry: BundleEntry) -> None:
+        self._bundle = bundle
+        self._entry = entry
+        self._info: Optional[Mapping[str, Any]] = None
+
+    def _load(self) -> Mapping[str, Any]:
+        if self._info is None:
+            self._info = _freeze(self._bundle.read_info(self._entry))
+        return self._info
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+@dataclass(frozen=True, slots=True)
+class CardRecord:
+    """Immutable metadata of a single tarot card."""
+
+    number: int
+    name: str
+    image_url: str
+    info: Mapping[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a mutable copy of the card info with `image_url` resolved."""
+        card_info = _thaw(self.info)
+        card_info["image_url"] = self.image_url
+        return card_info
+
+
+@dataclass(frozen=True, slots=True)
+class CardPayload:
+    """Pre-rendered JSON body of a card info response and its strong ETag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def render(cls, record: CardRecord) -> "CardPayload":
+        body = CardInfoAPIResponse(**record.to_dict()).model_dump_json().encode("utf-8")
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+class CardCatalog:
+    """Process-wide, read-only index of all tarot card metadata."""
+
+    _instance: Optional["CardCatalog"] = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self, card_dir: Path, images_subpath: str, records: Tuple[CardRecord, ...], source: Optional[Path] = None
+    ) -> None:
+        self.card_dir = card_dir
+        self.images_subpath = images_subpath
+        self.records = records
+        self.source = source or card_dir
+        self.by_number: Mapping[int, CardRecord] = MappingProxyType({r.number: r for r in records})
+        self.by_name: Mapping[str, CardRecord] = MappingProxyType({r.name: r for r in records})
+        self._payloads: Dict[int, CardPayload] = {}
+        self._card_fragments: Optional[Tuple[bytes, ...]] = None
+        self._seeded_codes: Dict[int, array] = {seed: self._shuffle_with_seed(seed) for seed in PRECOMPUTED_SEEDS}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def card_info_payload(self, card_number: int) -> Optional[CardPayload]:
+        """Return the pre-rendered card info response, rendering it on first request."""
+        payload = self._payloads.get(card_number)
+        if payload is None:
+            record = self.by_number.get(card_number)
+            if record is None:
+                return None
+            payload = self._payloads.setdefault(card_number, CardPayload.render(record))
+        return payload
+
+    # A drawn card is encoded as `position << 1 | is_upright`, where `position` indexes `records`.
+
+    def _shuffle_with_seed(self, seed: int) -> array:
+        rng = random.Random(seed)
+        deck = list(range(len(self.records)))
+        rng.shuffle(deck)
+        return array("H", [position << 1 | (rng.random() < 0.5) for position in deck])
+
+    def seeded_codes(self, seed: int) -> array:
+        """Return the encoded whole deck in the draw order of `seed`."""
+        codes = self._seeded_codes.get(seed)
+        if codes is None:
+            codes = self._shuffle_with_seed(seed)
+        return codes
+
+    def random_codes(self, count: int, rng: random.Random) -> array:
+        """Draw `count` encoded cards without replacement from `rng`."""
+        return array("H", [position << 1 | (rng.random() < 0.5) for position in rng.sample(range(len(self)), count)])
+
+    def draw_codes(self, count: int, seed: Optional[int] = None, rng: Optional[random.Random] = None) -> array:
+        """Draw `count` encoded cards in the order of `seed`, or at random from `rng` without one."""
+        if not 0 <= count <= len(self.records):
+            return array("H")
+        if seed is not None:
+            return self.seeded_codes(seed)[:count]
+        return self.random_codes(count, rng or random.Random())
+
+    def decode(self, code: int) -> Tuple[CardRecord, bool]:
+        """Return the card record and orientation of an encoded card."""
+        return self.records[code >> 1], bool(code & 1)
+
+    def render_hand(self, codes: Sequence[int]) -> bytes:
+        """Serialize encoded cards as a `CardsAPIResponse` JSON body from pre-rendered fragments."""
+        if self._card_fragments is None:
+            self._card_fragments = tuple(
+                TarotCard(name=record.name, image_url=record.image_url, is_upright=bool(is_upright))
+                .model_dump_json()
+                .encode("utf-8")
+                for record in self.records
+                for is_upright in (0, 1)
+            )
+        fragments = self._card_fragments
+        return b'{"cards":[' + b",".join([fragments[code] for code in codes]) + b"]}"
+
+    @classmethod
+    def from_directory(cls, card_dir: Path, images_subpath: str) -> "CardCatalog":
+        """Parse every `<number>.json` file in `card_dir`, ordered by card number."""
+        records = []
+        for file in sorted(card_dir.glob("*.json"), key=lambda p: int(p.stem)):
+            with open(file, "r", encoding="utf-8") as f:
+                card_info: dict = json.load(f)
+
+            card_info.pop("img", None)
+            records.append(
+                CardRecord(
+                    number=int(file.stem),
+                    name=card_info["name"],
+                    image_url=f"{images_subpath}/{file.stem}.jpg",
+                    info=_freeze(card_info),
+                )
+            )
+        return cls(card_dir=card_dir, images_subpath=images_subpath, records=tuple(records))
+
+    @classmethod
+    def from_bundle(cls, bundle: CardBundle, card_dir: Path, images_subpath: str) -> "CardCatalog":
+        """Index a compiled card bundle; card info is parsed lazily, one card at a time."""
+        records = tuple(
+            CardRecord(
+                number=entry.number,
+                name=entry.name,
+                image_url=f"{images_subpath}/{entry.number}.jpg",
+                info=_BundledInfo(bundle, entry),
+            )
+            for entry in bundle
+        )
+        return cls(card_dir=card_dir, images_subpath=images_subpath, records=records, source=bundle.path)
+
+    @classmethod
+    def load(cls, card_dir: Path, images_subpath: str, bundle_path: Optional[Path] = None) -> "CardCatalog":
+        """
+        Load from the compiled bundle when present, falling back to the loose JSON files.
+
+        A bundle compiled from another card directory than `card_dir` is ignored.
+        """
+        bundle = CardBundle.open(bundle_path) if bundle_path else None
+        if bundle is not None and bundle.built_from(card_dir):
+            return cls.from_bundle(bundle, card_dir, images_subpath)
+        if bundle is not None:
+            logger.warning(f"Ignoring card bundle {bundle_path}: built from {bundle.source_dir}, not {card_dir}")
+        return cls.from_directory(card_dir, images_subpath)
+
+    def _is_for(self, card_dir: Path, images_subpath: str, bundle_path: Optional[Path]) -> bool:
+        return (
+            self.card_dir == card_dir
+            and self.images_subpath == images_subpath
+            and self.source in (card_dir, bundle_path)
+        )
+
+    @classmethod
+    def get(cls, card_dir: Path, images_subpath: str, bundle_path: Optional[Path] = None) -> "CardCatalog":
+        """Return the shared catalog, (re)loading it when the source location changes."""
+        catalog = cls._instance
+        if catalog is not None and catalog._is_for(card_dir, images_subpath, bundle_path):
+            return catalog
+
+        with cls._lock:
+            catalog = cls._instance
+            if catalog is None or not catalog._is_for(card_dir, images_subpath, bundle_path):
+                catalog = cls.load(card_dir, images_subpath, bundle_path)
+                logger.info(f"Loaded {len(catalog)} tarot cards from {catalog.source}")
+                cls._instance = catalog
+        return catalog
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the shared catalog so the next access reloads it."""
+        with cls._lock:
+            cls._instance = None
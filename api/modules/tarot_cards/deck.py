@@ -1,79 +1,108 @@
-import json
 import random
+from array import array
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from api.models import TarotCard
 
+from .catalog import CardCatalog, CardPayload, CardRecord
+
 
 class TarotDeck:
     """Draw tarot cards."""
 
     base_dir: Path = Path(__file__).resolve().parents[3] / "static"
     cards_subdir: str = "json"
+    bundle_name: str = "cards.bundle"
     images_subpath: str = "/tarot-cards/images"
+    card_info_cache_control: str = "public, max-age=86400, stale-while-revalidate=604800"
 
     def __init__(self, seed: Optional[int] = None) -> None:
         self.random_seed = seed
-        self.cards: List[Dict[str, Any]] = self._load_cards()
+        self.catalog = self.load_catalog()
+        self.cards: Tuple[CardRecord, ...] = self.catalog.records
 
     @classmethod
     def configure(
-        cls, base_dir: Optional[Path] = None, cards_subdir: Optional[str] = None, images_subpath: Optional[str] = None
+        cls,
+        base_dir: Optional[Path] = None,
+        cards_subdir: Optional[str] = None,
+        bundle_name: Optional[str] = None,
+        images_subpath: Optional[str] = None,
+        card_info_cache_control: Optional[str] = None,
     ) -> None:
         """Change configuration at class level."""
         if base_dir:
             cls.base_dir = Path(base_dir)
         if cards_subdir:
             cls.cards_subdir = cards_subdir
+        if bundle_name:
+            cls.bundle_name = bundle_name
         if images_subpath:
             cls.images_subpath = images_subpath
+        if card_info_cache_control:
+            cls.card_info_cache_control = card_info_cache_control
 
     @classmethod
     def _card_dir(cls) -> Path:
         return cls.base_dir / cls.cards_subdir
 
-    def _load_cards(self) -> List[Dict[str, Any]]:
-        """Load all card JSON metadata."""
-        cards = []
-        for file in self._card_dir().glob("*.json"):
-            with open(file, "r", encoding="utf-8") as f:
-                card_info = json.load(f)
-                card_info["image_url"] = f"{self.images_subpath}/{file.stem}.jpg"
-                cards.append(card_info)
-        return cards
+    @classmethod
+    def _bundle_path(cls) -> Path:
+        return cls.base_dir / cls.bundle_name
+
+    @classmethod
+    def load_catalog(cls) -> CardCatalog:
+        """Return the shared card catalog for the current configuration."""
+        return CardCatalog.get(cls._card_dir(), cls.images_subpath, cls._bundle_path())
 
     def get_card_info(self, card_number: int) -> Dict[str, Any]:
-        """Load a specific card info file by number."""
-        file_path = self._card_dir() / f"{card_number}.json"
-        if not file_path.exists():
-            raise ValueError(f"Card file not found: {file_path}")
+        """Get a specific card info by number."""
+        record = self.catalog.by_number.get(card_number)
+        if record is None:
+            raise ValueError(f"Card file not found: {self._card_dir() / f'{card_number}.json'}")
+
+        return record.to_dict()
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            card_info: dict = json.load(f)
+    def get_card_info_payload(self, card_number: int) -> CardPayload:
+        """Get the pre-serialized card info response by number."""
+        payload = self.catalog.card_info_payload(card_number)
+        if payload is None:
+            raise ValueError(f"Card file not found: {self._card_dir() / f'{card_number}.json'}")
 
-        card_info["image_url"] = f"{self.images_subpath}/{card_number}.jpg"
+        return payload
 
-        card_info.pop("img", None)
-        return card_info
+    def _draw_codes(self, count: int) -> array:
+        return self.catalog.draw_codes(count, self.random_seed)
 
     def draw(self, count: int = 10) -> List[TarotCard]:
         """Draw N shuffled tarot cards."""
-        if count > len(self.cards):
-            return []
-
-        if self.random_seed is not None:
-            random.seed(self.random_seed)
-
-        deck = self.cards.copy()
-        random.shuffle(deck)
-
-        selected = deck[:count]
+        selected = [self.catalog.decode(code) for code in self._draw_codes(count)]
         return [
             TarotCard(
-                name=card["name"],
-                image_url=card["image_url"],
-                is_upright=(random.random() < 0.5),
+                name=card.name,
+                image_url=card.image_url,
+                is_upright=is_upright,
             )
-            for card in selected
+            for card, is_upright in selected
         ]
+
+    @classmethod
+    def draw_batch(cls, hands: Iterable[Tuple[Optional[int], int]]) -> Iterator[bytes]:
+        """
+        Draw many `(seed, count)` hands, yielding each as a serialized `CardsAPIResponse`.
+
+        The catalog is looked up once and every hand is drawn into one code array before rendering.
+        """
+        catalog = cls.load_catalog()
+        rng = random.Random()
+        codes = array("H")
+        ends = []
+        for seed, count in hands:
+            codes.extend(catalog.draw_codes(count, seed, rng))
+            ends.append(len(codes))
+
+        start = 0
+        for end in ends:
+            yield catalog.render_hand(codes[start:end])
+            start = end
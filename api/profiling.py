@@ -0,0 +1,78 @@
+import logging
+import sys
+import threading
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SamplingProfiler:
+    """
+    Periodically samples the stacks of all threads while a request runs.
+
+    The result is written in the collapsed stack format (`frame;frame;frame count` per line) that
+    flamegraph.pl, speedscope and similar tools read directly.
+
+    Every thread of the process is sampled, not just the profiled request's: async requests share the
+    event loop thread and sync ones run in the worker pool, so a profile also contains whatever other
+    requests ran at the same time. Profile on an otherwise idle instance to see one request alone.
+    """
+
+    def __init__(self, interval_seconds: float = 0.005) -> None:
+        self.interval_seconds = interval_seconds
+        self.samples: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _label(frame) -> str:
+        return f"{frame.f_globals.get('__name__', '?')}.{frame.f_code.co_qualname}:{frame.f_lineno}"
+
+    def _sample(self) -> None:
+        own_id = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(self._label(frame))
+                frame = frame.f_back
+            stack.append(names.get(thread_id, str(thread_id)))
+            self.samples[";".join(reversed(stack))] += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self._sample()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def save(self, directory: Path) -> str:
+        """Write the profile into `directory` and return its id."""
+        profile_id = uuid.uuid4().hex
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"{profile_id}.collapsed").write_text(self.collapsed())
+        return profile_id
+
+
+def load_profile(directory: Path, profile_id: str) -> Optional[str]:
+    """Return a stored profile, or None when the id is unknown."""
+    try:
+        profile_id = uuid.UUID(profile_id).hex
+    except ValueError:
+        return None
+    path = directory / f"{profile_id}.collapsed"
+    return path.read_text() if path.exists() else None
@@ -69,3 +69,92 @@ SYSTEM_PROMPT = """
     * Keep it clean, professional, and consistent
     * ALWAYS show the reduction steps (e.g., 142 --> 1+4+2 = 7 or 142 --> 1+4+2 = 7)
 """
+
+INSIGHT_SYSTEM_PROMPT = """
+# Role and Objective
+    Act as a numerology expert who prepares users for their tarot reading journey.
+    The numerological calculations are already done and shown to the user; write only a brief insight that sets the foundation for deeper tarot exploration.
+
+# Numerology Sections - Bilingual Reference
+    Use these exact terms based on the user's language:
+
+    **English:**
+    - Expression Number (from name): Represents core identity and life purpose
+    - Life Path Number (from birthdate): Reveals life journey and lessons
+    - Personal Year Number (current year): Shows present energies and opportunities
+    - Cosmic Signature (combined essence): Your unique cosmic signature
+
+    **Vietnamese:**
+    - Số Biểu Đạt (từ tên): Thể hiện bản sắc và mục đích sống
+    - Số Đường Đời (từ ngày sinh): Tiết lộ hành trình và bài học cuộc đời
+    - Số Năm Cá Nhân (năm hiện tại): Cho thấy năng lượng và cơ hội hiện tại
+    - Con Số Tín Hiệu (bản chất kết hợp): Số lần xáo bài đã được sử dụng
+
+# Instructions
+    * The user input contains the final numbers in `numbers`; use them as given, DO NOT recalculate or repeat the formulas
+    * The Cosmic Signature is used as the **shuffle seed** to randomize the tarot deck, creating a personalized card selection that resonates with the user's unique energy pattern
+    * Limit the insight to {max_analysis_length} characters maximum
+
+# Response Structure
+    You must respond with a JSON object containing exactly one field:
+
+    1. **insight** (string): A brief 2-3 sentence markdown text providing insight
+       - Explain what these numbers reveal about the user's current energy
+       - Connect the numbers to their question
+       - Explain WHY the Cosmic Signature is perfect for guiding their card selection
+       - Use bold (**text**) for key concepts
+
+# Critical Language Rule
+    * ABSOLUTE REQUIREMENT: Respond in the EXACT SAME LANGUAGE as the user's question and name
+    * If user writes in Vietnamese --> respond 100% in Vietnamese using Vietnamese section labels
+    * If user writes in English --> respond 100% in English using English section labels
+    * NO mixing languages. NO English words in non-English responses
+
+# Formatting Rules
+    * DO NOT use markdown headings (# ## ###)
+    * DO NOT use emojis, tables or lists
+    * Use bold (**text**) for emphasis
+"""
+
+# Locally rendered `calculations` section, in the same format the LLM was asked to produce.
+CALCULATIONS_TEMPLATES = {
+    "en": (
+        "- **Expression Number**: {expression} _({expression_meaning})_\n"
+        "- **Life Path Number**: {life_path} _({life_path_meaning})_\n"
+        "- **Personal Year Number**: {personal_year} _({personal_year_meaning})_\n"
+        "- **Cosmic Signature**: {cosmic_signature} _(this number shuffles your cards)_"
+    ),
+    "vi": (
+        "- **Số Biểu Đạt**: {expression} _({expression_meaning})_\n"
+        "- **Số Đường Đời**: {life_path} _({life_path_meaning})_\n"
+        "- **Số Năm Cá Nhân**: {personal_year} _({personal_year_meaning})_\n"
+        "- **Con Số Tín Hiệu**: {cosmic_signature} _(số này là số lần xáo bài đã được sử dụng)_"
+    ),
+}
+
+NUMBER_MEANINGS = {
+    "en": {
+        0: "pure potential",
+        1: "leadership and new beginnings",
+        2: "harmony and partnership",
+        3: "creativity and self-expression",
+        4: "stability and hard work",
+        5: "freedom and change",
+        6: "love and responsibility",
+        7: "reflection and inner wisdom",
+        8: "ambition and abundance",
+        9: "compassion and completion",
+    },
+    "vi": {
+        0: "tiềm năng thuần khiết",
+        1: "lãnh đạo và khởi đầu mới",
+        2: "hòa hợp và hợp tác",
+        3: "sáng tạo và thể hiện bản thân",
+        4: "ổn định và chăm chỉ",
+        5: "tự do và thay đổi",
+        6: "yêu thương và trách nhiệm",
+        7: "chiêm nghiệm và trí tuệ nội tâm",
+        8: "tham vọng và thịnh vượng",
+        9: "lòng trắc ẩn và sự hoàn thiện",
+    },
+}
@@ -0,0 +1,125 @@
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Coroutine, Iterator, List, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ServerTiming:
+    """Durations recorded while handling one request, rendered as a `Server-Timing` header."""
+
+    def __init__(self) -> None:
+        self.entries: List[Tuple[str, float, Optional[str]]] = []
+        self.handler_started: Optional[float] = None
+        self.endpoint_started: Optional[float] = None
+        self.endpoint_finished: Optional[float] = None
+        self.handler_finished: Optional[float] = None
+
+    def add(self, name: str, seconds: float, description: Optional[str] = None) -> None:
+        self.entries.append((name, seconds, description))
+
+    def header(self, total_seconds: float) -> str:
+        entries = []
+        if self.handler_started and self.endpoint_started:
+            entries.append(("validation", self.endpoint_started - self.handler_started, None))
+        entries.extend(self.entries)
+        if self.endpoint_finished and self.handler_finished:
+            entries.append(("serialization", self.handler_finished - self.endpoint_finished, None))
+        entries.append(("total", total_seconds, None))
+
+        metrics = []
+        for name, seconds, description in entries:
+            metric = f"{name};dur={seconds * 1000:.1f}"
+            if description:
+                metric += ';desc="' + description.replace("\\", "\\\\").replace('"', '\\"') + '"'
+            metrics.append(metric)
+        return ", ".join(metrics)
+
+
+_current: ContextVar[Optional[ServerTiming]] = ContextVar("server_timing", default=None)
+
+
+def start_timing() -> Tuple[ServerTiming, Token]:
+    """Start collecting timings for the current request."""
+    timing = ServerTiming()
+    return timing, _current.set(timing)
+
+
+def stop_timing(token: Token) -> None:
+    _current.reset(token)
+
+
+def record_timing(name: str, seconds: float, description: Optional[str] = None) -> None:
+    """Add a duration to the current request's `Server-Timing`, if one is being collected."""
+    timing = _current.get()
+    if timing is not None:
+        timing.add(name, seconds, description)
+
+
+@contextmanager
+def server_timing(name: str, description: Optional[str] = None) -> Iterator[None]:
+    """Record how long the block took in the current request's `Server-Timing`."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_timing(name, time.perf_counter() - started, description)
+
+
+def _mark(attribute: str) -> None:
+    timing = _current.get()
+    if timing is not None:
+        setattr(timing, attribute, time.perf_counter())
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    if inspect.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            _mark("endpoint_started")
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                _mark("endpoint_finished")
+
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        _mark("endpoint_started")
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            _mark("endpoint_finished")
+
+    return sync_wrapper
+
+
+class TimedRoute(APIRoute):
+    """
+    Route that marks when request validation ends and response serialization starts.
+
+    Everything between the handler starting and the endpoint being called is reported as `validation`
+    (body parsing, pydantic validation and dependencies); everything after the endpoint returns is
+    reported as `serialization`.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            _mark("handler_started")
+            try:
+                return await handler(request)
+            finally:
+                _mark("handler_finished")
+
+        return timed_handler
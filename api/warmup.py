@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import time
+import uuid
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from api.config import (
+    WARMUP_DB_CONNECTIONS,
+    WARMUP_ENABLED,
+    WARMUP_REQUIRED_STEPS,
+    WARMUP_RETRY_SECONDS,
+    WARMUP_TIMEOUT_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+
+async def warm_card_catalog() -> None:
+    """Load the card catalog and pre-render every card info response."""
+    from api.modules import TarotDeck
+
+    catalog = TarotDeck.load_catalog()
+    for number in catalog.by_number:
+        catalog.card_info_payload(number)
+
+
+async def warm_database(connections: int = WARMUP_DB_CONNECTIONS) -> None:
+    """Open `connections` pooled connections and prepare the `get_reading` select on each of them."""
+    from api.db.crud import build_reading_document_select
+    from api.db.database import get_async_engine
+
+    engine = get_async_engine()
+    probe = build_reading_document_select(uuid.UUID(int=0))
+    opened: List["AsyncConnection"] = []
+
+    async def open_connection() -> None:
+        conn = await engine.connect()
+        opened.append(conn)
+        await conn.execute(probe)
+
+    # Held open together, so the pool really ends up with that many distinct connections.
+    try:
+        results = await asyncio.gather(*(open_connection() for _ in range(max(connections, 1))), return_exceptions=True)
+    finally:
+        # Also runs when the step times out or is cancelled, so no connection stays checked out of the pool.
+        for conn in opened:
+            await conn.close()
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        raise errors[0]
+
+
+async def warm_llm_connection() -> None:
+    """Build the LLM client and open a keep-alive connection (TLS included) to the provider."""
+    import openai
+
+    from api import config
+
+    # Built on first access; touching it here moves the instructor import and patching off the first reading.
+    _ = config.OPENAI_CLIENT
+    try:
+        await config.OPENAI_BASE_CLIENT.with_options(max_retries=0).models.list()
+    except openai.APIStatusError as e:
+        # Any HTTP answer means the connection is up; not every compatible provider serves `/models`.
+        logger.info(f"LLM provider answered warmup with HTTP {e.status_code}")
+
+
+WARMUP_STEPS: Dict[str, Callable[[], Awaitable[None]]] = {
+    "card_catalog": warm_card_catalog,
+    "database": warm_database,
+    "llm_connection": warm_llm_connection,
+}
+
+
+class Warmup:
+    """
+    Runs the warmup steps in the background once the app starts and tracks readiness.
+
+    Steps run concurrently, each bounded by `timeout_seconds`. The worker is ready once every step in
+    `required` has succeeded; a failed required step is retried every `retry_seconds` until it does, so a
+    worker that cannot reach its database or LLM provider stays out of rotation. Other steps are
+    best-effort: their failures are reported but neither retried nor holding readiness back.
+    """
+
+    def __init__(
+        self,
+        steps: Dict[str, Callable[[], Awaitable[None]]],
+        enabled: bool = True,
+        timeout_seconds: float = 15.0,
+        required: Optional[Iterable[str]] = None,
+        retry_seconds: float = 5.0,
+    ) -> None:
+        self.steps = steps
+        self.enabled = enabled
+        self.timeout_seconds = timeout_seconds
+        self.required = set(steps if required is None else required) & set(steps)
+        self.retry_seconds = retry_seconds
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _failed_required(self) -> List[str]:
+        return [name for name in self.steps if name in self.required and not self.results.get(name, {}).get("ok")]
+
+    @property
+    def ready(self) -> bool:
+        return not self.enabled or (self.finished_at is not None and not self._failed_required())
+
+    async def _step(self, name: str, step: Callable[[], Awaitable[None]]) -> None:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(step(), self.timeout_seconds)
+            error = None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            logger.warning(f"Warmup step {name} failed: {error}")
+        attempts = self.results.get(name, {}).get("attempts", 0) + 1
+        self.results[name] = {
+            "ok": error is None,
+            "required": name in self.required,
+            "attempts": attempts,
+            "seconds": round(time.perf_counter() - started, 4),
+            "error": error,
+        }
+
+    async def run(self) -> None:
+        self.started_at = time.perf_counter()
+        pending = dict(self.steps)
+        while pending:
+            await asyncio.gather(*(self._step(name, step) for name, step in pending.items()))
+            if self.finished_at is None:
+                self.finished_at = time.perf_counter()
+                logger.info(f"Warmup finished in {self.finished_at - self.started_at:.2f}s")
+            pending = {name: self.steps[name] for name in self._failed_required()}
+            if pending:
+                logger.warning(f"Not ready, retrying warmup of {', '.join(pending)} in {self.retry_seconds}s")
+                await asyncio.sleep(self.retry_seconds)
+
+    def start(self) -> None:
+        """Start warming up in the background; a no-op when disabled or already started."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def status(self) -> Dict[str, Any]:
+        if not self.enabled:
+            state = "disabled"
+        elif self.finished_at is not None:
+            state = "retrying" if self._failed_required() else "ready"
+        else:
+            state = "warming" if self.started_at is not None else "pending"
+        return {
+            "ready": self.ready,
+            "state": state,
+            "seconds": round(self.finished_at - self.started_at, 4) if self.finished_at and self.started_at else None,
+            "steps": self.results,
+        }
+
+
+WARMUP = Warmup(
+    WARMUP_STEPS,
+    enabled=WARMUP_ENABLED,
+    timeout_seconds=WARMUP_TIMEOUT_SECONDS,
+    required=WARMUP_REQUIRED_STEPS,
+    retry_seconds=WARMUP_RETRY_SECONDS,
+)
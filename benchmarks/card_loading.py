@@ -0,0 +1,77 @@
+"""
+Cold-load benchmark: loose card JSON files vs the compiled card bundle.
+
+Every trial runs in a fresh interpreter so nothing is cached in-process, which is
+what a Vercel cold start sees. Run with:
+
+    uv run python3 benchmarks/card_loading.py --trials 30
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_BASE_DIR = Path(__file__).resolve().parents[1]
+STATIC_DIR = PROJECT_BASE_DIR / "static"
+
+_PRELUDE = f"""
+import importlib.util, json, time
+from pathlib import Path
+spec = importlib.util.spec_from_file_location("bundle", {str(PROJECT_BASE_DIR / "api/modules/tarot_cards/bundle.py")!r})
+bundle = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bundle)
+card_dir = Path({str(STATIC_DIR / "json")!r})
+bundle_path = Path({str(STATIC_DIR / "cards.bundle")!r})
+"""
+
+# Mirrors the original `TarotDeck._load_cards`, which every `TarotDeck()` used to run.
+_LEGACY_JSON = """
+start = time.perf_counter()
+cards = []
+for file in card_dir.glob("*.json"):
+    with open(file, "r", encoding="utf-8") as f:
+        card_info = json.load(f)
+        card_info["image_url"] = f"/tarot-cards/images/{file.stem}.jpg"
+        cards.append(card_info)
+card = next(c for c in cards if c["name"] == "The Fool")
+print(time.perf_counter() - start)
+"""
+
+_BUNDLE = """
+start = time.perf_counter()
+card_bundle = bundle.CardBundle.open(bundle_path)
+cards = [(e.number, e.name, f"/tarot-cards/images/{e.number}.jpg") for e in card_bundle]
+card = card_bundle.read_info(card_bundle.entries[0])
+print(time.perf_counter() - start)
+"""
+
+SCENARIOS = {
+    "legacy _load_cards (78 JSON files)": _LEGACY_JSON,
+    "compiled bundle (mmap + index)": _BUNDLE,
+}
+
+
+def run_trial(code: str) -> float:
+    output = subprocess.run([sys.executable, "-c", _PRELUDE + code], check=True, capture_output=True, text=True)
+    return float(output.stdout.strip())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--trials", type=int, default=20)
+    args = parser.parse_args()
+
+    if not (STATIC_DIR / "cards.bundle").is_file():
+        sys.exit("static/cards.bundle not found, run `make cards-bundle` first")
+
+    print(f"{'scenario':<40} {'min (ms)':>10} {'median (ms)':>12} {'p90 (ms)':>10}")
+    for label, code in SCENARIOS.items():
+        timings = sorted(run_trial(code) * 1000 for _ in range(args.trials))
+        p90 = timings[min(len(timings) - 1, int(len(timings) * 0.9))]
+        print(f"{label:<40} {timings[0]:>10.3f} {statistics.median(timings):>12.3f} {p90:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
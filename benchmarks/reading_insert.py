@@ -0,0 +1,153 @@
+"""
+Persistence benchmark: the original ORM `create_reading` vs the single-statement insert.
+
+Needs a reachable PostgreSQL in `DATABASE_URL` (the tables are created if missing and every
+reading written by the benchmark is deleted afterwards). Run with:
+
+    uv run python3 benchmarks/reading_insert.py --readings 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+from uuid import UUID
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import delete, event  # noqa: E402
+
+from api.db.crud import create_reading  # noqa: E402
+from api.db.database import Base, dispose_engine, get_async_engine, get_session_maker  # noqa: E402
+from api.db.models import CardInterpretation, NumerologyData, Reading, ReadingCard, ReadingSummary  # noqa: E402
+from api.models import TarotCard, TarotInterpretation  # noqa: E402
+
+CARDS = [
+    TarotCard(name="The Fool", is_upright=True, image_url="/tarot-cards/images/1.jpg"),
+    TarotCard(name="The Magician", is_upright=False, image_url="/tarot-cards/images/2.jpg"),
+    TarotCard(name="The High Priestess", is_upright=True, image_url="/tarot-cards/images/3.jpg"),
+]
+INTERPRETATIONS = [
+    TarotInterpretation(card_name=card.name, position=position, orientation="upright", meaning="Meaning " * 40)
+    for card, position in zip(CARDS, ("past", "present", "future"))
+]
+
+
+# Mirrors the original `create_reading`: flush for the generated key, then one ORM object per row.
+async def legacy_create_reading(db, user_name, user_dob, question, cards, interpretations, summary, numerology_meaning):
+    reading = Reading(user_name=user_name, user_birth_date=user_dob, question_text=question)
+    db.add(reading)
+    await db.flush()
+
+    position_map = {0: "past", 1: "present", 2: "future"}
+    for idx, card in enumerate(cards):
+        db.add(
+            ReadingCard(
+                reading_id=reading.reading_id,
+                card_position_text=position_map.get(idx, f"card_{idx}"),
+                card_name=card.name,
+                is_upright=card.is_upright,
+                card_image_url=card.image_url,
+                full_card_name=card.full_card_name,
+            )
+        )
+    for interp in interpretations:
+        db.add(
+            CardInterpretation(
+                reading_id=reading.reading_id,
+                card_name=interp.card_name,
+                card_position_text=interp.position,
+                card_orientation_text=interp.orientation,
+                meaning_text=interp.meaning,
+            )
+        )
+    db.add(ReadingSummary(reading_id=reading.reading_id, summary_text=summary))
+    if numerology_meaning:
+        db.add(NumerologyData(reading_id=reading.reading_id, meaning_text=numerology_meaning))
+
+    await db.commit()
+    return reading.reading_id
+
+
+SCENARIOS: Dict[str, Callable[..., Awaitable[UUID]]] = {
+    "legacy ORM (flush + per-row objects)": legacy_create_reading,
+    "single statement (CTE multi-row inserts)": create_reading,
+}
+
+
+class RoundTrips:
+    """Counts statements and transaction control sent to the server."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        engine = get_async_engine().sync_engine
+        event.listen(engine, "before_cursor_execute", self._statement)
+        event.listen(engine, "begin", self._transaction)
+        event.listen(engine, "commit", self._transaction)
+
+    def _statement(self, *args) -> None:
+        self.count += 1
+
+    def _transaction(self, *args) -> None:
+        self.count += 1
+
+
+async def run(create: Callable[..., Awaitable[UUID]], readings: int, round_trips: RoundTrips) -> List[UUID]:
+    latencies: List[float] = []
+    reading_ids: List[UUID] = []
+    round_trips.count = 0
+    for index in range(readings):
+        async with get_session_maker()() as db:
+            start = time.perf_counter()
+            reading_id = await create(
+                db,
+                f"Benchmark {index}",
+                date(2000, 1, 1),
+                "Benchmark question?",
+                CARDS,
+                INTERPRETATIONS,
+                "Summary " * 40,
+                "Numerology " * 40,
+            )
+            latencies.append(time.perf_counter() - start)
+            reading_ids.append(reading_id)
+
+    latencies.sort()
+    print(
+        f"  round trips/reading {round_trips.count / readings:5.1f}"
+        f"  mean {statistics.mean(latencies) * 1000:7.2f} ms"
+        f"  p50 {latencies[len(latencies) // 2] * 1000:7.2f} ms"
+        f"  p95 {latencies[int(len(latencies) * 0.95)] * 1000:7.2f} ms"
+    )
+    return reading_ids
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--readings", type=int, default=200)
+    args = parser.parse_args()
+
+    async with get_async_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    round_trips = RoundTrips()
+    written: List[UUID] = []
+    try:
+        for label, create in SCENARIOS.items():
+            # Warm up connections and prepared statements before measuring.
+            written += await run(create, 5, round_trips)
+            print(label)
+            written += await run(create, args.readings, round_trips)
+    finally:
+        async with get_session_maker()() as db:
+            await db.execute(delete(Reading).where(Reading.reading_id.in_(written)))
+            await db.commit()
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
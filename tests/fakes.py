@@ -0,0 +1,30 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Iterable, List, Optional
+
+
+class FakeCompletions:
+    """Stands in for `client.chat.completions`: answers after `delay` seconds, fails or hangs per model."""
+
+    def __init__(self, delay: float = 0.0, fail_models: Iterable[str] = (), hang_models: Iterable[str] = ()) -> None:
+        self.delay = delay
+        self.fail_models = set(fail_models)
+        self.hang_models = set(hang_models)
+        self.calls: List[str] = []
+        self.timeouts: List[Optional[float]] = []
+
+    async def create_with_completion(self, model: str, messages: Any, response_model: Any, **kwargs: Any) -> Any:
+        self.calls.append(model)
+        self.timeouts.append(kwargs.get("timeout"))
+        if model in self.hang_models:
+            await asyncio.sleep(3600)
+        await asyncio.sleep(self.delay)
+        if model in self.fail_models:
+            raise RuntimeError(f"{model} failed")
+        fields = {name: f"{name} from {model}" for name in response_model.model_fields}
+        usage = SimpleNamespace(prompt_tokens=1, completion_tokens=1)
+        return response_model(**fields), SimpleNamespace(usage=usage)
+
+
+def fake_client(**kwargs: Any) -> SimpleNamespace:
+    return SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions(**kwargs)))
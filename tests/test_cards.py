@@ -0,0 +1,109 @@
+import contextlib
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from api.modules import TarotDeck
+from api.modules.tarot_cards.bundle import DEFAULT_STATIC_DIR, CardBundle, build_bundle, main, source_digest
+from api.modules.tarot_cards.catalog import CardCatalog
+
+
+class CardCatalogTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.catalog = CardCatalog.from_directory(DEFAULT_STATIC_DIR / "json", "/images")
+
+    def test_indexes_every_card_by_number_and_name(self) -> None:
+        self.assertEqual(len(self.catalog), 78)
+        self.assertEqual([record.number for record in self.catalog.records], list(range(1, 79)))
+        record = self.catalog.by_number[1]
+        self.assertIs(self.catalog.by_name[record.name], record)
+        self.assertEqual(record.image_url, "/images/1.jpg")
+
+    def test_card_info_is_read_only_and_copied_out(self) -> None:
+        record = self.catalog.by_number[1]
+        with self.assertRaises(TypeError):
+            record.info["name"] = "changed"  # type: ignore[index]
+
+        card_info = record.to_dict()
+        card_info["name"] = "changed"
+        self.assertNotEqual(record.info["name"], "changed")
+        self.assertNotIn("img", card_info)
+
+    def test_payload_is_rendered_once_with_a_stable_etag(self) -> None:
+        payload = self.catalog.card_info_payload(1)
+
+        self.assertIs(self.catalog.card_info_payload(1), payload)
+        self.assertEqual(json.loads(payload.body)["name"], self.catalog.by_number[1].name)
+        self.assertIsNone(self.catalog.card_info_payload(79))
+
+    def test_encoded_cards_decode_to_record_and_orientation(self) -> None:
+        self.assertEqual(self.catalog.decode(0), (self.catalog.records[0], False))
+        self.assertEqual(self.catalog.decode(5), (self.catalog.records[2], True))
+
+
+class CardBundleTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.base_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.base_dir)
+        self.card_dir = self.base_dir / "json"
+        shutil.copytree(DEFAULT_STATIC_DIR / "json", self.card_dir)
+        self.bundle_path = self.base_dir / "cards.bundle"
+        build_bundle(self.card_dir, self.bundle_path)
+
+    def test_bundle_is_used_for_the_directory_it_was_built_from(self) -> None:
+        catalog = CardCatalog.load(self.card_dir, "/images", self.bundle_path)
+
+        self.assertEqual(catalog.source, self.bundle_path)
+        self.assertEqual(len(catalog), 78)
+
+    def test_bundle_matches_the_json_files(self) -> None:
+        bundled = CardCatalog.from_bundle(CardBundle(self.bundle_path), self.card_dir, "/images")
+        loose = CardCatalog.from_directory(self.card_dir, "/images")
+
+        self.assertEqual([record.to_dict() for record in bundled.records], [r.to_dict() for r in loose.records])
+        self.assertEqual(CardBundle(self.bundle_path).source_digest, source_digest(self.card_dir))
+
+    def test_check_detects_a_stale_bundle(self) -> None:
+        args = ["--card-dir", str(self.card_dir), "--output", str(self.bundle_path), "--check"]
+        self.assertEqual(main(args), 0)
+
+        (self.card_dir / "1.json").write_text('{"name": "Changed"}', encoding="utf-8")
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main(args), 1)
+
+    def test_bundle_of_another_directory_is_ignored(self) -> None:
+        other_dir = self.base_dir / "other"
+        shutil.copytree(self.card_dir, other_dir)
+        card = json.loads((other_dir / "1.json").read_text(encoding="utf-8"))
+        card["name"] = "The Other Fool"
+        (other_dir / "1.json").write_text(json.dumps(card), encoding="utf-8")
+
+        catalog = CardCatalog.load(other_dir, "/images", self.bundle_path)
+
+        self.assertEqual(catalog.source, other_dir)
+        self.assertEqual(catalog.by_number[1].name, "The Other Fool")
+
+
+class DrawBatchTest(unittest.TestCase):
+    def test_batch_matches_individual_seeded_draws(self) -> None:
+        hands = [(1, 3), (7, 10), (1, 3), (9, 78), (4, 0), (2, 79)]
+
+        batch = [json.loads(hand) for hand in TarotDeck.draw_batch(hands)]
+
+        expected = [
+            {"cards": [card.model_dump(mode="json") for card in TarotDeck(seed=seed).draw(count)]}
+            for seed, count in hands
+        ]
+        self.assertEqual(batch, expected)
+
+    def test_unseeded_hands_have_distinct_cards(self) -> None:
+        for hand in TarotDeck.draw_batch([(None, 10)] * 5):
+            names = [card["name"] for card in json.loads(hand)["cards"]]
+            self.assertEqual(len(set(names)), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
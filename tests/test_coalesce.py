@@ -0,0 +1,48 @@
+import asyncio
+import unittest
+
+from api.modules.predict.coalesce import SingleFlight
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_waiters_share_one_call(self) -> None:
+        flight = SingleFlight("test")
+        calls = []
+
+        async def call() -> int:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        self.assertEqual(await asyncio.gather(*(flight.do("key", call) for _ in range(3))), [1, 1, 1])
+        self.assertEqual(flight.stats()["calls_saved"], 2)
+
+    async def test_caller_after_last_waiter_left_starts_a_new_call(self) -> None:
+        flight = SingleFlight("test")
+        started = asyncio.Event()
+
+        async def slow() -> str:
+            started.set()
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                # Cleanup that yields keeps the cancelled task alive for a few more loop iterations.
+                await asyncio.sleep(0.01)
+                raise
+            return "slow"
+
+        async def fast() -> str:
+            return "fresh"
+
+        waiter = asyncio.create_task(flight.do("key", slow))
+        await started.wait()
+        waiter.cancel()
+        await asyncio.sleep(0)
+
+        self.assertEqual(await flight.do("key", fast), "fresh")
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+
+if __name__ == "__main__":
+    unittest.main()
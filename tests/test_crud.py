@@ -0,0 +1,54 @@
+import unittest
+import uuid
+from datetime import date, datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from api.db.crud import build_reading_insert, decode_reading_cursor, encode_reading_cursor
+from api.models.tarot import TarotCard, TarotInterpretation
+
+
+class ReadingCursorTest(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        position = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc), uuid.uuid4()
+
+        cursor = encode_reading_cursor(*position)
+
+        self.assertNotIn("=", cursor)
+        self.assertEqual(decode_reading_cursor(cursor), position)
+
+    def test_malformed_cursors_are_rejected(self) -> None:
+        naive = encode_reading_cursor(datetime(2024, 5, 1), uuid.uuid4())
+        for cursor in ("", "not a cursor", "////", naive, encode_reading_cursor(datetime.now(timezone.utc), "x")):
+            with self.subTest(cursor=cursor), self.assertRaises(ValueError):
+                decode_reading_cursor(cursor)
+
+
+class ReadingInsertTest(unittest.TestCase):
+    def test_reading_is_written_by_one_statement(self) -> None:
+        cards = [TarotCard(name=name, is_upright=upright) for name, upright in (("The Fool", True), ("Death", False))]
+        interpretations = [
+            TarotInterpretation(card_name="The Fool", position="past", orientation="upright", meaning="A start"),
+            TarotInterpretation(card_name="Death", position="present", orientation="reversed", meaning="An end"),
+        ]
+
+        statement = build_reading_insert(
+            uuid.uuid4(), "Jane", date(2000, 1, 1), "Why?", cards, interpretations, "Summary", "Meaning"
+        )
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        self.assertTrue(sql.startswith("WITH insert_0 AS \n(INSERT INTO readings"))
+        for table in ("readings", "reading_cards", "card_interpretations", "reading_summaries", "numerology_entries"):
+            with self.subTest(table=table):
+                self.assertEqual(sql.count(f"INSERT INTO {table} "), 1)
+
+    def test_optional_rows_are_left_out(self) -> None:
+        statement = build_reading_insert(uuid.uuid4(), "Jane", date(2000, 1, 1), "Why?", [], [], "Summary")
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        self.assertNotIn("INSERT INTO reading_cards ", sql)
+        self.assertNotIn("INSERT INTO numerology_entries ", sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
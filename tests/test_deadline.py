@@ -0,0 +1,60 @@
+import asyncio
+import unittest
+
+from fastapi import HTTPException
+
+from api.deadline import start_deadline, stop_deadline
+from api.modules.predict import HedgingPolicy, ModelHealth
+from api.modules.predict.coalesce import SingleFlight
+from api.modules.predict.fallback import LatencyTracker
+from api.modules.predict.tarot import TarotReader
+
+from .fakes import fake_client
+
+
+class CoalescedDeadlineTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.client = fake_client(delay=0.3)
+
+        class Reader(TarotReader):
+            pass
+
+        Reader.configure(client=self.client, hedging=HedgingPolicy(min_attempt_seconds=0.1), health=ModelHealth())
+        Reader.cache = None
+        Reader.latency = LatencyTracker()
+        Reader.single_flight = SingleFlight("test")
+        self.reader = Reader
+
+    async def interpret(self, configured: float, requested: float | None = None):
+        _, token = start_deadline(configured, requested)
+        try:
+            return await self.reader.interpret_cards("A", "q?", "The Fool", "The Fool", "The Fool")
+        finally:
+            stop_deadline(token)
+
+    async def test_short_client_timeout_does_not_fail_coalesced_requests(self) -> None:
+        leader = asyncio.create_task(self.interpret(0, requested=0.1))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(self.interpret(0))
+
+        with self.assertRaises(HTTPException) as raised:
+            await leader
+        self.assertEqual(raised.exception.status_code, 504)
+        self.assertEqual(raised.exception.detail["error"], "deadline_exceeded")
+
+        response = await follower
+        self.assertTrue(response.past.startswith("past from"))
+        self.assertEqual(len(self.client.chat.completions.calls), 1)
+
+    async def test_client_timeout_bounds_the_call_without_a_configured_deadline(self) -> None:
+        with self.assertRaises(HTTPException) as raised:
+            await self.interpret(0, requested=0.2)
+
+        self.assertEqual(raised.exception.status_code, 504)
+        [timeout] = self.client.chat.completions.timeouts
+        self.assertIsNotNone(timeout)
+        self.assertLessEqual(timeout, 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
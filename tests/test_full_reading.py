@@ -0,0 +1,52 @@
+import unittest
+import uuid
+from contextlib import asynccontextmanager
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from api import index
+from api.modules import NumerologyReader, TarotReader
+
+from .fakes import fake_client
+
+BODY = {"name": "John Doe", "dob": "2000-01-01", "question": "Will it last?", "bypass_cache": True}
+
+
+class FullReadingDatabaseTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patches = [mock.patch.object(reader, "client", fake_client()) for reader in (TarotReader, NumerologyReader)]
+        patches.append(mock.patch.object(index, "_db"))
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.db = index._db.return_value
+        self.client = TestClient(index.app)
+
+    def test_read_only_reading_does_not_touch_the_database(self) -> None:
+        response = self.client.post("/predict/full-reading", json=BODY)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()["reading_id"])
+        index._db.assert_not_called()
+
+    def test_saved_reading_opens_one_session(self) -> None:
+        reading_id = uuid.uuid4()
+        session = object()
+
+        @asynccontextmanager
+        async def get_db_context():
+            yield session
+
+        self.db.get_db_context = get_db_context
+        self.db.create_reading = mock.AsyncMock(return_value=reading_id)
+
+        response = self.client.post("/predict/full-reading", json={**BODY, "save": True})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["reading_id"], str(reading_id))
+        self.assertIs(self.db.create_reading.call_args.kwargs["db"], session)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import asyncio
+import unittest
+from typing import List
+
+from api.deadline import Deadline
+from api.modules.predict import CircuitBreakerPolicy, HedgingPolicy, ModelHealth
+from api.modules.predict.fallback import DeadlineExceededError, LatencyTracker, run_with_fallback
+
+
+def open_circuits(health: ModelHealth, *models: str) -> None:
+    for model in models:
+        for _ in range(health.policy.consecutive_failures):
+            health.record_failure(model, 0.1, RuntimeError("down"))
+
+
+class HalfOpenProbeTest(unittest.IsolatedAsyncioTestCase):
+    def test_one_probe_per_cooled_down_circuit(self) -> None:
+        health = ModelHealth(CircuitBreakerPolicy(open_seconds=0))
+        open_circuits(health, "a")
+
+        self.assertEqual([health.try_acquire("a") for _ in range(5)], [True, False, False, False, False])
+        health.on_cancel("a")
+        self.assertTrue(health.try_acquire("a"))
+
+    def test_full_outage_gets_a_single_probe(self) -> None:
+        health = ModelHealth(CircuitBreakerPolicy(open_seconds=60))
+        open_circuits(health, "a", "b")
+
+        self.assertEqual(health.order(["a", "b"]), ["a", "b"])
+        self.assertEqual([health.try_acquire(model) for model in ("a", "b", "a", "b")], [True, False, False, False])
+
+    async def test_concurrent_requests_probe_an_open_circuit_once(self) -> None:
+        health = ModelHealth(CircuitBreakerPolicy(open_seconds=0))
+        open_circuits(health, "a")
+        calls: List[str] = []
+
+        async def attempt(model: str) -> str:
+            calls.append(model)
+            await asyncio.sleep(0.05)
+            if model == "a":
+                raise RuntimeError("still down")
+            return model
+
+        results = await asyncio.gather(
+            *(run_with_fallback(["a", "b"], attempt, HedgingPolicy(), LatencyTracker(), health) for _ in range(5))
+        )
+
+        self.assertEqual(results, ["b"] * 5)
+        self.assertEqual(calls.count("a"), 1)
+        self.assertEqual(health.snapshot()["a"]["state"], "open")
+
+
+class SlowModelTest(unittest.IsolatedAsyncioTestCase):
+    async def test_model_hanging_until_the_deadline_opens_its_circuit(self) -> None:
+        health = ModelHealth(CircuitBreakerPolicy(consecutive_failures=3))
+        policy = HedgingPolicy(enabled=False, min_attempt_seconds=0.01)
+
+        async def attempt(model: str) -> str:
+            await asyncio.sleep(3600)
+            return model
+
+        for _ in range(3):
+            with self.assertRaises(DeadlineExceededError):
+                await run_with_fallback(["a"], attempt, policy, LatencyTracker(), health, deadline=Deadline(0.05))
+
+        self.assertEqual(health.snapshot()["a"]["state"], "open")
+
+    async def test_slow_model_losing_a_hedge_race_counts_as_failed(self) -> None:
+        health = ModelHealth(CircuitBreakerPolicy(consecutive_failures=3))
+        policy = HedgingPolicy(default_delay_seconds=0.05, min_delay_seconds=0.01)
+
+        async def attempt(model: str) -> str:
+            await asyncio.sleep(3600 if model == "a" else 0.01)
+            return model
+
+        for _ in range(3):
+            self.assertEqual(await run_with_fallback(["a", "b"], attempt, policy, LatencyTracker(), health), "b")
+
+        self.assertEqual(health.snapshot()["a"]["state"], "open")
+        self.assertEqual(health.snapshot()["b"]["state"], "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
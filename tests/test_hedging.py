@@ -0,0 +1,46 @@
+import asyncio
+import unittest
+from typing import List
+
+from api.modules.predict import HedgingPolicy, ModelHealth
+from api.modules.predict.fallback import LatencyTracker, run_with_fallback
+
+
+class HedgingTest(unittest.IsolatedAsyncioTestCase):
+    async def test_slow_model_is_raced_and_cancelled_when_the_next_one_wins(self) -> None:
+        started: List[str] = []
+        cancelled: List[str] = []
+
+        async def attempt(model: str) -> str:
+            started.append(model)
+            try:
+                await asyncio.sleep(3600 if model == "slow" else 0.01)
+            except asyncio.CancelledError:
+                cancelled.append(model)
+                raise
+            return model
+
+        policy = HedgingPolicy(default_delay_seconds=0.05, min_delay_seconds=0.01)
+        result = await run_with_fallback(["slow", "fast"], attempt, policy, LatencyTracker(), ModelHealth())
+
+        self.assertEqual(result, "fast")
+        self.assertEqual(started, ["slow", "fast"])
+        self.assertEqual(cancelled, ["slow"])
+
+    async def test_no_hedge_when_the_first_model_answers_in_time(self) -> None:
+        started: List[str] = []
+
+        async def attempt(model: str) -> str:
+            started.append(model)
+            await asyncio.sleep(0.01)
+            return model
+
+        policy = HedgingPolicy(default_delay_seconds=0.5)
+        result = await run_with_fallback(["a", "b"], attempt, policy, LatencyTracker(), ModelHealth())
+
+        self.assertEqual(result, "a")
+        self.assertEqual(started, ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import csv
+import io
+import unittest
+from typing import AsyncIterator, List
+
+from api.modules import NumerologyReader
+from api.modules.predict.bulk import format_csv, read_csv_records
+
+RECORDS = [
+    ("John Doe", "2000-01-01"),
+    ("Nguyễn Văn Anh", "1995-06-15"),
+    ("O'Brien-Smith", "1987-12-31"),
+    ("", "1970-01-01"),
+    ("Jane", "2000-02-30"),
+    ("Jane", "01/02/2000"),
+]
+
+NUMBERS = ("name_numerology", "dob_numerology", "personal_numerology", "current_year_numerology")
+
+
+async def chunked(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+class BulkNumerologyTest(unittest.TestCase):
+    def test_bulk_matches_single_calculation(self) -> None:
+        results = list(NumerologyReader.calculate_bulk(RECORDS, chunk_size=2))
+
+        self.assertEqual([(result["name"], result["dob"]) for result in results], RECORDS)
+        for result in results[:4]:
+            expected = NumerologyReader.calculate(result["name"], result["dob"])
+            self.assertEqual({key: result[key] for key in NUMBERS}, {key: expected[key] for key in NUMBERS})
+
+    def test_invalid_dates_yield_an_error(self) -> None:
+        results = list(NumerologyReader.calculate_bulk(RECORDS))
+
+        for result in results[4:]:
+            self.assertIn("error", result)
+            self.assertNotIn("name_numerology", result)
+
+    def test_explanations_match_single_calculation(self) -> None:
+        [result] = NumerologyReader.calculate_bulk(RECORDS[:1], explain=True)
+
+        self.assertEqual(result["explanation"], NumerologyReader.calculate(*RECORDS[0])["_explanation"])
+
+
+class CsvTest(unittest.TestCase):
+    def read(self, data: bytes, size: int) -> List[tuple]:
+        async def collect() -> List[tuple]:
+            return [record async for batch in read_csv_records(chunked(data, size)) for record in batch]
+
+        return asyncio.run(collect())
+
+    def test_streamed_csv_is_parsed_across_chunk_boundaries(self) -> None:
+        data = '﻿dob,name\n2000-01-01,John Doe\n1995-06-15,"Nguyễn, Văn Anh"\n1987-12-31,Jane'.encode()
+
+        for size in (1, 7, len(data)):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    self.read(data, size),
+                    [("John Doe", "2000-01-01"), ("Nguyễn, Văn Anh", "1995-06-15"), ("Jane", "1987-12-31")],
+                )
+
+    def test_csv_without_required_columns_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.read(b"name,birthday\nJohn,2000-01-01\n", 16)
+        with self.assertRaises(ValueError):
+            self.read(b"", 16)
+
+    def test_format_csv_round_trips_results(self) -> None:
+        results = list(NumerologyReader.calculate_bulk(RECORDS[:2] + RECORDS[-1:]))
+
+        rows = list(csv.DictReader(io.StringIO(format_csv(results))))
+
+        self.assertEqual([row["name"] for row in rows], ["John Doe", "Nguyễn Văn Anh", "Jane"])
+        self.assertEqual(rows[0]["personal_numerology"], str(results[0]["personal_numerology"]))
+        self.assertTrue(rows[2]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from unittest import mock
+
+from fastapi.testclient import TestClient
+
+from api import index
+
+OPS_PATHS = ["/metrics", "/ops/models", "/ops/admission", "/ops/single-flight", "/ops/response-cache"]
+
+
+class AdminTokenTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patch = mock.patch.object(index, "ADMIN_TOKEN", "secret")
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.client = TestClient(index.app)
+
+    def test_ops_endpoints_require_the_admin_token(self) -> None:
+        for path in OPS_PATHS:
+            with self.subTest(path=path):
+                self.assertEqual(self.client.get(path).status_code, 403)
+                self.assertEqual(self.client.get(path, headers={"X-Admin-Token": "wrong"}).status_code, 403)
+                self.assertEqual(self.client.get(path, headers={"X-Admin-Token": "secret"}).status_code, 200)
+
+    def test_ops_endpoints_are_closed_without_a_configured_token(self) -> None:
+        with mock.patch.object(index, "ADMIN_TOKEN", None):
+            self.assertEqual(self.client.get("/ops/models", headers={"X-Admin-Token": ""}).status_code, 403)
+
+    def test_readiness_probe_stays_open(self) -> None:
+        self.assertIn(self.client.get("/healthz/ready").status_code, (200, 503))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from api.warmup import Warmup, warm_database
+
+
+class WarmupReadinessTest(unittest.IsolatedAsyncioTestCase):
+    async def test_not_ready_until_required_steps_succeed(self) -> None:
+        attempts = 0
+        retrying = asyncio.Event()
+        recovered = asyncio.Event()
+
+        async def database() -> None:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 2:
+                retrying.set()
+                await recovered.wait()
+            if attempts < 3:
+                raise ConnectionRefusedError("database down")
+
+        async def optional() -> None:
+            raise RuntimeError("best effort")
+
+        warmup = Warmup({"database": database, "optional": optional}, required=["database"], retry_seconds=0)
+        warmup.start()
+        await asyncio.wait_for(retrying.wait(), 1)
+        self.assertFalse(warmup.ready)
+        self.assertEqual(warmup.status()["state"], "retrying")
+
+        recovered.set()
+        await asyncio.wait_for(warmup._task, 1)
+        status = warmup.status()
+        self.assertTrue(warmup.ready)
+        self.assertEqual(status["steps"]["database"]["attempts"], 3)
+        self.assertEqual(status["steps"]["optional"]["attempts"], 1)
+        self.assertFalse(status["steps"]["optional"]["ok"])
+
+
+class FakeConnection:
+    def __init__(self, hang: bool) -> None:
+        self.hang = hang
+        self.closed = False
+
+    async def execute(self, statement: object) -> None:
+        if self.hang:
+            await asyncio.sleep(3600)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class WarmDatabaseTest(unittest.IsolatedAsyncioTestCase):
+    async def test_timeout_returns_opened_connections_to_the_pool(self) -> None:
+        connections = []
+
+        async def connect() -> FakeConnection:
+            connections.append(FakeConnection(hang=len(connections) > 0))
+            return connections[-1]
+
+        engine = mock.Mock(connect=connect)
+        with (
+            mock.patch("api.db.database.get_async_engine", return_value=engine),
+            mock.patch("api.db.crud.build_reading_document_select"),
+        ):
+            with self.assertRaises(TimeoutError):
+                await asyncio.wait_for(warm_database(3), 0.05)
+
+        self.assertEqual(len(connections), 3)
+        self.assertTrue(all(conn.closed for conn in connections))
+
+
+if __name__ == "__main__":
+    unittest.main()